@@ -1,9 +1,19 @@
+from application.analysis.answer_evaluation import AnswerEvaluation
 from application.analysis.answer_evaluator import AnswerEvaluator
+from application.analysis.answer_features import AnswerFeatures
 from application.analysis.answer_metrics import AnswerMetrics
+from application.analysis.gibberish_detector import GibberishDetector
+from application.analysis.interview_statistics import InterviewStatistics
+from application.analysis.keyword_matcher import KeywordMatcher
 from application.analysis.scoring import ScoringCalculator
 
 __all__ = [
+    "AnswerEvaluation",
     "AnswerEvaluator",
+    "AnswerFeatures",
     "AnswerMetrics",
+    "GibberishDetector",
+    "InterviewStatistics",
+    "KeywordMatcher",
     "ScoringCalculator",
 ]
\ No newline at end of file
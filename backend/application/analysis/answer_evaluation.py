@@ -0,0 +1,23 @@
+class AnswerEvaluation:
+    
+    __slots__ = (
+        "word_count",
+        "clarity_score",
+        "confidence_score",
+        "is_gibberish",
+        "is_manipulation",
+    )
+    
+    def __init__(
+        self,
+        word_count: int,
+        clarity_score: float,
+        confidence_score: float,
+        is_gibberish: bool,
+        is_manipulation: bool,
+    ):
+        self.word_count = word_count
+        self.clarity_score = clarity_score
+        self.confidence_score = confidence_score
+        self.is_gibberish = is_gibberish
+        self.is_manipulation = is_manipulation
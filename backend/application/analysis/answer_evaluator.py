@@ -1,5 +1,8 @@
 from typing import List
+from domain.entities import Answer
 from application.services.llm_data import AnswerData
+from application.analysis.answer_evaluation import AnswerEvaluation
+from application.analysis.answer_features import AnswerFeatures
 from application.analysis.answer_metrics import AnswerMetrics
 from application.analysis.scoring_constants import ScoringConstants
 
@@ -8,15 +11,16 @@ class AnswerEvaluator:
     
     @staticmethod
     def calculate_clarity_score(text: str) -> float:
-        if AnswerMetrics.detect_manipulation_attempts(text):
-            return ScoringConstants.ZERO_SCORE
-        
-        if AnswerMetrics.detect_gibberish(text):
+        return AnswerEvaluator.clarity_from_features(AnswerMetrics.extract_features(text))
+    
+    @staticmethod
+    def clarity_from_features(features: AnswerFeatures) -> float:
+        if features.is_rejected:
             return ScoringConstants.ZERO_SCORE
         
-        word_count = AnswerMetrics.calculate_word_count(text)
-        sentence_count = AnswerMetrics.calculate_sentence_count(text)
-        has_structure = AnswerMetrics.has_structure_indicators(text)
+        word_count = features.word_count
+        sentence_count = features.sentence_count
+        has_structure = features.has_structure
         thresholds = ScoringConstants.WordCountThresholds
         clarity = ScoringConstants.ClarityScores
         
@@ -45,17 +49,18 @@ class AnswerEvaluator:
     
     @staticmethod
     def calculate_confidence_score(text: str) -> float:
-        if AnswerMetrics.detect_manipulation_attempts(text):
-            return ScoringConstants.ZERO_SCORE
-        
-        if AnswerMetrics.detect_gibberish(text):
+        return AnswerEvaluator.confidence_from_features(AnswerMetrics.extract_features(text))
+    
+    @staticmethod
+    def confidence_from_features(features: AnswerFeatures) -> float:
+        if features.is_rejected:
             return ScoringConstants.ZERO_SCORE
         
-        word_count = AnswerMetrics.calculate_word_count(text)
-        completeness = AnswerMetrics.calculate_completeness_score(text)
-        has_examples = AnswerMetrics.has_examples(text)
-        has_metrics = AnswerMetrics.has_metrics_or_numbers(text)
-        is_non_technical = AnswerMetrics.detect_non_technical_content(text)
+        word_count = features.word_count
+        completeness = features.completeness_score
+        has_examples = features.has_examples
+        has_metrics = features.has_metrics
+        is_non_technical = features.is_non_technical
         thresholds = ScoringConstants.WordCountThresholds
         confidence = ScoringConstants.ConfidenceScores
         
@@ -91,14 +96,48 @@ class AnswerEvaluator:
     
     @staticmethod
     def evaluate_all_answers(answers: List[AnswerData]) -> dict:
-        if not answers:
+        return AnswerEvaluator.evaluate_features(AnswerMetrics.extract_all_features([answer.text for answer in answers]))
+    
+    @staticmethod
+    def evaluate_features(features: List[AnswerFeatures]) -> dict:
+        return AnswerEvaluator.average_scores([AnswerEvaluator.evaluate(answer) for answer in features])
+    
+    @staticmethod
+    def evaluate_text(text: str) -> AnswerEvaluation:
+        return AnswerEvaluator.evaluate(AnswerMetrics.extract_features(text))
+    
+    @staticmethod
+    def evaluate_answer(answer: Answer) -> AnswerEvaluation:
+        if not answer.is_scored:
+            return AnswerEvaluator.evaluate_text(answer.text)
+        return AnswerEvaluation(
+            word_count=answer.word_count,
+            clarity_score=answer.clarity_score,
+            confidence_score=answer.confidence_score,
+            is_gibberish=answer.is_gibberish,
+            is_manipulation=answer.is_manipulation,
+        )
+    
+    @staticmethod
+    def evaluate(features: AnswerFeatures) -> AnswerEvaluation:
+        return AnswerEvaluation(
+            word_count=features.word_count,
+            clarity_score=AnswerEvaluator.clarity_from_features(features),
+            confidence_score=AnswerEvaluator.confidence_from_features(features),
+            is_gibberish=features.is_gibberish,
+            is_manipulation=features.is_manipulation,
+        )
+    
+    @staticmethod
+    def average_scores(evaluations: List[AnswerEvaluation]) -> dict:
+        if not evaluations:
             return {
                 'clarity_score': ScoringConstants.ZERO_SCORE,
                 'confidence_score': ScoringConstants.ZERO_SCORE,
             }
         
-        clarity_scores = [AnswerEvaluator.calculate_clarity_score(answer.text) for answer in answers]
-        confidence_scores = [AnswerEvaluator.calculate_confidence_score(answer.text) for answer in answers]
+        clarity_scores = [evaluation.clarity_score for evaluation in evaluations]
+        confidence_scores = [evaluation.confidence_score for evaluation in evaluations]
         
         avg_clarity = sum(clarity_scores) / len(clarity_scores)
         avg_confidence = sum(confidence_scores) / len(confidence_scores)
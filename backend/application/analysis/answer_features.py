@@ -0,0 +1,39 @@
+class AnswerFeatures:
+    
+    __slots__ = (
+        "word_count",
+        "sentence_count",
+        "is_manipulation",
+        "is_gibberish",
+        "has_structure",
+        "has_examples",
+        "has_metrics",
+        "is_non_technical",
+        "completeness_score",
+    )
+    
+    def __init__(
+        self,
+        word_count: int,
+        sentence_count: int,
+        is_manipulation: bool,
+        is_gibberish: bool,
+        has_structure: bool,
+        has_examples: bool,
+        has_metrics: bool,
+        is_non_technical: bool,
+        completeness_score: float,
+    ):
+        self.word_count = word_count
+        self.sentence_count = sentence_count
+        self.is_manipulation = is_manipulation
+        self.is_gibberish = is_gibberish
+        self.has_structure = has_structure
+        self.has_examples = has_examples
+        self.has_metrics = has_metrics
+        self.is_non_technical = is_non_technical
+        self.completeness_score = completeness_score
+    
+    @property
+    def is_rejected(self) -> bool:
+        return self.is_manipulation or self.is_gibberish
@@ -1,10 +1,45 @@
 import re
-from typing import List
+from typing import FrozenSet, List
+from application.analysis.answer_features import AnswerFeatures
+from application.analysis.gibberish_detector import GibberishDetector
+from application.analysis.keyword_matcher import KeywordMatcher
 from application.analysis.scoring_constants import ScoringConstants
 
+_CATEGORIES = ScoringConstants.KeywordCategories
+
+KEYWORD_MATCHER = KeywordMatcher({
+    _CATEGORIES.STRUCTURE: ScoringConstants.KeywordLists.STRUCTURE_KEYWORDS,
+    _CATEGORIES.EXAMPLE: ScoringConstants.KeywordLists.EXAMPLE_KEYWORDS,
+    _CATEGORIES.METRIC: ScoringConstants.KeywordLists.METRIC_KEYWORDS,
+    _CATEGORIES.MANIPULATION: ScoringConstants.KeywordLists.MANIPULATION_PATTERNS,
+    _CATEGORIES.TECHNICAL: ScoringConstants.NonTechnicalDetection.TECHNICAL_INDICATORS,
+})
+
 
 class AnswerMetrics:
     
+    @staticmethod
+    def extract_features(text: str) -> AnswerFeatures:
+        text_lower = text.lower()
+        word_count = len(text.split())
+        categories = KEYWORD_MATCHER.match(text_lower)
+        
+        return AnswerFeatures(
+            word_count=word_count,
+            sentence_count=AnswerMetrics.calculate_sentence_count(text),
+            is_manipulation=_CATEGORIES.MANIPULATION in categories,
+            is_gibberish=GibberishDetector.detect(text, text_lower),
+            has_structure=_CATEGORIES.STRUCTURE in categories,
+            has_examples=_CATEGORIES.EXAMPLE in categories,
+            has_metrics=AnswerMetrics._has_metrics(text, categories),
+            is_non_technical=AnswerMetrics._detect_non_technical(categories, AnswerMetrics._count_space_separated(text)),
+            completeness_score=AnswerMetrics._completeness_for_word_count(word_count),
+        )
+    
+    @staticmethod
+    def extract_all_features(texts: List[str]) -> List[AnswerFeatures]:
+        return [AnswerMetrics.extract_features(text) for text in texts]
+    
     @staticmethod
     def calculate_word_count(text: str) -> int:
         normalized_text = ' '.join(text.split())
@@ -19,104 +54,61 @@ class AnswerMetrics:
         return len([sentence for sentence in sentences if sentence.strip()])
     
     @staticmethod
-    def _contains_keywords(text: str, keywords: List[str]) -> bool:
-        text_lower = text.lower()
-        return any(keyword in text_lower for keyword in keywords)
+    def match_keyword_categories(text: str) -> FrozenSet[str]:
+        return KEYWORD_MATCHER.match(text.lower())
     
     @staticmethod
     def has_structure_indicators(text: str) -> bool:
-        return AnswerMetrics._contains_keywords(text, ScoringConstants.KeywordLists.STRUCTURE_KEYWORDS)
+        return _CATEGORIES.STRUCTURE in AnswerMetrics.match_keyword_categories(text)
     
     @staticmethod
     def has_examples(text: str) -> bool:
-        return AnswerMetrics._contains_keywords(text, ScoringConstants.KeywordLists.EXAMPLE_KEYWORDS)
+        return _CATEGORIES.EXAMPLE in AnswerMetrics.match_keyword_categories(text)
     
     @staticmethod
     def has_metrics_or_numbers(text: str) -> bool:
-        numbers = re.findall(ScoringConstants.RegexPatterns.NUMBERS_PATTERN, text)
-        return len(numbers) > 0 or AnswerMetrics._contains_keywords(text, ScoringConstants.KeywordLists.METRIC_KEYWORDS)
+        return AnswerMetrics._has_metrics(text, AnswerMetrics.match_keyword_categories(text))
+    
+    @staticmethod
+    def _has_metrics(text: str, categories: FrozenSet[str]) -> bool:
+        if _CATEGORIES.METRIC in categories:
+            return True
+        return re.search(ScoringConstants.RegexPatterns.NUMBERS_PATTERN, text) is not None
     
     @staticmethod
     def detect_manipulation_attempts(text: str) -> bool:
-        text_lower = text.lower()
-        manipulation_patterns = ScoringConstants.KeywordLists.MANIPULATION_PATTERNS
-        
-        for pattern in manipulation_patterns:
-            if pattern in text_lower:
-                return True
-        
-        return False
+        return _CATEGORIES.MANIPULATION in AnswerMetrics.match_keyword_categories(text)
     
     @staticmethod
     def detect_gibberish(text: str) -> bool:
-        gib = ScoringConstants.GibberishDetection
-        
-        if len(text) < gib.MIN_TEXT_LENGTH:
-            return False
-        
-        words = text.split(ScoringConstants.TextProcessing.SPACE_CHAR)
-        text_lower = text.lower()
-        total_chars = len(text.replace(ScoringConstants.TextProcessing.SPACE_CHAR, ''))
-        
-        gibberish_indicators = 0
-        
-        pattern_long = f'[a-z]{{{gib.LONG_RANDOM_SEQUENCE_LENGTH},}}'
-        long_random_sequence = re.search(pattern_long, text_lower)
-        if long_random_sequence:
-            seq = long_random_sequence.group()
-            unique_chars = len(set(seq))
-            char_diversity = unique_chars / len(seq)
-            if char_diversity < gib.CHAR_DIVERSITY_THRESHOLD:
-                gibberish_indicators += gib.LONG_RANDOM_SEQUENCE_INDICATORS
-        
-        if len(words) >= 1:
-            avg_word_length = sum(len(word) for word in words) / len(words)
-            if avg_word_length > gib.AVG_WORD_LENGTH_THRESHOLD and len(words) < gib.MAX_WORDS_FOR_AVG_CHECK:
-                gibberish_indicators += gib.AVG_WORD_LENGTH_INDICATORS
-            
-            very_long_words = sum(1 for word in words if len(word) > gib.VERY_LONG_WORD_LENGTH)
-            if very_long_words >= gib.VERY_LONG_WORD_COUNT:
-                gibberish_indicators += gib.VERY_LONG_WORD_INDICATORS
-        
-        pattern_random = f'[a-z]{{{gib.RANDOM_SEQUENCE_LENGTH},}}'
-        random_char_sequences = re.findall(pattern_random, text_lower)
-        if len(random_char_sequences) > 0:
-            for seq in random_char_sequences:
-                unique_chars = len(set(seq))
-                if unique_chars < len(seq) * gib.RANDOM_SEQUENCE_DIVERSITY_THRESHOLD:
-                    gibberish_indicators += 1
-        
-        pattern_repeated = f'(.)\\1{{{gib.REPEATED_CHAR_MIN_LENGTH},}}'
-        repeated_chars = re.findall(pattern_repeated, text_lower)
-        if len(repeated_chars) > 0:
-            gibberish_indicators += 1
-        
-        if total_chars > 0:
-            non_alpha_ratio = len(re.findall(ScoringConstants.RegexPatterns.NON_ALPHA_PATTERN, text)) / total_chars
-            if non_alpha_ratio > gib.NON_ALPHA_RATIO_THRESHOLD and len(words) < gib.MAX_WORDS_FOR_NON_ALPHA_CHECK:
-                gibberish_indicators += 1
-        
-        if len(words) == 1 and len(words[0]) > gib.SINGLE_WORD_LENGTH_THRESHOLD:
-            gibberish_indicators += gib.SINGLE_WORD_INDICATORS
-        
-        return gibberish_indicators >= gib.MIN_INDICATORS_FOR_GIBBERISH
+        return GibberishDetector.detect(text)
     
     @staticmethod
     def detect_non_technical_content(text: str) -> bool:
-        text_lower = text.lower()
-        has_technical = any(
-            indicator in text_lower 
-            for indicator in ScoringConstants.NonTechnicalDetection.TECHNICAL_INDICATORS
+        return AnswerMetrics._detect_non_technical(
+            AnswerMetrics.match_keyword_categories(text),
+            AnswerMetrics._count_space_separated(text),
         )
+    
+    @staticmethod
+    def _count_space_separated(text: str) -> int:
+        return text.count(ScoringConstants.TextProcessing.SPACE_CHAR) + 1
+    
+    @staticmethod
+    def _detect_non_technical(categories: FrozenSet[str], space_separated_count: int) -> bool:
+        has_technical = _CATEGORIES.TECHNICAL in categories
         
-        if not has_technical and len(text.split(ScoringConstants.TextProcessing.SPACE_CHAR)) > ScoringConstants.NonTechnicalDetection.MIN_WORDS_FOR_CHECK:
+        if not has_technical and space_separated_count > ScoringConstants.NonTechnicalDetection.MIN_WORDS_FOR_CHECK:
             return True
         
         return False
     
     @staticmethod
     def calculate_completeness_score(text: str) -> float:
-        word_count = AnswerMetrics.calculate_word_count(text)
+        return AnswerMetrics._completeness_for_word_count(AnswerMetrics.calculate_word_count(text))
+    
+    @staticmethod
+    def _completeness_for_word_count(word_count: int) -> float:
         thresholds = ScoringConstants.WordCountThresholds
         completeness = ScoringConstants.CompletenessScores
         
@@ -0,0 +1,76 @@
+import re
+from itertools import islice
+from typing import Optional
+from application.analysis.scoring_constants import ScoringConstants
+
+_GIB = ScoringConstants.GibberishDetection
+_SPACE = ScoringConstants.TextProcessing.SPACE_CHAR
+
+_MIN_RUN_LENGTH = min(_GIB.RANDOM_SEQUENCE_LENGTH, _GIB.LONG_RANDOM_SEQUENCE_LENGTH)
+
+_LETTER_RUN_RE = re.compile(f'[a-z]{{{_MIN_RUN_LENGTH},}}')
+_REPEATED_CHAR_RE = re.compile(f'(.)\\1{{{_GIB.REPEATED_CHAR_MIN_LENGTH}}}')
+_VERY_LONG_WORD_RE = re.compile(f'[^{_SPACE}]{{{_GIB.VERY_LONG_WORD_LENGTH + 1},}}')
+_NON_ALPHA_RE = re.compile(ScoringConstants.RegexPatterns.NON_ALPHA_PATTERN)
+
+
+class GibberishDetector:
+    
+    @staticmethod
+    def detect(text: str, text_lower: Optional[str] = None) -> bool:
+        if len(text) < _GIB.MIN_TEXT_LENGTH:
+            return False
+        
+        if len(text) > _GIB.MAX_ANALYZED_LENGTH:
+            text = GibberishDetector.sample(text)
+            text_lower = None
+        if text_lower is None:
+            text_lower = text.lower()
+        
+        return GibberishDetector.count_indicators(text, text_lower) >= _GIB.MIN_INDICATORS_FOR_GIBBERISH
+    
+    @staticmethod
+    def sample(text: str) -> str:
+        window = _GIB.MAX_ANALYZED_LENGTH // _GIB.SAMPLE_WINDOWS
+        stride = (len(text) - window) // max(_GIB.SAMPLE_WINDOWS - 1, 1)
+        return _GIB.SAMPLE_SEPARATOR.join(
+            text[index * stride:index * stride + window] for index in range(_GIB.SAMPLE_WINDOWS)
+        )
+    
+    @staticmethod
+    def count_indicators(text: str, text_lower: str) -> int:
+        word_count = text.count(_SPACE) + 1
+        total_chars = len(text) - (word_count - 1)
+        indicators = 0
+        
+        long_sequence_checked = False
+        for run in _LETTER_RUN_RE.finditer(text_lower):
+            sequence = run.group()
+            unique_chars = len(set(sequence))
+            if not long_sequence_checked and len(sequence) >= _GIB.LONG_RANDOM_SEQUENCE_LENGTH:
+                long_sequence_checked = True
+                if unique_chars / len(sequence) < _GIB.CHAR_DIVERSITY_THRESHOLD:
+                    indicators += _GIB.LONG_RANDOM_SEQUENCE_INDICATORS
+            if len(sequence) >= _GIB.RANDOM_SEQUENCE_LENGTH and unique_chars < len(sequence) * _GIB.RANDOM_SEQUENCE_DIVERSITY_THRESHOLD:
+                indicators += 1
+        
+        avg_word_length = total_chars / word_count
+        if avg_word_length > _GIB.AVG_WORD_LENGTH_THRESHOLD and word_count < _GIB.MAX_WORDS_FOR_AVG_CHECK:
+            indicators += _GIB.AVG_WORD_LENGTH_INDICATORS
+        
+        very_long_words = sum(1 for _ in islice(_VERY_LONG_WORD_RE.finditer(text), _GIB.VERY_LONG_WORD_COUNT))
+        if very_long_words >= _GIB.VERY_LONG_WORD_COUNT:
+            indicators += _GIB.VERY_LONG_WORD_INDICATORS
+        
+        if _REPEATED_CHAR_RE.search(text_lower):
+            indicators += 1
+        
+        if total_chars > 0 and word_count < _GIB.MAX_WORDS_FOR_NON_ALPHA_CHECK:
+            non_alpha_ratio = len(_NON_ALPHA_RE.findall(text)) / total_chars
+            if non_alpha_ratio > _GIB.NON_ALPHA_RATIO_THRESHOLD:
+                indicators += 1
+        
+        if word_count == 1 and len(text) > _GIB.SINGLE_WORD_LENGTH_THRESHOLD:
+            indicators += _GIB.SINGLE_WORD_INDICATORS
+        
+        return indicators
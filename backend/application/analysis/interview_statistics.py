@@ -0,0 +1,35 @@
+from typing import Dict, List
+from domain.entities import Answer, Interview
+from application.analysis.answer_evaluation import AnswerEvaluation
+from application.analysis.answer_evaluator import AnswerEvaluator
+from application.analysis.scoring import ScoringCalculator
+
+
+class InterviewStatistics:
+    
+    @staticmethod
+    def record(interview: Interview, evaluation: AnswerEvaluation) -> None:
+        interview.record_answer_metrics(
+            word_count=evaluation.word_count,
+            clarity_score=evaluation.clarity_score,
+            confidence_score=evaluation.confidence_score,
+            is_gibberish=evaluation.is_gibberish,
+            is_manipulation=evaluation.is_manipulation,
+        )
+    
+    @staticmethod
+    def rebuild(interview: Interview, answers: List[Answer]) -> None:
+        interview.reset_answer_statistics()
+        for answer in answers:
+            InterviewStatistics.record(interview, AnswerEvaluator.evaluate_answer(answer))
+    
+    @staticmethod
+    def scores(interview: Interview) -> Dict[str, float]:
+        return ScoringCalculator.scores_from_statistics(
+            answer_count=interview.answer_count,
+            flagged_count=interview.flagged_answer_count,
+            mean=interview.word_count_mean,
+            variance=interview.word_count_variance,
+            clarity_total=interview.clarity_total,
+            confidence_total=interview.confidence_total,
+        )
@@ -0,0 +1,60 @@
+import re
+from typing import Dict, FrozenSet, Iterable, List
+
+
+class KeywordMatcher:
+    
+    def __init__(self, keywords_by_category: Dict[str, Iterable[str]]):
+        categories_by_keyword: Dict[str, set] = {}
+        for category, keywords in keywords_by_category.items():
+            for keyword in keywords:
+                categories_by_keyword.setdefault(keyword, set()).add(category)
+        
+        self.categories = frozenset(keywords_by_category)
+        self._categories_by_keyword = {
+            keyword: frozenset(
+                category
+                for other, other_categories in categories_by_keyword.items()
+                if other in keyword
+                for category in other_categories
+            )
+            for keyword in categories_by_keyword
+        }
+        self._pattern = re.compile(KeywordMatcher._trie_pattern(list(categories_by_keyword)))
+    
+    def match(self, text_lower: str) -> FrozenSet[str]:
+        search = self._pattern.search
+        categories_by_keyword = self._categories_by_keyword
+        found: FrozenSet[str] = frozenset()
+        seen = set()
+        hit = search(text_lower)
+        while hit is not None:
+            keyword = hit.group()
+            if keyword not in seen:
+                seen.add(keyword)
+                found = found | categories_by_keyword[keyword]
+                if found == self.categories:
+                    break
+            hit = search(text_lower, hit.start() + 1)
+        return found
+    
+    @staticmethod
+    def _trie_pattern(keywords: List[str]) -> str:
+        trie: Dict[str, dict] = {}
+        for keyword in keywords:
+            node = trie
+            for char in keyword:
+                node = node.setdefault(char, {})
+            node[""] = {}
+        return KeywordMatcher._node_pattern(trie)
+    
+    @staticmethod
+    def _node_pattern(node: Dict[str, dict]) -> str:
+        branches = [re.escape(char) + KeywordMatcher._node_pattern(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ""
+        
+        pattern = branches[0] if len(branches) == 1 else f"(?:{'|'.join(branches)})"
+        if "" in node:
+            return f"(?:{pattern})?"
+        return pattern
@@ -1,5 +1,7 @@
-from typing import List
+from typing import Iterable, List, Union
 from application.services.llm_data import AnswerData
+from application.analysis.answer_evaluation import AnswerEvaluation
+from application.analysis.answer_features import AnswerFeatures
 from application.analysis.answer_metrics import AnswerMetrics
 from application.analysis.answer_evaluator import AnswerEvaluator
 from application.analysis.scoring_constants import ScoringConstants
@@ -12,18 +14,38 @@ class ScoringCalculator:
         if len(answers) < ScoringConstants.MIN_ANSWERS_FOR_CONSISTENCY:
             return ScoringConstants.ZERO_SCORE
         
-        manipulation_count = sum(1 for answer in answers if AnswerMetrics.detect_manipulation_attempts(answer.text))
-        gibberish_count = sum(1 for answer in answers if AnswerMetrics.detect_gibberish(answer.text))
+        features = AnswerMetrics.extract_all_features([answer.text for answer in answers])
+        return ScoringCalculator.consistency_from_word_counts(
+            [answer.word_count for answer in features],
+            ScoringCalculator.count_flagged(features),
+        )
+    
+    @staticmethod
+    def count_flagged(answers: Iterable[Union[AnswerFeatures, AnswerEvaluation]]) -> int:
+        return sum(int(answer.is_gibberish) + int(answer.is_manipulation) for answer in answers)
+    
+    @staticmethod
+    def consistency_from_word_counts(word_counts: List[int], flagged_count: int) -> float:
+        if len(word_counts) < ScoringConstants.MIN_ANSWERS_FOR_CONSISTENCY:
+            return ScoringConstants.ZERO_SCORE
         
-        if manipulation_count > 0 or gibberish_count > 0:
-            bad_answer_ratio = (manipulation_count + gibberish_count) / len(answers)
+        mean = sum(word_counts) / len(word_counts)
+        variance = sum((word_count - mean) ** 2 for word_count in word_counts) / len(word_counts)
+        return ScoringCalculator.consistency_from_statistics(len(word_counts), flagged_count, mean, variance)
+    
+    @staticmethod
+    def consistency_from_statistics(answer_count: int, flagged_count: int, mean: float, variance: float) -> float:
+        if answer_count < ScoringConstants.MIN_ANSWERS_FOR_CONSISTENCY:
+            return ScoringConstants.ZERO_SCORE
+        
+        if flagged_count > 0:
+            bad_answer_ratio = flagged_count / answer_count
             if bad_answer_ratio >= ScoringConstants.BAD_ANSWER_THRESHOLD_RATIO:
                 return ScoringConstants.ZERO_SCORE
             else:
                 return ScoringConstants.LOW_CONSISTENCY_PENALTY
         
-        word_counts = [AnswerMetrics.calculate_word_count(answer.text) for answer in answers]
-        avg_length = sum(word_counts) / len(word_counts)
+        avg_length = mean
         thresholds = ScoringConstants.WordCountThresholds
         consistency = ScoringConstants.ConsistencyScores
         
@@ -35,9 +57,7 @@ class ScoringCalculator:
         elif avg_length < thresholds.SHORT:
             return consistency.SHORT_AVG_PENALTY
         
-        mean = avg_length
-        raw_variance = sum((word_count - mean) ** 2 for word_count in word_counts) / len(word_counts)
-        standard_deviation = raw_variance ** 0.5
+        standard_deviation = variance ** 0.5
         coefficient_of_variation = standard_deviation / avg_length if avg_length > 0 else ScoringConstants.MAX_SCORE
         
         if coefficient_of_variation < consistency.COEFFICIENT_VARIATION_EXCELLENT:
@@ -68,19 +88,66 @@ class ScoringCalculator:
     
     @staticmethod
     def calculate_all_scores(answers: List[AnswerData]) -> dict:
-        if not answers:
+        scores = ScoringCalculator.calculate_interview_scores(answers)
+        return {
+            'consistency_score': scores['consistency_score'],
+            'overall_usefulness': scores['overall_usefulness'],
+        }
+    
+    @staticmethod
+    def calculate_interview_scores(answers: List[AnswerData]) -> dict:
+        return ScoringCalculator.scores_from_features(AnswerMetrics.extract_all_features([answer.text for answer in answers]))
+    
+    @staticmethod
+    def scores_from_features(features: List[AnswerFeatures]) -> dict:
+        return ScoringCalculator.aggregate_evaluations([AnswerEvaluator.evaluate(answer) for answer in features])
+    
+    @staticmethod
+    def aggregate_evaluations(evaluations: List[AnswerEvaluation]) -> dict:
+        if not evaluations:
             return {
+                'confidence_score': ScoringConstants.ZERO_SCORE,
+                'clarity_score': ScoringConstants.ZERO_SCORE,
                 'consistency_score': ScoringConstants.ZERO_SCORE,
                 'overall_usefulness': ScoringConstants.ZERO_SCORE,
             }
         
-        evaluation_result = AnswerEvaluator.evaluate_all_answers(answers)
-        
-        clarity_score = evaluation_result['clarity_score']
-        confidence_score = evaluation_result['confidence_score']
+        evaluation_result = AnswerEvaluator.average_scores(evaluations)
         
-        consistency_score = ScoringCalculator.calculate_consistency_score(answers)
+        return ScoringCalculator._combine_scores(
+            clarity_score=evaluation_result['clarity_score'],
+            confidence_score=evaluation_result['confidence_score'],
+            consistency_score=ScoringCalculator.consistency_from_word_counts(
+                [evaluation.word_count for evaluation in evaluations],
+                ScoringCalculator.count_flagged(evaluations),
+            ),
+        )
+    
+    @staticmethod
+    def scores_from_statistics(
+        answer_count: int,
+        flagged_count: int,
+        mean: float,
+        variance: float,
+        clarity_total: float,
+        confidence_total: float,
+    ) -> dict:
+        if not answer_count:
+            return {
+                'confidence_score': ScoringConstants.ZERO_SCORE,
+                'clarity_score': ScoringConstants.ZERO_SCORE,
+                'consistency_score': ScoringConstants.ZERO_SCORE,
+                'overall_usefulness': ScoringConstants.ZERO_SCORE,
+            }
         
+        return ScoringCalculator._combine_scores(
+            clarity_score=round(clarity_total / answer_count, ScoringConstants.SCORE_PRECISION),
+            confidence_score=round(confidence_total / answer_count, ScoringConstants.SCORE_PRECISION),
+            consistency_score=ScoringCalculator.consistency_from_statistics(answer_count, flagged_count, mean, variance),
+        )
+    
+    @staticmethod
+    def _combine_scores(clarity_score: float, confidence_score: float, consistency_score: float) -> dict:
         overall_usefulness = ScoringCalculator.calculate_overall_usefulness(
             clarity_score=clarity_score,
             confidence_score=confidence_score,
@@ -88,6 +155,8 @@ class ScoringCalculator:
         )
         
         return {
+            'confidence_score': confidence_score,
+            'clarity_score': clarity_score,
             'consistency_score': round(consistency_score, ScoringConstants.SCORE_PRECISION),
             'overall_usefulness': overall_usefulness,
         }
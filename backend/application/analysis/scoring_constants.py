@@ -102,6 +102,10 @@ class ScoringConstants:
         SINGLE_WORD_INDICATORS = 2
         
         MIN_INDICATORS_FOR_GIBBERISH = 1
+        
+        MAX_ANALYZED_LENGTH = 8192
+        SAMPLE_WINDOWS = 3
+        SAMPLE_SEPARATOR = '\n'
     
     class NonTechnicalDetection:
         MIN_WORDS_FOR_CHECK = 5
@@ -130,9 +134,16 @@ class ScoringConstants:
             'help me', 'tell me the answer', 'give me the answer', 'dami', 'zi si mie', 'te rog', 'please give me',
             'i need the answer', 'i want the answer', 'i beg you', 'hai te rog', 'dami jobu',
             'answer this for me', 'do it for me', 'tell me the answer','nevoie de bani', 'ingrop', 'died',
-
+        
         ]
     
+    class KeywordCategories:
+        STRUCTURE = 'structure'
+        EXAMPLE = 'example'
+        METRIC = 'metric'
+        MANIPULATION = 'manipulation'
+        TECHNICAL = 'technical'
+    
     class RegexPatterns:
         NUMBERS_PATTERN = r'\d+'
         NON_ALPHA_PATTERN = r'[^a-zA-Z\s]'
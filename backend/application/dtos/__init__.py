@@ -2,10 +2,17 @@ from .interview_dto import CreateInterviewDTO
 from .question_dto import GenerateQuestionDTO
 from .answer_dto import CreateAnswerDTO
 from .llm_summary_response_dto import LlmSummaryResponseDTO
+from .stream_event_dto import StreamEventDTO
+from .batch_summary_dto import SubmitBatchSummaryDTO, BatchSummaryJobDTO
+from .interview_progress_dto import InterviewProgressDTO
 
 __all__ = [
     "CreateInterviewDTO",
     "GenerateQuestionDTO",
     "CreateAnswerDTO",
     "LlmSummaryResponseDTO",
+    "StreamEventDTO",
+    "SubmitBatchSummaryDTO",
+    "BatchSummaryJobDTO",
+    "InterviewProgressDTO",
 ]
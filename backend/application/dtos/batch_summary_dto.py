@@ -0,0 +1,19 @@
+from typing import List, Optional
+from uuid import UUID
+from pydantic import BaseModel
+
+
+class SubmitBatchSummaryDTO(BaseModel):
+    interview_ids: Optional[List[UUID]] = None
+
+
+class BatchSummaryJobDTO(BaseModel):
+    batch_id: str
+    status: str
+    total: int = 0
+    completed: int = 0
+    failed: int = 0
+    interview_ids: List[UUID] = []
+    ingested: int = 0
+    skipped: int = 0
+    errors: int = 0
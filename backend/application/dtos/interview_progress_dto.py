@@ -0,0 +1,13 @@
+from uuid import UUID
+from pydantic import BaseModel
+
+
+class InterviewProgressDTO(BaseModel):
+    interview_id: UUID
+    status: str
+    answer_count: int
+    average_word_count: float
+    confidence_score: float
+    clarity_score: float
+    consistency_score: float
+    overall_usefulness: float
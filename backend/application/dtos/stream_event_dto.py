@@ -0,0 +1,7 @@
+from typing import Any
+from pydantic import BaseModel
+
+
+class StreamEventDTO(BaseModel):
+    event: str
+    data: Any = None
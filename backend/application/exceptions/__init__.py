@@ -4,6 +4,9 @@ from application.exceptions.base_exceptions import (
     BusinessRuleException,
     ValidationException,
     LlmServiceError,
+    LlmRateLimitError,
+    LlmCircuitOpenError,
+    LlmDeadlineExceededError,
 )
 from application.exceptions.domain_exceptions import (
     InterviewNotFoundException,
@@ -13,6 +16,7 @@ from application.exceptions.domain_exceptions import (
     InterviewAlreadyCompletedException,
     MaxQuestionsReachedException,
     InvalidAnswerOrderException,
+    NoPendingSummariesException,
 )
 
 __all__ = [
@@ -21,6 +25,9 @@ __all__ = [
     "BusinessRuleException",
     "ValidationException",
     "LlmServiceError",
+    "LlmRateLimitError",
+    "LlmCircuitOpenError",
+    "LlmDeadlineExceededError",
     "InterviewNotFoundException",
     "QuestionNotFoundException",
     "SummaryNotFoundException",
@@ -28,4 +35,5 @@ __all__ = [
     "InterviewAlreadyCompletedException",
     "MaxQuestionsReachedException",
     "InvalidAnswerOrderException",
+    "NoPendingSummariesException",
 ]
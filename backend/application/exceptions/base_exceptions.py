@@ -1,3 +1,6 @@
+from typing import Optional
+
+
 class ApplicationException(Exception):
     pass
 
@@ -23,4 +26,20 @@ class ValidationException(ApplicationException):
 class LlmServiceError(ApplicationException):
     def __init__(self, message: str):
         self.message = message
-        super().__init__(self.message)
\ No newline at end of file
+        super().__init__(self.message)
+
+
+class LlmRateLimitError(LlmServiceError):
+    def __init__(self, message: str, retry_after: Optional[float] = None):
+        self.retry_after = retry_after
+        super().__init__(message)
+
+
+class LlmCircuitOpenError(LlmServiceError):
+    def __init__(self, message: str, retry_after: Optional[float] = None):
+        self.retry_after = retry_after
+        super().__init__(message)
+
+
+class LlmDeadlineExceededError(LlmServiceError):
+    pass
@@ -60,3 +60,8 @@ class MaxQuestionsReachedException(BusinessRuleException):
 class InvalidAnswerOrderException(BusinessRuleException):
     def __init__(self, message: str = "Answer order is invalid"):
         super().__init__(message)
+
+
+class NoPendingSummariesException(BusinessRuleException):
+    def __init__(self, message: str = "No interviews with answers are waiting for a summary"):
+        super().__init__(message)
@@ -1,7 +1,7 @@
 from abc import ABC, abstractmethod
 from typing import List
 from uuid import UUID
-from domain.entities import Answer
+from domain.entities import Answer, Interview
 
 
 class AnswerRepository(ABC):
@@ -10,6 +10,10 @@ class AnswerRepository(ABC):
     async def create(self, answer: Answer) -> Answer:
         pass
     
+    @abstractmethod
+    async def create_for_interview(self, answer: Answer, interview: Interview, reset_statistics: bool = False) -> Answer:
+        pass
+    
     @abstractmethod
     async def get_by_interview_id(self, interview_id: UUID) -> List[Answer]:
         pass
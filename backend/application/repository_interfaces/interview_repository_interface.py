@@ -18,6 +18,10 @@ class InterviewRepository(ABC):
     async def update(self, interview: Interview) -> Optional[Interview]:
         pass
     
+    @abstractmethod
+    async def replace_answer_statistics(self, interview: Interview) -> bool:
+        pass
+    
     @abstractmethod
     async def delete(self, interview_id: UUID) -> bool:
         pass
@@ -25,3 +29,7 @@ class InterviewRepository(ABC):
     @abstractmethod
     async def get_all(self) -> List[Interview]:
         pass
+    
+    @abstractmethod
+    async def get_frequent_topics(self, limit: int) -> List[str]:
+        pass
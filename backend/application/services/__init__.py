@@ -1,11 +1,15 @@
 from application.services.llm_client import LLMClient
 from application.services.llm_orchestrator import LLMOrchestrator
 from application.services.prompt_builder import PromptBuilder
+from application.services.question_pool import QuestionPool
+from application.services.question_prefetcher import QuestionPrefetcher
 from application.services.response_parser import ResponseParser
 
 __all__ = [
     "LLMClient",
     "LLMOrchestrator",
     "PromptBuilder",
+    "QuestionPool",
+    "QuestionPrefetcher",
     "ResponseParser",
 ]
@@ -0,0 +1,25 @@
+from abc import ABC, abstractmethod
+from typing import Dict, Optional
+
+from application.services.llm_client import LLMPrompt
+from application.services.llm_data import BatchJobStatus, BatchResult, GenerationProfile
+
+
+class BatchLLMClient(ABC):
+    
+    @abstractmethod
+    async def submit(
+        self,
+        prompts: Dict[str, LLMPrompt],
+        operation: Optional[str] = None,
+        profile: Optional[GenerationProfile] = None,
+    ) -> BatchJobStatus:
+        pass
+    
+    @abstractmethod
+    async def get_status(self, batch_id: str) -> BatchJobStatus:
+        pass
+    
+    @abstractmethod
+    async def get_results(self, batch_id: str) -> Dict[str, BatchResult]:
+        pass
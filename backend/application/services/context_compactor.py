@@ -0,0 +1,132 @@
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional
+
+from application.services.llm_data import QuestionData, AnswerData
+from application.services.service_constants import ServiceConstants
+
+
+class ContextCompactor:
+    
+    def __init__(
+        self,
+        max_prompt_tokens: int,
+        recent_turns: int,
+        digest_chars: int,
+        digest_cache_size: int,
+    ):
+        self.max_prompt_tokens = max_prompt_tokens
+        self.recent_turns = recent_turns
+        self.digest_chars = digest_chars
+        self.digest_cache_size = digest_cache_size
+        self._digests: "OrderedDict[Any, str]" = OrderedDict()
+        self.contexts = 0
+        self.compactions = 0
+        self.tokens_before = 0
+        self.tokens_after = 0
+        self.digest_hits = 0
+        self.digest_misses = 0
+    
+    def build(
+        self,
+        topic: str,
+        existing_questions: Optional[List[QuestionData]],
+        previous_answers: Optional[List[AnswerData]],
+        reserved_tokens: int = 0,
+    ) -> str:
+        questions = [question.text for question in existing_questions or []]
+        answers = previous_answers or []
+        budget = max(self.max_prompt_tokens - reserved_tokens, 0)
+        
+        context = self.render(topic, questions, [answer.text for answer in answers])
+        original_tokens = self.estimate_tokens(context)
+        self.contexts += 1
+        if original_tokens <= budget:
+            self._record(original_tokens, original_tokens)
+            return context
+        
+        older_count = max(len(answers) - self.recent_turns, 0)
+        answer_texts = [self._digest(answer) for answer in answers[:older_count]]
+        answer_texts += [answer.text for answer in answers[older_count:]]
+        context = self.render(topic, questions, answer_texts)
+        
+        omitted = 0
+        while self.estimate_tokens(context) > budget and omitted < older_count:
+            omitted += 1
+            context = self.render(topic, questions, answer_texts[omitted:], omitted)
+        
+        if self.estimate_tokens(context) > budget:
+            answer_texts = [self._digest(answer) for answer in answers[omitted:]]
+            context = self.render(topic, questions, answer_texts, omitted)
+        
+        max_chars = budget * ServiceConstants.LLMClient.CHARS_PER_TOKEN
+        if len(context) > max_chars:
+            context = self._truncate(context, max_chars)
+        
+        self.compactions += 1
+        self._record(original_tokens, self.estimate_tokens(context))
+        return context
+    
+    @staticmethod
+    def render(topic: str, questions: List[str], answers: List[str], omitted_answers: int = 0) -> str:
+        context_parts = [f"Interview topic: {topic}"]
+        
+        if questions:
+            context_parts.append("\nPreviously asked questions:")
+            for question in questions:
+                context_parts.append(f"- {question}")
+        
+        if answers or omitted_answers:
+            context_parts.append("\nPrevious answers:")
+            if omitted_answers:
+                context_parts.append(f"- ({omitted_answers} earlier answers omitted)")
+            for answer in answers:
+                context_parts.append(f"- {answer}")
+        
+        return "\n".join(context_parts)
+    
+    @staticmethod
+    def estimate_tokens(text: str) -> int:
+        return -(-len(text) // ServiceConstants.LLMClient.CHARS_PER_TOKEN)
+    
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "contexts": self.contexts,
+            "compactions": self.compactions,
+            "tokens_before": self.tokens_before,
+            "tokens_after": self.tokens_after,
+            "tokens_saved": self.tokens_before - self.tokens_after,
+            "digest_hits": self.digest_hits,
+            "digest_misses": self.digest_misses,
+        }
+    
+    def _digest(self, answer: AnswerData) -> str:
+        key = (answer.question_id, len(answer.text))
+        digest = self._digests.get(key)
+        if digest is not None:
+            self._digests.move_to_end(key)
+            self.digest_hits += 1
+            return digest
+        
+        self.digest_misses += 1
+        text = " ".join(answer.text.split())
+        if len(text) <= self.digest_chars:
+            digest = text
+        else:
+            cut = text.rfind(" ", 0, self.digest_chars)
+            digest = text[:cut if cut > 0 else self.digest_chars].rstrip(" ,;:") + "..."
+        
+        self._digests[key] = digest
+        while len(self._digests) > self.digest_cache_size:
+            self._digests.popitem(last=False)
+        return digest
+    
+    @staticmethod
+    def _truncate(context: str, max_chars: int) -> str:
+        cut = context.rfind("\n", 0, max_chars + 1)
+        if cut <= 0:
+            cut = max(context.rfind(" ", 0, max_chars + 1), context.rfind("\t", 0, max_chars + 1))
+        return context[:cut if cut > 0 else max_chars].rstrip()
+    
+    def _record(self, tokens_before: int, tokens_after: int) -> None:
+        self.tokens_before += tokens_before
+        self.tokens_after += tokens_after
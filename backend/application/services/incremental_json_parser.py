@@ -0,0 +1,57 @@
+import json
+from typing import Any, List, Tuple
+
+
+class IncrementalJsonParser:
+    
+    def __init__(self):
+        self.text = ""
+        self.position = 0
+        self.depth = 0
+        self.in_string = False
+        self.escaped = False
+        self.field_start = None
+        self.completed = False
+    
+    def feed(self, chunk: str) -> List[Tuple[str, Any]]:
+        self.text += chunk
+        fields = []
+        
+        while self.position < len(self.text) and not self.completed:
+            char = self.text[self.position]
+            
+            if self.in_string:
+                if self.escaped:
+                    self.escaped = False
+                elif char == "\\":
+                    self.escaped = True
+                elif char == '"':
+                    self.in_string = False
+            elif char == '"':
+                if self.depth > 0:
+                    self.in_string = True
+            elif char == "{" or (char == "[" and self.depth > 0):
+                self.depth += 1
+                if self.depth == 1:
+                    self.field_start = self.position + 1
+            elif char in "}]" and self.depth > 0:
+                self.depth -= 1
+                if self.depth == 0:
+                    fields.extend(self._parse_field(self.text[self.field_start:self.position]))
+                    self.completed = True
+            elif char == "," and self.depth == 1:
+                fields.extend(self._parse_field(self.text[self.field_start:self.position]))
+                self.field_start = self.position + 1
+            
+            self.position += 1
+        
+        return fields
+    
+    @staticmethod
+    def _parse_field(segment: str) -> List[Tuple[str, Any]]:
+        if not segment.strip():
+            return []
+        try:
+            return list(json.loads("{" + segment + "}").items())
+        except ValueError:
+            return []
@@ -0,0 +1,194 @@
+import json
+import re
+from typing import Any, Dict, List, Optional, Tuple
+
+
+class _RepairState:
+    
+    def __init__(self):
+        self.output: List[str] = []
+        self.stack: List[str] = []
+        self.pending_comma = False
+        self.after_value = False
+        self.awaiting_value = False
+        self.key_position: Optional[int] = None
+    
+    def begin_token(self) -> bool:
+        position = len(self.output)
+        if self.pending_comma or self.after_value:
+            self.output.append(",")
+        self.pending_comma = False
+        self.after_value = False
+        
+        is_key = bool(self.stack) and self.stack[-1] == "{" and not self.awaiting_value
+        self.awaiting_value = False
+        self.key_position = position if is_key else None
+        return is_key
+    
+    def drop_unfinished_key(self) -> None:
+        if self.key_position is not None:
+            del self.output[self.key_position:]
+            self.key_position = None
+            self.awaiting_value = False
+
+
+class JsonRepairer:
+    
+    LITERALS = {
+        "true": "true",
+        "false": "false",
+        "null": "null",
+        "True": "true",
+        "False": "false",
+        "None": "null",
+    }
+    CLOSERS = {"{": "}", "[": "]"}
+    NUMBER_PATTERN = re.compile(r"[-+]?(?:\d+(?:\.\d*)?|\.\d+)(?:[eE][-+]?\d*)?")
+    SIMPLE_ESCAPES = "\"\\/bfnrt"
+    UNICODE_ESCAPE_PATTERN = re.compile(r"u[0-9a-fA-F]{4}")
+    
+    @classmethod
+    def extract_object(cls, text: str) -> Optional[Dict[str, Any]]:
+        start = text.find("{")
+        if start < 0:
+            return None
+        
+        repaired = cls.repair(text[start:])
+        try:
+            value = json.loads(repaired)
+        except ValueError:
+            return None
+        return value if isinstance(value, dict) else None
+    
+    @classmethod
+    def repair(cls, text: str) -> str:
+        state = _RepairState()
+        output = state.output
+        quote: Optional[str] = None
+        in_key = False
+        index = 0
+        length = len(text)
+        
+        while index < length:
+            char = text[index]
+            
+            if quote is not None:
+                if char == "\\":
+                    if index + 1 < length:
+                        escape, index = cls._escape_sequence(text, index + 1)
+                        output.append(escape)
+                    else:
+                        index += 1
+                    continue
+                if char == quote and cls._closes_string(text, index + 1):
+                    quote = None
+                    output.append('"')
+                    state.after_value = not in_key
+                elif char == '"':
+                    output.append('\\"')
+                elif char == "\n":
+                    output.append("\\n")
+                elif char == "\r":
+                    pass
+                elif char == "\t":
+                    output.append("\\t")
+                else:
+                    output.append(char)
+                index += 1
+                continue
+            
+            if char in "\"'":
+                in_key = state.begin_token()
+                quote = char
+                output.append('"')
+            elif char in "{[":
+                state.begin_token()
+                state.stack.append(char)
+                output.append(char)
+            elif char in "}]":
+                state.pending_comma = False
+                state.drop_unfinished_key()
+                if state.stack:
+                    output.append(cls.CLOSERS[state.stack.pop()])
+                state.after_value = True
+                if not state.stack:
+                    break
+            elif char == ",":
+                state.pending_comma = True
+            elif char == ":":
+                output.append(char)
+                state.awaiting_value = True
+            elif text.startswith("//", index):
+                end = text.find("\n", index)
+                index = length if end < 0 else end
+                continue
+            elif text.startswith("/*", index):
+                end = text.find("*/", index + 2)
+                index = length if end < 0 else end + 2
+                continue
+            elif char.isdigit() or char in "+-.":
+                number = cls.NUMBER_PATTERN.match(text, index)
+                if number is not None:
+                    state.begin_token()
+                    output.append(cls._normalize_number(number.group()))
+                    state.after_value = True
+                    index = number.end()
+                    continue
+            elif char.isalpha():
+                end = index
+                while end < length and (text[end].isalnum() or text[end] == "_"):
+                    end += 1
+                word = text[index:end]
+                is_key = state.begin_token()
+                output.append(json.dumps(word) if is_key else cls.LITERALS.get(word, json.dumps(word)))
+                state.after_value = not is_key
+                index = end
+                continue
+            elif char.isspace() and output:
+                output.append(char)
+            
+            index += 1
+        
+        if quote is not None and not in_key:
+            output.append('"')
+        state.drop_unfinished_key()
+        
+        while output and output[-1].isspace():
+            output.pop()
+        
+        while state.stack:
+            output.append(cls.CLOSERS[state.stack.pop()])
+        
+        return "".join(output)
+    
+    @classmethod
+    def _escape_sequence(cls, text: str, index: int) -> Tuple[str, int]:
+        char = text[index]
+        if char == "'":
+            return "'", index + 1
+        if char in cls.SIMPLE_ESCAPES or cls.UNICODE_ESCAPE_PATTERN.match(text, index):
+            return "\\" + char, index + 1
+        return "\\\\", index
+    
+    @staticmethod
+    def _normalize_number(token: str) -> str:
+        mantissa, separator, exponent = token.lstrip("+").replace("E", "e").partition("e")
+        sign = "-" if mantissa.startswith("-") else ""
+        digits = mantissa.lstrip("-")
+        if digits.startswith("."):
+            digits = "0" + digits
+        if digits.endswith("."):
+            digits += "0"
+        if not exponent.lstrip("+-"):
+            separator = exponent = ""
+        return sign + digits + separator + exponent
+    
+    @staticmethod
+    def _closes_string(text: str, index: int) -> bool:
+        start = index
+        length = len(text)
+        while index < length and text[index].isspace():
+            index += 1
+        if index >= length or text[index] in ",:}]":
+            return True
+        return text[index] in "\"'" and "\n" in text[start:index]
@@ -1,8 +1,47 @@
 from abc import ABC, abstractmethod
+from typing import Any, AsyncIterator, Dict, List, Optional, Union
+
+from application.services.llm_data import ChatMessage, GenerationProfile
+
+LLMPrompt = Union[str, List[ChatMessage]]
+
+
+def to_chat_messages(prompt: LLMPrompt) -> List[ChatMessage]:
+    if isinstance(prompt, str):
+        return [ChatMessage(role="user", content=prompt)]
+    return list(prompt)
+
+
+def prompt_length(prompt: LLMPrompt) -> int:
+    if isinstance(prompt, str):
+        return len(prompt)
+    return sum(len(message.content) for message in prompt)
 
 
 class LLMClient(ABC):
     
     @abstractmethod
-    async def call(self, prompt: str) -> str:
+    async def call(
+        self,
+        prompt: LLMPrompt,
+        operation: Optional[str] = None,
+        profile: Optional[GenerationProfile] = None,
+    ) -> str:
+        pass
+    
+    async def stream(
+        self,
+        prompt: LLMPrompt,
+        operation: Optional[str] = None,
+        profile: Optional[GenerationProfile] = None,
+    ) -> AsyncIterator[str]:
+        yield await self.call(prompt, operation, profile)
+    
+    def resolve_model(self, profile: Optional[GenerationProfile] = None) -> Optional[str]:
+        return None
+    
+    def stats(self) -> Dict[str, Any]:
+        return {}
+    
+    async def aclose(self) -> None:
         pass
@@ -1,6 +1,9 @@
 from dataclasses import dataclass
+from typing import Optional
 from uuid import UUID
 
+from application.services.service_constants import ServiceConstants
+
 
 @dataclass
 class QuestionData:
@@ -12,4 +15,41 @@ class QuestionData:
 @dataclass
 class AnswerData:
     text: str
-    question_id: UUID
\ No newline at end of file
+    question_id: UUID
+
+
+@dataclass(frozen=True)
+class ChatMessage:
+    role: str
+    content: str
+
+
+@dataclass(frozen=True)
+class GenerationProfile:
+    model: Optional[str] = None
+    temperature: Optional[float] = None
+    max_tokens: Optional[int] = None
+    json_mode: Optional[bool] = None
+
+
+@dataclass
+class BatchJobStatus:
+    batch_id: str
+    status: str
+    total: int = 0
+    completed: int = 0
+    failed: int = 0
+    
+    @property
+    def is_finished(self) -> bool:
+        return self.status in ServiceConstants.LLMBatch.FINISHED_STATUSES
+    
+    @property
+    def is_completed(self) -> bool:
+        return self.status == ServiceConstants.LLMBatch.COMPLETED_STATUS
+
+
+@dataclass
+class BatchResult:
+    content: Optional[str] = None
+    error: Optional[str] = None
@@ -1,10 +1,17 @@
-from typing import List, Optional, Dict, Any
+import asyncio
+from typing import AsyncIterator, Callable, List, Optional, Dict, Any
+
+from pydantic import ValidationError
 
 from application.services.llm_client import LLMClient
 from application.services.prompt_builder import PromptBuilder
 from application.services.response_parser import ResponseParser
-from application.services.llm_data import QuestionData, AnswerData
-from application.exceptions import LlmServiceError, ValidationException
+from application.services.llm_data import QuestionData, AnswerData, ChatMessage, GenerationProfile
+from application.services.service_constants import ServiceConstants
+from application.services.model_cascade import ModelCascade
+from application.services.request_deadline import RequestDeadline
+from application.dtos import LlmSummaryResponseDTO
+from application.exceptions import LlmServiceError, LlmDeadlineExceededError, ValidationException
 
 
 class LLMOrchestrator:
@@ -14,16 +21,27 @@ class LLMOrchestrator:
         llm_client: LLMClient,
         prompt_builder: PromptBuilder,
         response_parser: Optional[ResponseParser] = None,
+        generation_profiles: Optional[Dict[str, GenerationProfile]] = None,
+        model_cascade: Optional[ModelCascade] = None,
     ):
         self.llm_client = llm_client
         self.prompt_builder = prompt_builder
         self.response_parser = response_parser or ResponseParser()
+        self.generation_profiles = generation_profiles or {}
+        self.model_cascade = model_cascade
+    
+    def get_profile(self, operation: str) -> Optional[GenerationProfile]:
+        profile = self.generation_profiles.get(operation)
+        if profile is None and operation == ServiceConstants.LLMOperations.OPENING_QUESTION:
+            profile = self.generation_profiles.get(ServiceConstants.LLMOperations.QUESTION)
+        return profile
     
     async def generate_question(
         self,
         topic: str,
         existing_questions: Optional[List[QuestionData]] = None,
         previous_answers: Optional[List[AnswerData]] = None,
+        operation: str = ServiceConstants.LLMOperations.QUESTION,
     ) -> str:
         try:
             context = self.prompt_builder.build_question_context(
@@ -31,13 +49,33 @@ class LLMOrchestrator:
             )
             prompt = self.prompt_builder.build_question_prompt(context)
             
-            response = await self.llm_client.call(prompt)
+            response = await self._call(prompt, operation, self._is_valid_question)
             return response.strip()
         except Exception as e:
             if isinstance(e, LlmServiceError):
                 raise
             raise LlmServiceError(f"Failed to generate question: {str(e)}") from e
     
+    async def stream_question(
+        self,
+        topic: str,
+        existing_questions: Optional[List[QuestionData]] = None,
+        previous_answers: Optional[List[AnswerData]] = None,
+    ) -> AsyncIterator[str]:
+        try:
+            context = self.prompt_builder.build_question_context(
+                topic, existing_questions, previous_answers
+            )
+            prompt = self.prompt_builder.build_question_prompt(context)
+            
+            operation = ServiceConstants.LLMOperations.QUESTION
+            async for chunk in self.llm_client.stream(prompt, operation, self.get_profile(operation)):
+                yield chunk
+        except Exception as e:
+            if isinstance(e, LlmServiceError):
+                raise
+            raise LlmServiceError(f"Failed to stream question: {str(e)}") from e
+    
     async def generate_summary(
         self,
         interview_topic: str,
@@ -52,9 +90,107 @@ class LLMOrchestrator:
                 interview_topic, questions, answers
             )
             
-            response_text = await self.llm_client.call(prompt)
-            return self.response_parser.parse_summary_response(response_text)
+            response_text = await self._call(prompt, ServiceConstants.LLMOperations.SUMMARY, self._is_valid_summary)
+            return await self.parse_summary(response_text)
         except Exception as e:
             if isinstance(e, (LlmServiceError, ValidationException)):
                 raise
             raise LlmServiceError(f"Failed to generate summary: {str(e)}") from e
+    
+    async def stream_summary(
+        self,
+        interview_topic: str,
+        answers: List[AnswerData],
+        questions: List[QuestionData],
+    ) -> AsyncIterator[str]:
+        if not answers:
+            raise LlmServiceError("Cannot generate summary without answers")
+        
+        try:
+            prompt = self.prompt_builder.build_summary_prompt(
+                interview_topic, questions, answers
+            )
+            
+            operation = ServiceConstants.LLMOperations.SUMMARY
+            async for chunk in self.llm_client.stream(prompt, operation, self.get_profile(operation)):
+                yield chunk
+        except Exception as e:
+            if isinstance(e, LlmServiceError):
+                raise
+            raise LlmServiceError(f"Failed to stream summary: {str(e)}") from e
+    
+    def build_summary_prompt(
+        self,
+        interview_topic: str,
+        answers: List[AnswerData],
+        questions: List[QuestionData],
+    ) -> List[ChatMessage]:
+        return self.prompt_builder.build_summary_prompt(interview_topic, questions, answers)
+    
+    async def parse_summary(self, response_text: str) -> Dict[str, Any]:
+        try:
+            return self.response_parser.parse_summary_response(response_text)
+        except ValidationException:
+            repaired_text = await self._repair_summary_json(response_text)
+            return self.response_parser.parse_summary_response(repaired_text)
+    
+    async def _repair_summary_json(self, response_text: str) -> str:
+        prompt = self.prompt_builder.build_summary_repair_prompt(response_text)
+        operation = ServiceConstants.LLMOperations.SUMMARY_REPAIR
+        profile = self.get_profile(operation) or self.get_profile(ServiceConstants.LLMOperations.SUMMARY)
+        return await self._call_llm(prompt, operation, profile)
+    
+    async def _call(self, prompt: List[ChatMessage], operation: str, is_valid: Callable[[str], bool]) -> str:
+        profile = self.get_profile(operation)
+        tiers = self.model_cascade.tiers_for(operation) if self.model_cascade else []
+        if not tiers:
+            return await self._call_llm(prompt, operation, profile)
+        
+        for index, tier in enumerate(tiers):
+            is_last_tier = index == len(tiers) - 1
+            self.model_cascade.record_attempt(operation, tier)
+            try:
+                response = await self._call_llm(prompt, operation, tier.resolve(profile))
+            except LlmDeadlineExceededError:
+                raise
+            except LlmServiceError:
+                if is_last_tier:
+                    raise
+                self.model_cascade.record_rejection(operation, tier)
+                continue
+            
+            if is_last_tier or is_valid(response):
+                self.model_cascade.record_completion(operation, tier)
+                return response
+            self.model_cascade.record_rejection(operation, tier)
+    
+    async def _call_llm(
+        self,
+        prompt: List[ChatMessage],
+        operation: str,
+        profile: Optional[GenerationProfile],
+    ) -> str:
+        try:
+            return await asyncio.wait_for(
+                self.llm_client.call(prompt, operation, profile), RequestDeadline.remaining()
+            )
+        except asyncio.TimeoutError as e:
+            raise LlmDeadlineExceededError(f"Deadline exceeded while waiting for {operation}") from e
+    
+    @staticmethod
+    def _is_valid_question(response: str) -> bool:
+        question = response.strip()
+        word_count = len(question.split())
+        cascade_consts = ServiceConstants.ModelCascade
+        return (
+            "?" in question
+            and "\n" not in question
+            and cascade_consts.MIN_QUESTION_WORDS <= word_count <= cascade_consts.MAX_QUESTION_WORDS
+        )
+    
+    def _is_valid_summary(self, response: str) -> bool:
+        try:
+            LlmSummaryResponseDTO(**self.response_parser.parse_summary_response(response))
+        except (ValidationException, ValidationError):
+            return False
+        return True
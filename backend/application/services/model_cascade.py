@@ -0,0 +1,67 @@
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+from application.services.llm_data import GenerationProfile
+from application.services.service_constants import ServiceConstants
+
+
+@dataclass(frozen=True)
+class CascadeTier:
+    name: str
+    profile: GenerationProfile
+    
+    def resolve(self, base: Optional[GenerationProfile]) -> GenerationProfile:
+        base = base or GenerationProfile()
+        return GenerationProfile(
+            model=self.profile.model or base.model,
+            temperature=self.profile.temperature if self.profile.temperature is not None else base.temperature,
+            max_tokens=self.profile.max_tokens if self.profile.max_tokens is not None else base.max_tokens,
+            json_mode=self.profile.json_mode if self.profile.json_mode is not None else base.json_mode,
+        )
+
+
+class ModelCascade:
+    
+    def __init__(self, tiers: Dict[str, List[CascadeTier]]):
+        self.tiers = tiers
+        self._attempts: Dict[str, Dict[str, int]] = {}
+        self._completions: Dict[str, Dict[str, int]] = {}
+        self._rejections: Dict[str, Dict[str, int]] = {}
+    
+    def tiers_for(self, operation: str) -> List[CascadeTier]:
+        tiers = self.tiers.get(operation)
+        if tiers is None and operation == ServiceConstants.LLMOperations.OPENING_QUESTION:
+            tiers = self.tiers.get(ServiceConstants.LLMOperations.QUESTION)
+        return tiers or []
+    
+    def record_attempt(self, operation: str, tier: CascadeTier) -> None:
+        self._increment(self._attempts, operation, tier.name)
+    
+    def record_completion(self, operation: str, tier: CascadeTier) -> None:
+        self._increment(self._completions, operation, tier.name)
+    
+    def record_rejection(self, operation: str, tier: CascadeTier) -> None:
+        self._increment(self._rejections, operation, tier.name)
+    
+    def stats(self) -> Dict[str, Any]:
+        result: Dict[str, Any] = {}
+        for operation, attempts_by_tier in self._attempts.items():
+            completions_by_tier = self._completions.get(operation, {})
+            rejections_by_tier = self._rejections.get(operation, {})
+            total_completions = sum(completions_by_tier.values())
+            result[operation] = {
+                tier_name: {
+                    "attempts": attempts,
+                    "completions": completions_by_tier.get(tier_name, 0),
+                    "rejections": rejections_by_tier.get(tier_name, 0),
+                    "hit_rate": round(completions_by_tier.get(tier_name, 0) / total_completions, 4)
+                    if total_completions else 0.0,
+                }
+                for tier_name, attempts in attempts_by_tier.items()
+            }
+        return result
+    
+    @staticmethod
+    def _increment(counters: Dict[str, Dict[str, int]], operation: str, tier_name: str) -> None:
+        by_tier = counters.setdefault(operation, {})
+        by_tier[tier_name] = by_tier.get(tier_name, 0) + 1
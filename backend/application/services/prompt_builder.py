@@ -1,42 +1,43 @@
 from typing import List, Optional
-from application.services.llm_data import QuestionData, AnswerData
+from application.services.llm_data import QuestionData, AnswerData, ChatMessage
 from application.services.prompt_loader import PromptLoader
+from application.services.context_compactor import ContextCompactor
 
 
 class PromptBuilder:
     
-    def __init__(self, prompt_loader: PromptLoader):
+    def __init__(self, prompt_loader: PromptLoader, context_compactor: Optional[ContextCompactor] = None):
         self.prompt_loader = prompt_loader
+        self.context_compactor = context_compactor
     
-    @staticmethod
     def build_question_context(
+        self,
         topic: str,
         existing_questions: Optional[List[QuestionData]],
         previous_answers: Optional[List[AnswerData]],
     ) -> str:
-        context_parts = [f"Interview topic: {topic}"]
-        
-        if existing_questions:
-            context_parts.append("\nPreviously asked questions:")
-            for question in existing_questions:
-                context_parts.append(f"- {question.text}")
-        
-        if previous_answers:
-            context_parts.append("\nPrevious answers:")
-            for answer in previous_answers:
-                context_parts.append(f"- {answer.text}")
+        if self.context_compactor:
+            reserved_tokens = sum(
+                self.context_compactor.estimate_tokens(message.content)
+                for message in self.build_question_prompt("")
+            )
+            return self.context_compactor.build(topic, existing_questions, previous_answers, reserved_tokens)
         
-        return "\n".join(context_parts)
+        return ContextCompactor.render(
+            topic,
+            [question.text for question in existing_questions or []],
+            [answer.text for answer in previous_answers or []],
+        )
     
-    def build_question_prompt(self, context: str) -> str:
-        return self.prompt_loader.render_template("question_prompt", context=context)
+    def build_question_prompt(self, context: str) -> List[ChatMessage]:
+        return self.prompt_loader.render_messages("question_prompt", context=context)
     
     def build_summary_prompt(
         self,
         topic: str,
         questions: List[QuestionData],
         answers: List[AnswerData],
-    ) -> str:
+    ) -> List[ChatMessage]:
         sorted_questions = sorted(questions, key=lambda question: question.question_order)
         answer_map = {answer.question_id: answer for answer in answers}
         
@@ -48,4 +49,7 @@ class PromptBuilder:
         
         qa_text = "\n\n".join(qa_pairs)
         
-        return self.prompt_loader.render_template("summary_prompt", topic=topic, qa_text=qa_text)
+        return self.prompt_loader.render_messages("summary_prompt", topic=topic, qa_text=qa_text)
+    
+    def build_summary_repair_prompt(self, response_text: str) -> List[ChatMessage]:
+        return self.prompt_loader.render_messages("summary_repair_prompt", response_text=response_text)
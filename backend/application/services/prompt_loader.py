@@ -1,5 +1,7 @@
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional
+
+from application.services.llm_data import ChatMessage
 
 
 class PromptLoader:
@@ -28,3 +30,15 @@ class PromptLoader:
     def render_template(self, template_name: str, **kwargs) -> str:
         template = self.load_template(template_name)
         return template.format(**kwargs)
+    
+    def render_messages(self, template_name: str, **kwargs) -> List[ChatMessage]:
+        try:
+            system_template = self.load_template(f"{template_name}_system")
+            user_template = self.load_template(f"{template_name}_user")
+        except FileNotFoundError:
+            return [ChatMessage(role="user", content=self.render_template(template_name, **kwargs))]
+        
+        return [
+            ChatMessage(role="system", content=system_template.format(**kwargs)),
+            ChatMessage(role="user", content=user_template.format(**kwargs)),
+        ]
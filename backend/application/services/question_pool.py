@@ -0,0 +1,57 @@
+from collections import deque
+from typing import Any, Deque, Dict, Optional
+
+from application.exceptions import LlmServiceError
+from application.services.llm_orchestrator import LLMOrchestrator
+from application.services.service_constants import ServiceConstants
+
+
+class QuestionPool:
+    
+    def __init__(self, pool_size: int):
+        self.pool_size = pool_size
+        self._questions: Dict[str, Deque[str]] = {}
+        self.hits = 0
+        self.misses = 0
+    
+    @staticmethod
+    def _normalize_topic(topic: str) -> str:
+        return " ".join(topic.lower().split())
+    
+    def pop(self, topic: str) -> Optional[str]:
+        questions = self._questions.get(self._normalize_topic(topic))
+        if questions:
+            self.hits += 1
+            return questions.popleft()
+        self.misses += 1
+        return None
+    
+    async def refill(self, topic: str, llm_orchestrator: LLMOrchestrator) -> int:
+        questions = self._questions.setdefault(self._normalize_topic(topic), deque())
+        added = 0
+        attempts = 0
+        
+        while len(questions) < self.pool_size and attempts < self.pool_size * 2:
+            attempts += 1
+            try:
+                question_text = await llm_orchestrator.generate_question(
+                    topic=topic,
+                    operation=ServiceConstants.LLMOperations.OPENING_QUESTION,
+                )
+            except LlmServiceError:
+                break
+            if question_text and question_text not in questions:
+                questions.append(question_text)
+                added += 1
+        
+        return added
+    
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "topics": len(self._questions),
+            "questions": sum(len(questions) for questions in self._questions.values()),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+        }
@@ -0,0 +1,93 @@
+import asyncio
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+from uuid import UUID
+
+from application.exceptions import LlmServiceError
+from application.services.llm_data import QuestionData, AnswerData
+from application.services.llm_orchestrator import LLMOrchestrator
+
+
+class QuestionPrefetcher:
+    
+    def __init__(self, llm_orchestrator: LLMOrchestrator, max_pending: int):
+        self.llm_orchestrator = llm_orchestrator
+        self.max_pending = max_pending
+        self._pending: "OrderedDict[UUID, Tuple[int, int, asyncio.Task]]" = OrderedDict()
+        self.scheduled = 0
+        self.hits = 0
+        self.misses = 0
+    
+    def schedule(
+        self,
+        interview_id: UUID,
+        topic: str,
+        questions: List[QuestionData],
+        answers: List[AnswerData],
+    ) -> None:
+        self.discard(interview_id)
+        
+        task = asyncio.create_task(self.llm_orchestrator.generate_question(
+            topic=topic,
+            existing_questions=questions or None,
+            previous_answers=answers or None,
+        ))
+        task.add_done_callback(self._consume_task_result)
+        self._pending[interview_id] = (len(questions), len(answers), task)
+        self.scheduled += 1
+        
+        while len(self._pending) > self.max_pending:
+            _, (_, _, evicted_task) = self._pending.popitem(last=False)
+            evicted_task.cancel()
+    
+    async def take(self, interview_id: UUID, question_count: int, answer_count: int) -> Optional[str]:
+        entry = self._pending.pop(interview_id, None)
+        if entry is None:
+            self.misses += 1
+            return None
+        
+        expected_question_count, expected_answer_count, task = entry
+        if (expected_question_count, expected_answer_count) != (question_count, answer_count):
+            task.cancel()
+            self.misses += 1
+            return None
+        
+        try:
+            question_text = await task
+        except LlmServiceError:
+            self.misses += 1
+            return None
+        except asyncio.CancelledError:
+            current_task = asyncio.current_task()
+            if not task.cancelled() or (current_task is not None and current_task.cancelling()):
+                raise
+            self.misses += 1
+            return None
+        
+        self.hits += 1
+        return question_text
+    
+    def discard(self, interview_id: UUID) -> None:
+        entry = self._pending.pop(interview_id, None)
+        if entry is not None:
+            entry[2].cancel()
+    
+    def clear(self) -> None:
+        while self._pending:
+            _, (_, _, task) = self._pending.popitem(last=False)
+            task.cancel()
+    
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "pending": len(self._pending),
+            "scheduled": self.scheduled,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+        }
+    
+    @staticmethod
+    def _consume_task_result(task: asyncio.Task) -> None:
+        if not task.cancelled():
+            task.exception()
@@ -0,0 +1,39 @@
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, Optional
+
+_expires_at: ContextVar[Optional[float]] = ContextVar("request_deadline_expires_at", default=None)
+
+
+class RequestDeadline:
+    
+    @staticmethod
+    @contextmanager
+    def scope(seconds: Optional[float]) -> Iterator[None]:
+        if seconds is None:
+            yield
+            return
+        
+        expires_at = time.monotonic() + seconds
+        current = _expires_at.get()
+        if current is not None:
+            expires_at = min(expires_at, current)
+        
+        token = _expires_at.set(expires_at)
+        try:
+            yield
+        finally:
+            _expires_at.reset(token)
+    
+    @staticmethod
+    def remaining() -> Optional[float]:
+        expires_at = _expires_at.get()
+        if expires_at is None:
+            return None
+        return max(expires_at - time.monotonic(), 0.0)
+    
+    @classmethod
+    def allows(cls, seconds: float) -> bool:
+        remaining = cls.remaining()
+        return remaining is None or remaining >= seconds
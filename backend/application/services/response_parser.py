@@ -1,6 +1,7 @@
 import json
 from typing import Dict, Any
 from application.exceptions import ValidationException
+from application.services.json_repairer import JsonRepairer
 from application.services.service_constants import ServiceConstants
 
 
@@ -20,7 +21,12 @@ class ResponseParser:
                 cleaned_text = cleaned_text[:-parser_consts.CODE_BLOCK_PREFIX_LENGTH]
             cleaned_text = cleaned_text.strip()
             
-            summary_data = json.loads(cleaned_text)
+            try:
+                summary_data = json.loads(cleaned_text)
+            except json.JSONDecodeError:
+                summary_data = JsonRepairer.extract_object(cleaned_text)
+                if summary_data is None:
+                    raise
             
             sentiment_score = summary_data.get("sentiment_score")
             if sentiment_score is None:
@@ -50,5 +56,5 @@ class ResponseParser:
                 "missing_information": missing_information,
                 "full_summary_text": summary_data.get("full_summary_text", ""),
             }
-        except (json.JSONDecodeError, KeyError, ValueError) as e:
+        except (json.JSONDecodeError, KeyError, ValueError, TypeError, AttributeError) as e:
             raise ValidationException(f"Failed to parse summary response: {str(e)}")
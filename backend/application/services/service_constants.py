@@ -9,8 +9,33 @@ class ServiceConstants:
     
     class LLMClient:
         DEFAULT_TIMEOUT_SECONDS = 30.0
+        PREWARM_TIMEOUT_SECONDS = 5.0
         MAX_RETRY_ATTEMPTS = 3
         RETRY_WAIT_MULTIPLIER = 1
         RETRY_WAIT_MIN_SECONDS = 1
         RETRY_WAIT_MAX_SECONDS = 60
         ERROR_TEXT_TRUNCATE_LENGTH = 200
+        RATE_LIMIT_STATUS_CODE = 429
+        CHARS_PER_TOKEN = 4
+        RETRYABLE_STATUS_CODES = [429, 500, 502, 503, 504]
+        JSON_RESPONSE_FORMAT = "json_object"
+        JSON_MODE_REJECTED_STATUS_CODES = [400, 422]
+        STREAM_DATA_PREFIX = "data:"
+        STREAM_DONE_MARKER = "[DONE]"
+    
+    class LLMBatch:
+        ENDPOINT = "/v1/chat/completions"
+        FILE_PURPOSE = "batch"
+        INPUT_FILE_NAME = "batch_input.jsonl"
+        COMPLETED_STATUS = "completed"
+        FINISHED_STATUSES = ["completed", "failed", "expired", "cancelled"]
+    
+    class ModelCascade:
+        MIN_QUESTION_WORDS = 4
+        MAX_QUESTION_WORDS = 45
+    
+    class LLMOperations:
+        QUESTION = "question"
+        OPENING_QUESTION = "opening_question"
+        SUMMARY = "summary"
+        SUMMARY_REPAIR = "summary_repair"
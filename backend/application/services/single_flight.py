@@ -0,0 +1,109 @@
+import asyncio
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Hashable
+
+from application.dtos import StreamEventDTO
+from application.exceptions import LlmServiceError
+
+
+class _Flight:
+    
+    def __init__(self, task: asyncio.Task):
+        self.task = task
+        self.waiters = 0
+
+
+class SingleFlight:
+    
+    def __init__(self):
+        self._calls: Dict[Hashable, _Flight] = {}
+        self.leaders = 0
+        self.coalesced = 0
+    
+    async def do(self, key: Hashable, func: Callable[[], Awaitable[Any]]) -> Any:
+        flight = self._calls.get(key)
+        if flight is None:
+            flight = self._begin(key, asyncio.ensure_future(func()))
+        else:
+            self.coalesced += 1
+        
+        flight.waiters += 1
+        try:
+            return await asyncio.shield(flight.task)
+        finally:
+            self._leave(key, flight)
+    
+    async def stream(
+        self,
+        key: Hashable,
+        func: Callable[[], AsyncIterator[StreamEventDTO]],
+        result_event: str,
+    ) -> AsyncIterator[StreamEventDTO]:
+        flight = self._calls.get(key)
+        if flight is not None:
+            self.coalesced += 1
+            flight.waiters += 1
+            try:
+                result = await asyncio.shield(flight.task)
+            finally:
+                self._leave(key, flight)
+            yield StreamEventDTO(event=result_event, data=result)
+            return
+        
+        events: asyncio.Queue = asyncio.Queue()
+        flight = self._begin(key, asyncio.ensure_future(self._relay(func(), result_event, events)))
+        flight.waiters += 1
+        try:
+            while True:
+                event = await events.get()
+                if event is None:
+                    break
+                yield event
+            await asyncio.shield(flight.task)
+        finally:
+            self._leave(key, flight)
+    
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "in_flight": len(self._calls),
+            "leaders": self.leaders,
+            "coalesced": self.coalesced,
+        }
+    
+    def _begin(self, key: Hashable, task: asyncio.Task) -> _Flight:
+        flight = _Flight(task)
+        task.add_done_callback(lambda _: self._forget(key, flight))
+        self._calls[key] = flight
+        self.leaders += 1
+        return flight
+    
+    def _leave(self, key: Hashable, flight: _Flight) -> None:
+        flight.waiters -= 1
+        if flight.waiters == 0 and not flight.task.done():
+            self._forget(key, flight)
+            flight.task.cancel()
+    
+    def _forget(self, key: Hashable, flight: _Flight) -> None:
+        if self._calls.get(key) is flight:
+            del self._calls[key]
+        if flight.task.done() and not flight.task.cancelled():
+            flight.task.exception()
+    
+    @staticmethod
+    async def _relay(
+        source: AsyncIterator[StreamEventDTO],
+        result_event: str,
+        events: asyncio.Queue,
+    ) -> Any:
+        found = False
+        result = None
+        try:
+            async for event in source:
+                events.put_nowait(event)
+                if event.event == result_event:
+                    found = True
+                    result = event.data
+        finally:
+            events.put_nowait(None)
+        if not found:
+            raise LlmServiceError("Generation ended without a result")
+        return result
@@ -7,6 +7,8 @@ from application.use_cases.submit_answer_use_case import SubmitAnswerUseCase
 from application.use_cases.get_answer_use_case import GetAnswerUseCase
 from application.use_cases.generate_summary_use_case import GenerateSummaryUseCase
 from application.use_cases.get_summary_use_case import GetSummaryUseCase
+from application.use_cases.batch_summary_use_case import BatchSummaryUseCase
+from application.use_cases.get_interview_progress_use_case import GetInterviewProgressUseCase
 
 __all__ = [
     "CreateInterviewUseCase",
@@ -18,4 +20,6 @@ __all__ = [
     "GetAnswerUseCase",
     "GenerateSummaryUseCase",
     "GetSummaryUseCase",
+    "BatchSummaryUseCase",
+    "GetInterviewProgressUseCase",
 ]
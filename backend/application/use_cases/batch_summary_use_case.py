@@ -0,0 +1,121 @@
+from typing import Dict, List, Optional
+from uuid import UUID
+
+from sqlalchemy.exc import SQLAlchemyError
+
+from application.repository_interfaces import (
+    InterviewRepository,
+    AnswerRepository,
+    InterviewSummaryRepository,
+    QuestionRepository,
+)
+from application.services.batch_llm_client import BatchLLMClient
+from application.services.llm_client import LLMPrompt
+from application.services.llm_data import BatchJobStatus
+from application.services.llm_orchestrator import LLMOrchestrator
+from application.services.service_constants import ServiceConstants
+from application.dtos import SubmitBatchSummaryDTO, BatchSummaryJobDTO
+from application.exceptions import (
+    NotFoundException,
+    BusinessRuleException,
+    ValidationException,
+    NoPendingSummariesException,
+    LlmServiceError,
+)
+from application.use_cases.generate_summary_use_case import GenerateSummaryUseCase
+
+
+class BatchSummaryUseCase(GenerateSummaryUseCase):
+    
+    def __init__(
+        self,
+        interview_repository: InterviewRepository,
+        answer_repository: AnswerRepository,
+        summary_repository: InterviewSummaryRepository,
+        question_repository: QuestionRepository,
+        llm_orchestrator: LLMOrchestrator,
+        batch_client: BatchLLMClient,
+    ):
+        super().__init__(
+            interview_repository,
+            answer_repository,
+            summary_repository,
+            question_repository,
+            llm_orchestrator,
+        )
+        self.batch_client = batch_client
+    
+    async def submit(self, dto: SubmitBatchSummaryDTO) -> BatchSummaryJobDTO:
+        if dto.interview_ids:
+            interview_ids = dto.interview_ids
+        else:
+            interview_ids = [interview.interview_id for interview in await self.interview_repository.get_all()]
+        
+        prompts: Dict[str, LLMPrompt] = {}
+        for interview_id in interview_ids:
+            if await self.summary_repository.get_by_interview_id(interview_id):
+                continue
+            try:
+                interview, question_data_list, answer_data_list, _ = await self._load_interview_data(interview_id)
+            except (NotFoundException, BusinessRuleException):
+                continue
+            prompts[str(interview_id)] = self.llm_orchestrator.build_summary_prompt(
+                interview_topic=interview.topic,
+                answers=answer_data_list,
+                questions=question_data_list,
+            )
+        
+        if not prompts:
+            raise NoPendingSummariesException()
+        
+        operation = ServiceConstants.LLMOperations.SUMMARY
+        batch_status = await self.batch_client.submit(prompts, operation, self.llm_orchestrator.get_profile(operation))
+        return self._to_job_dto(batch_status, [UUID(custom_id) for custom_id in prompts])
+    
+    async def collect(self, batch_id: str) -> BatchSummaryJobDTO:
+        batch_status = await self.batch_client.get_status(batch_id)
+        if not batch_status.is_completed:
+            return self._to_job_dto(batch_status)
+        
+        results = await self.batch_client.get_results(batch_id)
+        job = self._to_job_dto(batch_status)
+        
+        for custom_id, result in results.items():
+            interview_id = self._parse_custom_id(custom_id)
+            if interview_id is None or result.error is not None or result.content is None:
+                job.errors += 1
+                continue
+            job.interview_ids.append(interview_id)
+            
+            try:
+                if await self.summary_repository.get_by_interview_id(interview_id):
+                    job.skipped += 1
+                    continue
+                interview, _, _, scores = await self._load_interview_data(interview_id)
+                llm_summary_dict = await self.llm_orchestrator.parse_summary(result.content)
+                summary = self._build_summary(interview_id, llm_summary_dict, scores)
+                await self._save_summary(interview, summary)
+            except (NotFoundException, BusinessRuleException, ValidationException, LlmServiceError, SQLAlchemyError):
+                job.errors += 1
+                continue
+            job.ingested += 1
+        
+        return job
+    
+    @staticmethod
+    def _to_job_dto(batch_status: BatchJobStatus, interview_ids: Optional[List[UUID]] = None) -> BatchSummaryJobDTO:
+        return BatchSummaryJobDTO(
+            batch_id=batch_status.batch_id,
+            status=batch_status.status,
+            total=batch_status.total,
+            completed=batch_status.completed,
+            failed=batch_status.failed,
+            interview_ids=interview_ids or [],
+        )
+    
+    @staticmethod
+    def _parse_custom_id(custom_id: str) -> Optional[UUID]:
+        try:
+            return UUID(custom_id)
+        except ValueError:
+            return None
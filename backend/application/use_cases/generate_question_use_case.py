@@ -1,11 +1,18 @@
-from domain.entities import Question
+from typing import AsyncIterator, List, Optional, Tuple
+from uuid import UUID
+
+from domain.entities import Interview, Question
 from domain.enums import InterviewStatus
 
 from application.repository_interfaces import QuestionRepository, InterviewRepository, AnswerRepository
 from application.services.llm_orchestrator import LLMOrchestrator
+from application.services.question_pool import QuestionPool
+from application.services.question_prefetcher import QuestionPrefetcher
+from application.services.single_flight import SingleFlight
 from application.services.llm_data import QuestionData, AnswerData
-from application.dtos import GenerateQuestionDTO
+from application.dtos import GenerateQuestionDTO, StreamEventDTO
 from application.exceptions import (
+    LlmServiceError,
     InterviewNotFoundException,
     InterviewAlreadyCompletedException,
     MaxQuestionsReachedException,
@@ -21,14 +28,115 @@ class GenerateQuestionUseCase:
         answer_repository: AnswerRepository,
         llm_orchestrator: LLMOrchestrator,
         max_questions_per_interview: int,
+        question_pool: Optional[QuestionPool] = None,
+        question_prefetcher: Optional[QuestionPrefetcher] = None,
+        single_flight: Optional[SingleFlight] = None,
     ):
         self.question_repository = question_repository
         self.interview_repository = interview_repository
         self.answer_repository = answer_repository
         self.llm_orchestrator = llm_orchestrator
         self.max_questions_per_interview = max_questions_per_interview
+        self.question_pool = question_pool
+        self.question_prefetcher = question_prefetcher
+        self.single_flight = single_flight
     
     async def execute(self, dto: GenerateQuestionDTO) -> Question:
+        if self.single_flight is None:
+            return await self._generate(dto)
+        return await self.single_flight.do(self._flight_key(dto.interview_id), lambda: self._generate(dto))
+    
+    async def execute_stream(self, dto: GenerateQuestionDTO) -> AsyncIterator[StreamEventDTO]:
+        interview, next_order, question_data_list, answer_data_list = await self._prepare(dto)
+        
+        def stream_question() -> AsyncIterator[StreamEventDTO]:
+            return self._stream_question(
+                dto.interview_id, interview.topic, next_order, question_data_list, answer_data_list
+            )
+        
+        if self.single_flight is None:
+            return stream_question()
+        return self.single_flight.stream(self._flight_key(dto.interview_id), stream_question, "question")
+    
+    @staticmethod
+    def _flight_key(interview_id: UUID) -> Tuple[str, UUID]:
+        return ("question", interview_id)
+    
+    async def _generate(self, dto: GenerateQuestionDTO) -> Question:
+        interview, next_order, question_data_list, answer_data_list = await self._prepare(dto)
+        
+        question_text = await self._take_ready_question(
+            dto.interview_id, interview.topic, question_data_list, answer_data_list
+        )
+        if not question_text:
+            question_text = await self.llm_orchestrator.generate_question(
+                topic=interview.topic,
+                existing_questions=question_data_list,
+                previous_answers=answer_data_list,
+            )
+        
+        question = Question(
+            text=question_text,
+            interview_id=dto.interview_id,
+            question_order=next_order,
+        )
+        
+        return await self.question_repository.create(question)
+    
+    async def _stream_question(
+        self,
+        interview_id: UUID,
+        topic: str,
+        next_order: int,
+        question_data_list: Optional[List[QuestionData]],
+        answer_data_list: Optional[List[AnswerData]],
+    ) -> AsyncIterator[StreamEventDTO]:
+        chunks = []
+        ready_question = await self._take_ready_question(
+            interview_id, topic, question_data_list, answer_data_list
+        )
+        if ready_question:
+            chunks.append(ready_question)
+            yield StreamEventDTO(event="token", data=ready_question)
+        else:
+            async for chunk in self.llm_orchestrator.stream_question(
+                topic=topic,
+                existing_questions=question_data_list,
+                previous_answers=answer_data_list,
+            ):
+                chunks.append(chunk)
+                yield StreamEventDTO(event="token", data=chunk)
+        
+        question_text = "".join(chunks).strip()
+        if not question_text:
+            raise LlmServiceError("LLM returned an empty question")
+        
+        question = Question(
+            text=question_text,
+            interview_id=interview_id,
+            question_order=next_order,
+        )
+        created_question = await self.question_repository.create(question)
+        yield StreamEventDTO(event="question", data=created_question)
+    
+    async def _take_ready_question(
+        self,
+        interview_id: UUID,
+        topic: str,
+        question_data_list: Optional[List[QuestionData]],
+        answer_data_list: Optional[List[AnswerData]],
+    ) -> Optional[str]:
+        if not question_data_list:
+            return self.question_pool.pop(topic) if self.question_pool else None
+        if self.question_prefetcher is None:
+            return None
+        return await self.question_prefetcher.take(
+            interview_id, len(question_data_list), len(answer_data_list or [])
+        )
+    
+    async def _prepare(
+        self, dto: GenerateQuestionDTO
+    ) -> Tuple[Interview, int, Optional[List[QuestionData]], Optional[List[AnswerData]]]:
         interview = await self.interview_repository.get_by_id(dto.interview_id)
         if not interview:
             raise InterviewNotFoundException(dto.interview_id)
@@ -59,16 +167,4 @@ class GenerateQuestionUseCase:
             for answer in previous_answers
         ] if previous_answers else None
         
-        question_text = await self.llm_orchestrator.generate_question(
-            topic=interview.topic,
-            existing_questions=question_data_list,
-            previous_answers=answer_data_list,
-        )
-        
-        question = Question(
-            text=question_text,
-            interview_id=dto.interview_id,
-            question_order=next_order,
-        )
-        
-        return await self.question_repository.create(question)
+        return interview, next_order, question_data_list, answer_data_list
@@ -1,8 +1,9 @@
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
 from uuid import UUID
 
 from pydantic import ValidationError
 
-from domain.entities import InterviewSummary
+from domain.entities import Answer, Interview, InterviewSummary
 from domain.enums import InterviewStatus
 
 from application.repository_interfaces import (
@@ -13,10 +14,11 @@ from application.repository_interfaces import (
 )
 from application.services.llm_orchestrator import LLMOrchestrator
 from application.services.llm_data import QuestionData, AnswerData
-from application.dtos import LlmSummaryResponseDTO
+from application.services.incremental_json_parser import IncrementalJsonParser
+from application.services.single_flight import SingleFlight
+from application.dtos import LlmSummaryResponseDTO, StreamEventDTO
 from application.exceptions import InterviewNotFoundException, NoAnswersFoundException, ValidationException
-from application.analysis.answer_evaluator import AnswerEvaluator
-from application.analysis.scoring import ScoringCalculator
+from application.analysis import AnswerEvaluator, ScoringCalculator
 
 
 class GenerateSummaryUseCase:
@@ -28,14 +30,72 @@ class GenerateSummaryUseCase:
         summary_repository: InterviewSummaryRepository,
         question_repository: QuestionRepository,
         llm_orchestrator: LLMOrchestrator,
+        single_flight: Optional[SingleFlight] = None,
     ):
         self.interview_repository = interview_repository
         self.answer_repository = answer_repository
         self.summary_repository = summary_repository
         self.question_repository = question_repository
         self.llm_orchestrator = llm_orchestrator
+        self.single_flight = single_flight
     
     async def execute(self, interview_id: UUID) -> InterviewSummary:
+        if self.single_flight is None:
+            return await self._generate(interview_id)
+        return await self.single_flight.do(self._flight_key(interview_id), lambda: self._generate(interview_id))
+    
+    async def execute_stream(self, interview_id: UUID) -> AsyncIterator[StreamEventDTO]:
+        interview, question_data_list, answer_data_list, scores = await self._load_interview_data(interview_id)
+        
+        def stream_summary() -> AsyncIterator[StreamEventDTO]:
+            return self._stream_summary(interview, question_data_list, answer_data_list, scores)
+        
+        if self.single_flight is None:
+            return stream_summary()
+        return self.single_flight.stream(self._flight_key(interview_id), stream_summary, "summary")
+    
+    @staticmethod
+    def _flight_key(interview_id: UUID) -> Tuple[str, UUID]:
+        return ("summary", interview_id)
+    
+    async def _generate(self, interview_id: UUID) -> InterviewSummary:
+        interview, question_data_list, answer_data_list, scores = await self._load_interview_data(interview_id)
+        
+        llm_summary_dict = await self.llm_orchestrator.generate_summary(
+            interview_topic=interview.topic,
+            answers=answer_data_list,
+            questions=question_data_list,
+        )
+        
+        summary = self._build_summary(interview_id, llm_summary_dict, scores)
+        return await self._save_summary(interview, summary)
+    
+    async def _stream_summary(
+        self,
+        interview: Interview,
+        question_data_list: List[QuestionData],
+        answer_data_list: List[AnswerData],
+        scores: Dict[str, float],
+    ) -> AsyncIterator[StreamEventDTO]:
+        yield StreamEventDTO(event="scores", data=scores)
+        
+        parser = IncrementalJsonParser()
+        async for chunk in self.llm_orchestrator.stream_summary(
+            interview_topic=interview.topic,
+            answers=answer_data_list,
+            questions=question_data_list,
+        ):
+            for name, value in parser.feed(chunk):
+                yield StreamEventDTO(event="field", data={"name": name, "value": value})
+        
+        llm_summary_dict = await self.llm_orchestrator.parse_summary(parser.text)
+        summary = self._build_summary(interview.interview_id, llm_summary_dict, scores)
+        created_summary = await self._save_summary(interview, summary)
+        yield StreamEventDTO(event="summary", data=created_summary)
+    
+    async def _load_interview_data(
+        self, interview_id: UUID
+    ) -> Tuple[Interview, List[QuestionData], List[AnswerData], Dict[str, float]]:
         interview = await self.interview_repository.get_by_id(interview_id)
         if not interview:
             raise InterviewNotFoundException(interview_id)
@@ -56,36 +116,40 @@ class GenerateSummaryUseCase:
             for answer in answers
         ]
         
-        llm_summary_dict = await self.llm_orchestrator.generate_summary(
-            interview_topic=interview.topic,
-            answers=answer_data_list,
-            questions=question_data_list,
-        )
-        
+        return interview, question_data_list, answer_data_list, self._calculate_local_scores(answers)
+    
+    @staticmethod
+    def _calculate_local_scores(answers: List[Answer]) -> Dict[str, float]:
+        return ScoringCalculator.aggregate_evaluations([AnswerEvaluator.evaluate_answer(answer) for answer in answers])
+    
+    @staticmethod
+    def _build_summary(
+        interview_id: UUID,
+        llm_summary_dict: Dict[str, Any],
+        scores: Dict[str, float],
+    ) -> InterviewSummary:
         try:
             llm_summary = LlmSummaryResponseDTO(**llm_summary_dict)
         except ValidationError as e:
             raise ValidationException(f"Invalid LLM response: {e.error_count()} validation error(s)") from e
         
-        evaluation_result = AnswerEvaluator.evaluate_all_answers(answer_data_list)
-        scoring_result = ScoringCalculator.calculate_all_scores(answer_data_list)
-        
-        summary = InterviewSummary(
+        return InterviewSummary(
             interview_id=interview_id,
             themes=llm_summary.themes,
             key_points=llm_summary.key_points,
             sentiment_score=llm_summary.sentiment_score,
             sentiment_label=llm_summary.sentiment_label.value,
-            confidence_score=evaluation_result['confidence_score'],
-            clarity_score=evaluation_result['clarity_score'],
+            confidence_score=scores['confidence_score'],
+            clarity_score=scores['clarity_score'],
             strengths=llm_summary.strengths,
             weaknesses=llm_summary.weaknesses,
-            consistency_score=scoring_result['consistency_score'],
+            consistency_score=scores['consistency_score'],
             missing_information=llm_summary.missing_information,
-            overall_usefulness=scoring_result['overall_usefulness'],
+            overall_usefulness=scores['overall_usefulness'],
             full_summary_text=llm_summary.full_summary_text,
         )
-        
+    
+    async def _save_summary(self, interview: Interview, summary: InterviewSummary) -> InterviewSummary:
         created_summary = await self.summary_repository.create(summary)
         
         if interview.status != InterviewStatus.COMPLETED:
@@ -0,0 +1,36 @@
+from uuid import UUID
+
+from application.repository_interfaces import AnswerRepository, InterviewRepository
+from application.dtos import InterviewProgressDTO
+from application.exceptions import InterviewNotFoundException
+from application.analysis import InterviewStatistics
+from application.analysis.scoring_constants import ScoringConstants
+
+
+class GetInterviewProgressUseCase:
+    
+    def __init__(
+        self,
+        interview_repository: InterviewRepository,
+        answer_repository: AnswerRepository,
+    ):
+        self.interview_repository = interview_repository
+        self.answer_repository = answer_repository
+    
+    async def execute(self, interview_id: UUID) -> InterviewProgressDTO:
+        interview = await self.interview_repository.get_by_id(interview_id)
+        if not interview:
+            raise InterviewNotFoundException(interview_id)
+        
+        if not interview.has_answer_statistics:
+            answers = await self.answer_repository.get_by_interview_id(interview_id)
+            InterviewStatistics.rebuild(interview, answers)
+            await self.interview_repository.replace_answer_statistics(interview)
+        
+        return InterviewProgressDTO(
+            interview_id=interview.interview_id,
+            status=interview.status.value,
+            answer_count=interview.answer_count,
+            average_word_count=round(interview.word_count_mean, ScoringConstants.SCORE_PRECISION),
+            **InterviewStatistics.scores(interview),
+        )
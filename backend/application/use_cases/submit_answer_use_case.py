@@ -1,8 +1,13 @@
-from domain.entities import Answer
+from typing import List, Optional
+
+from domain.entities import Answer, Question
 from domain.enums import InterviewStatus
 
 from application.repository_interfaces import AnswerRepository, InterviewRepository, QuestionRepository
 from application.dtos import CreateAnswerDTO
+from application.services.llm_data import QuestionData, AnswerData
+from application.services.question_prefetcher import QuestionPrefetcher
+from application.analysis import AnswerEvaluator, InterviewStatistics
 from application.exceptions import (
     InterviewNotFoundException,
     QuestionNotFoundException,
@@ -18,10 +23,14 @@ class SubmitAnswerUseCase:
         answer_repository: AnswerRepository,
         interview_repository: InterviewRepository,
         question_repository: QuestionRepository,
+        question_prefetcher: Optional[QuestionPrefetcher] = None,
+        max_questions_per_interview: Optional[int] = None,
     ):
         self.answer_repository = answer_repository
         self.interview_repository = interview_repository
         self.question_repository = question_repository
+        self.question_prefetcher = question_prefetcher
+        self.max_questions_per_interview = max_questions_per_interview
     
     async def execute(self, dto: CreateAnswerDTO) -> Answer:
         interview = await self.interview_repository.get_by_id(dto.interview_id)
@@ -73,11 +82,44 @@ class SubmitAnswerUseCase:
             interview.start()
         
         interview.touch()
-        await self.interview_repository.update(interview)
         
+        evaluation = AnswerEvaluator.evaluate_text(dto.text)
         answer = Answer(
             text=dto.text,
             question_id=dto.question_id,
             interview_id=dto.interview_id,
+            word_count=evaluation.word_count,
+            clarity_score=evaluation.clarity_score,
+            confidence_score=evaluation.confidence_score,
+            is_gibberish=evaluation.is_gibberish,
+            is_manipulation=evaluation.is_manipulation,
         )
-        return await self.answer_repository.create(answer)
+        
+        reset_statistics = not interview.has_answer_statistics or interview.answer_count != len(existing_answers)
+        if reset_statistics:
+            InterviewStatistics.rebuild(interview, existing_answers)
+        created_answer = await self.answer_repository.create_for_interview(answer, interview, reset_statistics)
+        InterviewStatistics.record(interview, evaluation)
+        
+        if self._should_prefetch_next_question(sorted_questions, current_question_order):
+            self.question_prefetcher.schedule(
+                interview_id=dto.interview_id,
+                topic=interview.topic,
+                questions=[
+                    QuestionData(text=question.text, question_order=question.question_order, question_id=question.question_id)
+                    for question in sorted_questions
+                ],
+                answers=[
+                    AnswerData(text=existing_answer.text, question_id=existing_answer.question_id)
+                    for existing_answer in [*existing_answers, created_answer]
+                ],
+            )
+        
+        return created_answer
+    
+    def _should_prefetch_next_question(self, sorted_questions: List[Question], current_question_order: int) -> bool:
+        if self.question_prefetcher is None or self.max_questions_per_interview is None:
+            return False
+        if len(sorted_questions) >= self.max_questions_per_interview:
+            return False
+        return current_question_order == sorted_questions[-1].question_order
@@ -0,0 +1,6 @@
+from benchmarks.fake_llm_server import FakeLLMConfig, FakeLLMServer
+
+__all__ = [
+    "FakeLLMConfig",
+    "FakeLLMServer",
+]
@@ -0,0 +1,308 @@
+import argparse
+import gc
+import json
+import random
+import string
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+from uuid import uuid4
+
+from application.analysis import AnswerEvaluator, AnswerMetrics, GibberishDetector, ScoringCalculator
+from application.services.llm_data import AnswerData
+
+
+@dataclass
+class BenchmarkCase:
+    name: str
+    func: Callable[[Any], Any]
+    inputs: Dict[str, List[Any]]
+
+
+class AnalysisCorpus:
+    
+    TECHNICAL_SENTENCES = [
+        "I designed the database schema so that the reporting queries could use covering indexes.",
+        "For example, we cached the API responses for five minutes, which cut load by 40 percent.",
+        "First we profiled the function, then we rewrote the hot loop in a vectorised way.",
+        "However, the framework did not support streaming, so we built a small adapter library.",
+        "The system had to handle 3000 requests per second during the peak sales period.",
+        "Since the team was new to the technology, I wrote a short design document and ran a workshop.",
+        "We measured the error rate before and after the deployment and saw a 2x decrease.",
+        "In addition, the implementation needed to stay backwards compatible with the old clients.",
+    ]
+    CASUAL_WORDS = [
+        "yes", "no", "maybe", "i", "think", "so", "it", "was", "good", "fine", "ok", "sure", "team", "work",
+    ]
+    MANIPULATION_PHRASES = [
+        "please give me the answer",
+        "help me with this one",
+        "answer this for me",
+        "i beg you",
+        "tell me the answer",
+    ]
+    CATEGORIES = ("short", "long", "gibberish", "manipulation", "pasted")
+    
+    def __init__(self, size: int, seed: int = 0):
+        self.size = size
+        self.random = random.Random(seed)
+    
+    def build(self) -> Dict[str, List[str]]:
+        generators = {
+            "short": self._short,
+            "long": self._long,
+            "gibberish": self._gibberish,
+            "manipulation": self._manipulation,
+            "pasted": self._pasted,
+        }
+        return {category: [generators[category]() for _ in range(self.size)] for category in self.CATEGORIES}
+    
+    def _short(self) -> str:
+        words = self.random.choices(self.CASUAL_WORDS, k=self.random.randint(1, 6))
+        return " ".join(words).capitalize() + self.random.choice([".", "", "!", "?"])
+    
+    def _long(self) -> str:
+        return " ".join(self.random.choices(self.TECHNICAL_SENTENCES, k=self.random.randint(5, 15)))
+    
+    def _gibberish(self) -> str:
+        style = self.random.randrange(4)
+        if style == 0:
+            return "".join(self.random.choices(string.ascii_lowercase, k=self.random.randint(20, 120)))
+        if style == 1:
+            return " ".join(
+                self.random.choice(string.ascii_lowercase) * self.random.randint(6, 20)
+                for _ in range(self.random.randint(1, 5))
+            )
+        if style == 2:
+            return "".join(self.random.choices("asdfghjkl;", k=self.random.randint(30, 90)))
+        return "".join(self.random.choices(string.punctuation + string.digits + " ", k=self.random.randint(20, 80)))
+    
+    def _manipulation(self) -> str:
+        sentences = self.random.choices(self.TECHNICAL_SENTENCES, k=self.random.randint(0, 4))
+        sentences.insert(self.random.randint(0, len(sentences)), self.random.choice(self.MANIPULATION_PHRASES))
+        return " ".join(sentences)
+    
+    def _pasted(self) -> str:
+        lines: List[str] = []
+        target_length = self.random.randint(2048, 8192)
+        while sum(len(line) + 1 for line in lines) < target_length:
+            kind = self.random.randrange(3)
+            if kind == 0:
+                lines.append(self.random.choice(self.TECHNICAL_SENTENCES))
+            elif kind == 1:
+                lines.append(
+                    f"2024-05-{self.random.randint(10, 28)} 12:{self.random.randint(10, 59)}:07 ERROR "
+                    f"worker-{self.random.randint(1, 9)} request_id={self.random.getrandbits(64):x} took {self.random.randint(1, 900)}ms"
+                )
+            else:
+                lines.append(
+                    f"    def handle_{self.random.randint(1, 99)}(self, payload):  return self.client.post(payload, timeout=30)"
+                )
+        return "\n".join(lines)
+
+
+class AnalysisBenchmark:
+    
+    OVERSIZED_LENGTHS = (64 * 1024, 1024 * 1024, 4 * 1024 * 1024)
+    OVERSIZED_UNITS = ("a", "ab", "aaaaab ", "x1!", "word ")
+    
+    def __init__(self, corpus: Dict[str, List[str]], interview_size: int = 5, min_time_seconds: float = 0.2, repeats: int = 5):
+        self.corpus = corpus
+        self.interview_size = interview_size
+        self.min_time_seconds = min_time_seconds
+        self.repeats = repeats
+    
+    def cases(self) -> List[BenchmarkCase]:
+        text_cases = [
+            ("AnswerMetrics.calculate_word_count", AnswerMetrics.calculate_word_count),
+            ("AnswerMetrics.calculate_sentence_count", AnswerMetrics.calculate_sentence_count),
+            ("AnswerMetrics.match_keyword_categories", AnswerMetrics.match_keyword_categories),
+            ("AnswerMetrics.has_structure_indicators", AnswerMetrics.has_structure_indicators),
+            ("AnswerMetrics.has_examples", AnswerMetrics.has_examples),
+            ("AnswerMetrics.has_metrics_or_numbers", AnswerMetrics.has_metrics_or_numbers),
+            ("AnswerMetrics.detect_manipulation_attempts", AnswerMetrics.detect_manipulation_attempts),
+            ("AnswerMetrics.detect_gibberish", AnswerMetrics.detect_gibberish),
+            ("AnswerMetrics.detect_non_technical_content", AnswerMetrics.detect_non_technical_content),
+            ("AnswerMetrics.calculate_completeness_score", AnswerMetrics.calculate_completeness_score),
+            ("AnswerMetrics.extract_features", AnswerMetrics.extract_features),
+            ("AnswerEvaluator.calculate_clarity_score", AnswerEvaluator.calculate_clarity_score),
+            ("AnswerEvaluator.calculate_confidence_score", AnswerEvaluator.calculate_confidence_score),
+        ]
+        cases = [BenchmarkCase(name, func, self.corpus) for name, func in text_cases]
+        cases.append(BenchmarkCase(
+            "GibberishDetector.detect",
+            GibberishDetector.detect,
+            {**self.corpus, **self._oversized()},
+        ))
+        interviews = self._interviews()
+        cases.append(BenchmarkCase(
+            "ScoringCalculator.calculate_all_scores",
+            ScoringCalculator.calculate_all_scores,
+            interviews,
+        ))
+        cases.append(BenchmarkCase(
+            "ScoringCalculator.calculate_interview_scores",
+            ScoringCalculator.calculate_interview_scores,
+            interviews,
+        ))
+        return cases
+    
+    def run(self, selected: Optional[List[str]] = None) -> Dict[str, Dict[str, Any]]:
+        results: Dict[str, Dict[str, Any]] = {}
+        for case in self.cases():
+            if selected and not any(name in case.name for name in selected):
+                continue
+            for category, inputs in case.inputs.items():
+                results[f"{case.name}[{category}]"] = {
+                    **self._time(case.func, inputs),
+                    **self._measure_allocations(case.func, inputs),
+                }
+        return results
+    
+    def _oversized(self) -> Dict[str, List[str]]:
+        return {
+            f"oversized_{length // 1024}k": [
+                (unit * (length // len(unit) + 1))[:length] for unit in self.OVERSIZED_UNITS
+            ]
+            for length in self.OVERSIZED_LENGTHS
+        }
+    
+    def _interviews(self) -> Dict[str, List[List[AnswerData]]]:
+        groups = dict(self.corpus)
+        groups["mixed"] = [text for texts in zip(*self.corpus.values()) for text in texts]
+        return {
+            category: [
+                [AnswerData(text=text, question_id=uuid4()) for text in texts[start:start + self.interview_size]]
+                for start in range(0, len(texts), self.interview_size)
+            ]
+            for category, texts in groups.items()
+        }
+    
+    def _time(self, func: Callable[[Any], Any], inputs: List[Any]) -> Dict[str, Any]:
+        passes = 1
+        while True:
+            elapsed = self._run_passes(func, inputs, passes)
+            if elapsed >= self.min_time_seconds:
+                break
+            passes *= 2
+        
+        best = min([elapsed] + [self._run_passes(func, inputs, passes) for _ in range(self.repeats - 1)])
+        calls = passes * len(inputs)
+        return {
+            "calls_per_second": round(calls / best, 1),
+            "us_per_call": round(best / calls * 1_000_000, 3),
+        }
+    
+    @staticmethod
+    def _run_passes(func: Callable[[Any], Any], inputs: List[Any], passes: int) -> float:
+        gc_was_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            started = time.perf_counter()
+            for _ in range(passes):
+                for item in inputs:
+                    func(item)
+            return time.perf_counter() - started
+        finally:
+            if gc_was_enabled:
+                gc.enable()
+    
+    @staticmethod
+    def _measure_allocations(func: Callable[[Any], Any], inputs: List[Any]) -> Dict[str, Any]:
+        tracemalloc.start()
+        try:
+            before = tracemalloc.take_snapshot()
+            tracemalloc.reset_peak()
+            baseline, _ = tracemalloc.get_traced_memory()
+            for item in inputs:
+                func(item)
+            _, peak = tracemalloc.get_traced_memory()
+            after = tracemalloc.take_snapshot()
+        finally:
+            tracemalloc.stop()
+        
+        allocated_blocks = sum(
+            stat.count_diff for stat in after.compare_to(before, "filename") if stat.count_diff > 0
+        )
+        return {
+            "peak_alloc_bytes": max(peak - baseline, 0),
+            "retained_blocks": allocated_blocks,
+        }
+
+
+def find_regressions(
+    baseline: Dict[str, Dict[str, Any]],
+    current: Dict[str, Dict[str, Any]],
+    max_regression_percent: float,
+) -> Dict[str, float]:
+    regressions: Dict[str, float] = {}
+    for name, stats in current.items():
+        baseline_stats = baseline.get(name)
+        if not baseline_stats or not baseline_stats.get("calls_per_second"):
+            continue
+        change = (stats["calls_per_second"] - baseline_stats["calls_per_second"]) / baseline_stats["calls_per_second"] * 100
+        if change < -max_regression_percent:
+            regressions[name] = round(change, 1)
+    return regressions
+
+
+def _print_results(results: Dict[str, Dict[str, Any]], baseline: Optional[Dict[str, Dict[str, Any]]]) -> None:
+    width = max(len(name) for name in results) + 2
+    print(f"{'benchmark':<{width}}{'calls/s':>14}{'us/call':>12}{'peak KiB':>10}{'vs base':>9}")
+    for name, stats in results.items():
+        change = ""
+        if baseline and baseline.get(name, {}).get("calls_per_second"):
+            base = baseline[name]["calls_per_second"]
+            change = f"{(stats['calls_per_second'] - base) / base * 100:+.1f}%"
+        print(
+            f"{name:<{width}}{stats['calls_per_second']:>14,.0f}{stats['us_per_call']:>12.3f}"
+            f"{stats['peak_alloc_bytes'] / 1024:>10.1f}{change:>9}"
+        )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Microbenchmarks for the answer-analysis engine")
+    parser.add_argument("--corpus-size", type=int, default=200, help="Answers generated per category")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--min-time-seconds", type=float, default=0.2)
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--only", nargs="*", help="Run only benchmarks whose name contains one of these strings")
+    parser.add_argument("--output", help="Write the JSON results to this path")
+    parser.add_argument("--baseline", help="Earlier JSON results to compare against")
+    parser.add_argument("--max-regression", type=float, default=15.0, help="Allowed throughput drop in percent")
+    args = parser.parse_args()
+    
+    baseline = None
+    if args.baseline:
+        baseline_report = json.loads(Path(args.baseline).read_text())
+        if (baseline_report["corpus_size"], baseline_report["seed"]) != (args.corpus_size, args.seed):
+            parser.error("the baseline was recorded with a different --corpus-size or --seed")
+        baseline = baseline_report["results"]
+    
+    corpus = AnalysisCorpus(args.corpus_size, args.seed).build()
+    results = AnalysisBenchmark(corpus, min_time_seconds=args.min_time_seconds, repeats=args.repeats).run(args.only)
+    
+    _print_results(results, baseline)
+    if args.output:
+        Path(args.output).write_text(json.dumps({
+            "corpus_size": args.corpus_size,
+            "seed": args.seed,
+            "python": sys.version.split()[0],
+            "results": results,
+        }, indent=2))
+    
+    if baseline:
+        regressions = find_regressions(baseline, results, args.max_regression)
+        if regressions:
+            print(f"Throughput regressed by more than {args.max_regression}%:", file=sys.stderr)
+            for name, change in regressions.items():
+                print(f"  {name}: {change}%", file=sys.stderr)
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
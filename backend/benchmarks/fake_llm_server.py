@@ -0,0 +1,399 @@
+import argparse
+import asyncio
+import json
+import random
+import re
+import time
+import uuid
+from dataclasses import asdict, dataclass, fields
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+
+import uvicorn
+from fastapi import FastAPI, Form, Request, UploadFile
+from fastapi.responses import JSONResponse, PlainTextResponse, StreamingResponse
+
+from application.services.service_constants import ServiceConstants
+
+
+@dataclass
+class FakeLLMConfig:
+    latency_distribution: str = "lognormal"
+    latency_seconds: float = 0.5
+    latency_spread: float = 0.5
+    tokens_per_second: float = 60.0
+    rate_limit_rate: float = 0.0
+    server_error_rate: float = 0.0
+    timeout_rate: float = 0.0
+    timeout_seconds: float = 120.0
+    retry_after_seconds: float = 1.0
+    batch_completion_seconds: float = 5.0
+    seed: Optional[int] = None
+
+
+class FakeLLMServer:
+    
+    LATENCY_DISTRIBUTIONS = ("fixed", "uniform", "lognormal")
+    SERVER_ERROR_STATUS_CODES = (500, 502, 503)
+    TOPIC_PATTERN = re.compile(r"Interview topic:\s*(.+)")
+    SUMMARY_SYSTEM_PATTERN = re.compile(r"\bschema\b", re.IGNORECASE)
+    QUESTION_TEMPLATES = [
+        "Can you walk me through a {topic} project where you had to make a difficult trade-off?",
+        "How did you measure whether your {topic} work actually succeeded?",
+        "What went wrong the last time you shipped something in {topic}, and what did you change afterwards?",
+        "Which {topic} decision would you make differently today, and why?",
+        "How do you explain a complex {topic} problem to a non-technical stakeholder?",
+        "What is the hardest {topic} bug you have debugged, and how did you find the root cause?",
+    ]
+    THEMES = [
+        "Problem Solving",
+        "Technical Depth",
+        "Communication",
+        "Ownership",
+        "System Design",
+        "Collaboration",
+        "Unclear Response",
+    ]
+    KEY_POINTS = [
+        "Described the context of the problem",
+        "Explained the chosen approach",
+        "Mentioned trade-offs considered",
+        "Gave limited concrete metrics",
+        "Reflected on lessons learned",
+        "Referred to team collaboration",
+        "Answers stayed at a high level",
+    ]
+    
+    def __init__(self, config: Optional[FakeLLMConfig] = None):
+        self.config = config or FakeLLMConfig()
+        self.random = random.Random(self.config.seed)
+        self.files: Dict[str, str] = {}
+        self.batches: Dict[str, Dict[str, Any]] = {}
+        self.counters: Dict[str, int] = {}
+        self.app = self._build_app()
+    
+    def update_config(self, changes: Dict[str, Any]) -> FakeLLMConfig:
+        known = {field.name: field for field in fields(FakeLLMConfig)}
+        for name, value in changes.items():
+            if name not in known:
+                raise ValueError(f"Unknown setting: {name}")
+            setattr(self.config, name, value)
+        if self.config.latency_distribution not in self.LATENCY_DISTRIBUTIONS:
+            raise ValueError(f"latency_distribution must be one of {', '.join(self.LATENCY_DISTRIBUTIONS)}")
+        if "seed" in changes:
+            self.random.seed(self.config.seed)
+        return self.config
+    
+    def stats(self) -> Dict[str, int]:
+        return dict(self.counters)
+    
+    def reset_stats(self) -> None:
+        self.counters.clear()
+    
+    def sample_latency(self) -> float:
+        config = self.config
+        if config.latency_distribution == "fixed":
+            return config.latency_seconds
+        if config.latency_distribution == "uniform":
+            return max(self.random.uniform(
+                config.latency_seconds - config.latency_spread,
+                config.latency_seconds + config.latency_spread,
+            ), 0.0)
+        if config.latency_seconds <= 0:
+            return 0.0
+        return self.random.lognormvariate(0.0, config.latency_spread) * config.latency_seconds
+    
+    def generate_content(self, body: Dict[str, Any]) -> str:
+        messages = body.get("messages") or []
+        text = "\n".join(str(message.get("content", "")) for message in messages)
+        topic_match = self.TOPIC_PATTERN.search(text)
+        topic = topic_match.group(1).strip() if topic_match else "software engineering"
+        
+        if body.get("response_format") or self._is_summary_prompt(messages):
+            self._count("summaries")
+            return json.dumps(self._generate_summary(topic))
+        
+        self._count("questions")
+        return self.random.choice(self.QUESTION_TEMPLATES).format(topic=topic)
+    
+    def _is_summary_prompt(self, messages: List[Dict[str, Any]]) -> bool:
+        return any(
+            message.get("role") == "system" and self.SUMMARY_SYSTEM_PATTERN.search(str(message.get("content", "")))
+            for message in messages
+        )
+    
+    def _generate_summary(self, topic: str) -> Dict[str, Any]:
+        sentiment_score = round(self.random.uniform(0.2, 0.9), 2)
+        if sentiment_score > 0.6:
+            sentiment_label = "positive"
+        elif sentiment_score < 0.4:
+            sentiment_label = "negative"
+        else:
+            sentiment_label = "neutral"
+        
+        return {
+            "themes": self.random.sample(self.THEMES, 3),
+            "key_points": self.random.sample(self.KEY_POINTS, 5),
+            "sentiment_score": sentiment_score,
+            "sentiment_label": sentiment_label,
+            "strengths": self.random.sample(self.THEMES[:6], self.random.randint(0, 3)),
+            "weaknesses": self.random.sample(self.KEY_POINTS[3:], self.random.randint(0, 2)),
+            "missing_information": self.random.sample(["no concrete example", "no metrics", "no decision rationale"], self.random.randint(0, 2)),
+            "full_summary_text": (
+                f"The candidate discussed their experience with {topic}. "
+                f"Overall the answers were {sentiment_label} in depth and clarity."
+            ),
+        }
+    
+    def _draw_fault(self) -> Optional[str]:
+        config = self.config
+        roll = self.random.random()
+        if roll < config.rate_limit_rate:
+            return "rate_limit"
+        roll -= config.rate_limit_rate
+        if roll < config.server_error_rate:
+            return "server_error"
+        roll -= config.server_error_rate
+        if roll < config.timeout_rate:
+            return "timeout"
+        return None
+    
+    async def _inject_fault(self) -> Optional[JSONResponse]:
+        fault = self._draw_fault()
+        if fault == "rate_limit":
+            self._count("rate_limited")
+            return JSONResponse(
+                {"error": {"message": "Rate limit reached (injected)", "type": "rate_limit_exceeded"}},
+                status_code=ServiceConstants.LLMClient.RATE_LIMIT_STATUS_CODE,
+                headers={
+                    "retry-after": str(self.config.retry_after_seconds),
+                    "x-ratelimit-remaining-requests": "0",
+                    "x-ratelimit-reset-requests": f"{self.config.retry_after_seconds}s",
+                },
+            )
+        if fault == "server_error":
+            self._count("server_errors")
+            return JSONResponse(
+                {"error": {"message": "Upstream failure (injected)", "type": "server_error"}},
+                status_code=self.random.choice(self.SERVER_ERROR_STATUS_CODES),
+            )
+        if fault == "timeout":
+            self._count("timeouts")
+            await asyncio.sleep(self.config.timeout_seconds)
+        return None
+    
+    def _completion_seconds(self, content: str) -> float:
+        if self.config.tokens_per_second <= 0:
+            return 0.0
+        return self._estimate_tokens(content) / self.config.tokens_per_second
+    
+    async def _stream_chunks(self, completion_id: str, model: str, content: str) -> AsyncIterator[str]:
+        chunk_size = ServiceConstants.LLMClient.CHARS_PER_TOKEN
+        token_delay = 1.0 / self.config.tokens_per_second if self.config.tokens_per_second > 0 else 0.0
+        for start in range(0, len(content), chunk_size):
+            chunk = {
+                "id": completion_id,
+                "object": "chat.completion.chunk",
+                "model": model,
+                "choices": [{"index": 0, "delta": {"content": content[start:start + chunk_size]}, "finish_reason": None}],
+            }
+            yield f"data: {json.dumps(chunk)}\n\n"
+            if token_delay:
+                await asyncio.sleep(token_delay)
+        
+        final_chunk = {
+            "id": completion_id,
+            "object": "chat.completion.chunk",
+            "model": model,
+            "choices": [{"index": 0, "delta": {}, "finish_reason": "stop"}],
+        }
+        yield f"data: {json.dumps(final_chunk)}\n\n"
+        yield f"data: {ServiceConstants.LLMClient.STREAM_DONE_MARKER}\n\n"
+    
+    def _completion_body(self, completion_id: str, body: Dict[str, Any], content: str) -> Dict[str, Any]:
+        prompt_tokens = sum(
+            self._estimate_tokens(str(message.get("content", ""))) for message in body.get("messages") or []
+        )
+        completion_tokens = self._estimate_tokens(content)
+        return {
+            "id": completion_id,
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": body.get("model", "fake"),
+            "choices": [{"index": 0, "message": {"role": "assistant", "content": content}, "finish_reason": "stop"}],
+            "usage": {
+                "prompt_tokens": prompt_tokens,
+                "completion_tokens": completion_tokens,
+                "total_tokens": prompt_tokens + completion_tokens,
+            },
+        }
+    
+    def _batch_view(self, batch: Dict[str, Any]) -> Dict[str, Any]:
+        if batch["status"] == "in_progress" and time.time() - batch["created_at"] >= self.config.batch_completion_seconds:
+            self._complete_batch(batch)
+        return {key: value for key, value in batch.items() if key != "lines"}
+    
+    def _complete_batch(self, batch: Dict[str, Any]) -> None:
+        output_lines: List[str] = []
+        error_lines: List[str] = []
+        for line in batch["lines"]:
+            request = json.loads(line)
+            custom_id = request.get("custom_id")
+            if self._draw_fault() == "server_error":
+                error_lines.append(json.dumps({
+                    "id": f"batch_req_{uuid.uuid4().hex}",
+                    "custom_id": custom_id,
+                    "response": {"status_code": 500, "body": {"error": {"message": "Upstream failure (injected)"}}},
+                    "error": None,
+                }))
+                continue
+            content = self.generate_content(request.get("body") or {})
+            output_lines.append(json.dumps({
+                "id": f"batch_req_{uuid.uuid4().hex}",
+                "custom_id": custom_id,
+                "response": {
+                    "status_code": 200,
+                    "body": self._completion_body(f"chatcmpl-{uuid.uuid4().hex}", request.get("body") or {}, content),
+                },
+                "error": None,
+            }))
+        
+        batch["output_file_id"] = self._store_file("\n".join(output_lines))
+        batch["error_file_id"] = self._store_file("\n".join(error_lines)) if error_lines else None
+        batch["request_counts"] = {
+            "total": len(batch["lines"]),
+            "completed": len(output_lines),
+            "failed": len(error_lines),
+        }
+        batch["status"] = "completed"
+        batch["completed_at"] = int(time.time())
+    
+    def _store_file(self, content: str) -> str:
+        file_id = f"file-{uuid.uuid4().hex}"
+        self.files[file_id] = content
+        return file_id
+    
+    def _count(self, name: str) -> None:
+        self.counters[name] = self.counters.get(name, 0) + 1
+    
+    @staticmethod
+    def _estimate_tokens(text: str) -> int:
+        return -(-len(text) // ServiceConstants.LLMClient.CHARS_PER_TOKEN)
+    
+    def _build_app(self) -> FastAPI:
+        app = FastAPI(title="Fake LLM Server")
+        
+        @app.get("/v1/models")
+        async def list_models() -> Dict[str, Any]:
+            return {"object": "list", "data": [{"id": "fake", "object": "model", "owned_by": "fake"}]}
+        
+        @app.post("/v1/chat/completions")
+        async def chat_completions(request: Request):
+            body = await request.json()
+            self._count("requests")
+            
+            fault_response = await self._inject_fault()
+            if fault_response is not None:
+                return fault_response
+            
+            content = self.generate_content(body)
+            completion_id = f"chatcmpl-{uuid.uuid4().hex}"
+            await asyncio.sleep(self.sample_latency())
+            
+            if body.get("stream"):
+                self._count("streams")
+                return StreamingResponse(
+                    self._stream_chunks(completion_id, body.get("model", "fake"), content),
+                    media_type="text/event-stream",
+                )
+            
+            await asyncio.sleep(self._completion_seconds(content))
+            return self._completion_body(completion_id, body, content)
+        
+        @app.post("/v1/files")
+        async def upload_file(file: UploadFile, purpose: str = Form(...)) -> Dict[str, Any]:
+            content = (await file.read()).decode("utf-8")
+            file_id = self._store_file(content)
+            return {"id": file_id, "object": "file", "purpose": purpose, "bytes": len(content), "filename": file.filename}
+        
+        @app.get("/v1/files/{file_id}/content")
+        async def get_file_content(file_id: str):
+            if file_id not in self.files:
+                return JSONResponse({"error": {"message": f"No such file: {file_id}"}}, status_code=404)
+            return PlainTextResponse(self.files[file_id])
+        
+        @app.post("/v1/batches")
+        async def create_batch(request: Request):
+            body = await request.json()
+            input_file_id = body.get("input_file_id")
+            if input_file_id not in self.files:
+                return JSONResponse({"error": {"message": f"No such file: {input_file_id}"}}, status_code=404)
+            
+            lines = [line for line in self.files[input_file_id].splitlines() if line.strip()]
+            batch_id = f"batch_{uuid.uuid4().hex}"
+            self.batches[batch_id] = {
+                "id": batch_id,
+                "object": "batch",
+                "endpoint": body.get("endpoint"),
+                "input_file_id": input_file_id,
+                "completion_window": body.get("completion_window"),
+                "status": "in_progress",
+                "output_file_id": None,
+                "error_file_id": None,
+                "created_at": time.time(),
+                "request_counts": {"total": len(lines), "completed": 0, "failed": 0},
+                "lines": lines,
+            }
+            self._count("batches")
+            return self._batch_view(self.batches[batch_id])
+        
+        @app.get("/v1/batches/{batch_id}")
+        async def get_batch(batch_id: str):
+            if batch_id not in self.batches:
+                return JSONResponse({"error": {"message": f"No such batch: {batch_id}"}}, status_code=404)
+            return self._batch_view(self.batches[batch_id])
+        
+        @app.get("/fake/config")
+        async def get_config() -> Dict[str, Any]:
+            return asdict(self.config)
+        
+        @app.patch("/fake/config")
+        async def patch_config(request: Request):
+            try:
+                return asdict(self.update_config(await request.json()))
+            except (ValueError, TypeError) as e:
+                return JSONResponse({"error": {"message": str(e)}}, status_code=422)
+        
+        @app.get("/fake/stats")
+        async def get_stats() -> Dict[str, int]:
+            return self.stats()
+        
+        @app.delete("/fake/stats")
+        async def delete_stats() -> Dict[str, int]:
+            self.reset_stats()
+            return self.stats()
+        
+        return app
+
+
+def _parse_args() -> Tuple[argparse.Namespace, FakeLLMConfig]:
+    parser = argparse.ArgumentParser(description="OpenAI-compatible fake LLM server for local load tests")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8001)
+    for field in fields(FakeLLMConfig):
+        option = f"--{field.name.replace('_', '-')}"
+        if field.name == "latency_distribution":
+            parser.add_argument(option, choices=FakeLLMServer.LATENCY_DISTRIBUTIONS, default=field.default)
+        elif field.name == "seed":
+            parser.add_argument(option, type=int, default=field.default)
+        else:
+            parser.add_argument(option, type=type(field.default), default=field.default)
+    
+    args = parser.parse_args()
+    config = FakeLLMConfig(**{field.name: getattr(args, field.name) for field in fields(FakeLLMConfig)})
+    return args, config
+
+
+if __name__ == "__main__":
+    args, config = _parse_args()
+    server = FakeLLMServer(config)
+    uvicorn.run(server.app, host=args.host, port=args.port, log_level="warning")
@@ -0,0 +1,380 @@
+import argparse
+import asyncio
+import json
+import random
+import subprocess
+import sys
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+import httpx
+
+API_PREFIX = "/api/v1"
+
+
+@dataclass
+class RequestSample:
+    endpoint: str
+    status_code: int
+    seconds: float
+    database_error: bool = False
+
+
+class LoadTest:
+    
+    TOPICS = ["Python", "Distributed Systems", "Kubernetes", "Product Management", "Data Engineering", "Frontend"]
+    ANSWER_SENTENCES = [
+        "In my last role I owned the migration of our billing service to an event-driven design.",
+        "We measured p95 latency before and after the change and it dropped by roughly forty percent.",
+        "The main trade-off was consistency versus availability, and we accepted eventual consistency.",
+        "I would add better observability earlier, because debugging without traces cost us weeks.",
+        "I paired with the on-call engineer to reproduce the issue and wrote a regression test first.",
+        "Honestly I am not sure, I have not worked with that directly.",
+        "We split the monolith gradually behind a feature flag so we could roll back quickly.",
+        "Stakeholders cared about delivery dates, so I shared a risk register every sprint.",
+    ]
+    
+    def __init__(
+        self,
+        client: httpx.AsyncClient,
+        concurrency: int,
+        interviews: int,
+        questions_per_interview: int,
+        think_seconds: float = 0.0,
+        ramp_up_seconds: float = 0.0,
+        seed: Optional[int] = None,
+    ):
+        self.client = client
+        self.concurrency = concurrency
+        self.interviews = interviews
+        self.questions_per_interview = questions_per_interview
+        self.think_seconds = think_seconds
+        self.ramp_up_seconds = ramp_up_seconds
+        self.random = random.Random(seed)
+        self.samples: List[RequestSample] = []
+        self.completed_interviews = 0
+        self.failed_interviews = 0
+    
+    async def run(self) -> Dict[str, Any]:
+        llm_before = await self._get_metrics("llm")
+        database_before = await self._get_metrics("database")
+        
+        semaphore = asyncio.Semaphore(self.concurrency)
+        started = time.perf_counter()
+        await asyncio.gather(*[self._run_candidate(index, semaphore) for index in range(self.interviews)])
+        wall_seconds = time.perf_counter() - started
+        
+        llm_after = await self._get_metrics("llm")
+        database_after = await self._get_metrics("database")
+        return self._report(wall_seconds, llm_before, llm_after, database_before, database_after)
+    
+    async def _run_candidate(self, index: int, semaphore: asyncio.Semaphore) -> None:
+        if self.ramp_up_seconds > 0:
+            await asyncio.sleep(self.ramp_up_seconds * index / self.interviews)
+        
+        async with semaphore:
+            if await self._run_interview():
+                self.completed_interviews += 1
+            else:
+                self.failed_interviews += 1
+    
+    async def _run_interview(self) -> bool:
+        response = await self._request(
+            "create_interview", "POST", "/interviews", {"topic": self.random.choice(self.TOPICS)}
+        )
+        if response is None:
+            return False
+        interview_id = response.json()["interview_id"]
+        
+        for _ in range(self.questions_per_interview):
+            await self._think()
+            response = await self._request("generate_question", "POST", "/questions", {"interview_id": interview_id})
+            if response is None:
+                return False
+            question_id = response.json()["question_id"]
+            
+            await self._think()
+            response = await self._request(
+                "submit_answer",
+                "POST",
+                "/answers",
+                {"interview_id": interview_id, "question_id": question_id, "text": self._generate_answer()},
+            )
+            if response is None:
+                return False
+        
+        await self._think()
+        response = await self._request("generate_summary", "POST", f"/summaries/interview/{interview_id}")
+        return response is not None
+    
+    async def _request(
+        self,
+        endpoint: str,
+        method: str,
+        path: str,
+        payload: Optional[Dict[str, Any]] = None,
+    ) -> Optional[httpx.Response]:
+        started = time.perf_counter()
+        try:
+            response = await self.client.request(method, f"{API_PREFIX}{path}", json=payload)
+        except httpx.HTTPError:
+            self.samples.append(RequestSample(endpoint, 0, time.perf_counter() - started))
+            return None
+        
+        seconds = time.perf_counter() - started
+        database_error = False
+        if response.is_error:
+            try:
+                database_error = response.json().get("error") == "Database Error"
+            except ValueError:
+                pass
+        self.samples.append(RequestSample(endpoint, response.status_code, seconds, database_error))
+        return None if response.is_error else response
+    
+    async def _get_metrics(self, name: str) -> Optional[Dict[str, Any]]:
+        try:
+            response = await self.client.get(f"{API_PREFIX}/metrics/{name}")
+        except httpx.HTTPError:
+            return None
+        return response.json() if response.status_code == 200 else None
+    
+    async def _think(self) -> None:
+        if self.think_seconds > 0:
+            await asyncio.sleep(self.random.uniform(0.5, 1.5) * self.think_seconds)
+    
+    def _generate_answer(self) -> str:
+        return " ".join(self.random.sample(self.ANSWER_SENTENCES, self.random.randint(1, 4)))
+    
+    def _report(
+        self,
+        wall_seconds: float,
+        llm_before: Optional[Dict[str, Any]],
+        llm_after: Optional[Dict[str, Any]],
+        database_before: Optional[Dict[str, int]],
+        database_after: Optional[Dict[str, int]],
+    ) -> Dict[str, Any]:
+        endpoints: Dict[str, Dict[str, Any]] = {}
+        for endpoint in sorted({sample.endpoint for sample in self.samples}):
+            samples = [sample for sample in self.samples if sample.endpoint == endpoint]
+            status_codes: Dict[str, int] = {}
+            for sample in samples:
+                status_codes[str(sample.status_code)] = status_codes.get(str(sample.status_code), 0) + 1
+            endpoints[endpoint] = {
+                "count": len(samples),
+                "errors": sum(1 for sample in samples if not 200 <= sample.status_code < 400),
+                "status_codes": status_codes,
+                **summarize_latencies([sample.seconds for sample in samples]),
+            }
+        
+        errors = sum(endpoint["errors"] for endpoint in endpoints.values())
+        return {
+            "totals": {
+                "wall_seconds": round(wall_seconds, 3),
+                "requests": len(self.samples),
+                "errors": errors,
+                "completed_interviews": self.completed_interviews,
+                "failed_interviews": self.failed_interviews,
+                "interviews_per_second": round(self.completed_interviews / wall_seconds, 3) if wall_seconds else 0.0,
+                "requests_per_second": round(len(self.samples) / wall_seconds, 3) if wall_seconds else 0.0,
+            },
+            "endpoints": endpoints,
+            "database": {
+                "error_responses": sum(1 for sample in self.samples if sample.database_error),
+                "server_errors": _counter_delta(database_before, database_after),
+            },
+            "llm_queue": _llm_queue_delta(llm_before, llm_after),
+        }
+
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    if not sorted_values:
+        return 0.0
+    rank = max(int(-(-pct * len(sorted_values) // 100)) - 1, 0)
+    return sorted_values[min(rank, len(sorted_values) - 1)]
+
+
+def summarize_latencies(values: List[float]) -> Dict[str, float]:
+    ordered = sorted(values)
+    return {
+        "p50_ms": round(percentile(ordered, 50) * 1000, 2),
+        "p95_ms": round(percentile(ordered, 95) * 1000, 2),
+        "p99_ms": round(percentile(ordered, 99) * 1000, 2),
+        "mean_ms": round(sum(ordered) / len(ordered) * 1000, 2) if ordered else 0.0,
+        "max_ms": round(ordered[-1] * 1000, 2) if ordered else 0.0,
+    }
+
+
+def compare_reports(baseline: Dict[str, Any], current: Dict[str, Any]) -> Dict[str, Any]:
+    comparison: Dict[str, Any] = {"endpoints": {}}
+    for endpoint, stats in current["endpoints"].items():
+        baseline_stats = baseline.get("endpoints", {}).get(endpoint)
+        if not baseline_stats:
+            continue
+        comparison["endpoints"][endpoint] = {
+            key: _percent_change(baseline_stats.get(key), stats.get(key))
+            for key in ("p50_ms", "p95_ms", "p99_ms")
+        }
+    comparison["requests_per_second"] = _percent_change(
+        baseline.get("totals", {}).get("requests_per_second"), current["totals"]["requests_per_second"]
+    )
+    return comparison
+
+
+def _percent_change(before: Optional[float], after: Optional[float]) -> Optional[float]:
+    if not before or after is None:
+        return None
+    return round((after - before) / before * 100, 1)
+
+
+def _counter_delta(before: Optional[Dict[str, int]], after: Optional[Dict[str, int]]) -> Optional[Dict[str, int]]:
+    if before is None or after is None:
+        return None
+    return {key: value - before.get(key, 0) for key, value in after.items()}
+
+
+def _llm_queue_delta(before: Optional[Dict[str, Any]], after: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    limiters_before = _rate_limiter_stats(before)
+    limiters_after = _rate_limiter_stats(after)
+    if not limiters_before or len(limiters_before) != len(limiters_after):
+        return None
+    
+    def total(limiters: List[Dict[str, Any]], key: str) -> float:
+        return sum(limiter[key] for limiter in limiters)
+    
+    acquired = total(limiters_after, "acquired") - total(limiters_before, "acquired")
+    wait_seconds = total(limiters_after, "total_wait_seconds") - total(limiters_before, "total_wait_seconds")
+    return {
+        "llm_calls": acquired,
+        "total_wait_seconds": round(wait_seconds, 3),
+        "avg_wait_ms": round(wait_seconds / acquired * 1000, 2) if acquired else 0.0,
+        "max_wait_ms": round(max(limiter["max_wait_seconds"] for limiter in limiters_after) * 1000, 2),
+        "rate_limited": total(limiters_after, "rate_limited") - total(limiters_before, "rate_limited"),
+        "final_concurrency_window": round(total(limiters_after, "concurrency_window"), 2),
+    }
+
+
+def _rate_limiter_stats(llm_stats: Optional[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    llm_stats = llm_stats or {}
+    if "rate_limiter" in llm_stats:
+        return [llm_stats["rate_limiter"]]
+    backends = llm_stats.get("router", {}).get("backends", [])
+    return [backend["rate_limiter"] for backend in backends if "rate_limiter" in backend]
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=Path(__file__).parent,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return result.stdout.strip() or None
+
+
+@asynccontextmanager
+async def _open_client(base_url: Optional[str], timeout_seconds: float) -> AsyncIterator[httpx.AsyncClient]:
+    limits = httpx.Limits(max_connections=None, max_keepalive_connections=None)
+    if base_url:
+        async with httpx.AsyncClient(base_url=base_url, timeout=timeout_seconds, limits=limits) as client:
+            yield client
+        return
+    
+    from main import app, lifespan
+    
+    async with lifespan(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://load-test", timeout=timeout_seconds) as client:
+            yield client
+
+
+def _print_report(report: Dict[str, Any], comparison: Optional[Dict[str, Any]]) -> None:
+    totals = report["totals"]
+    print(
+        f"{totals['completed_interviews']} interviews ({totals['failed_interviews']} failed) in "
+        f"{totals['wall_seconds']}s: {totals['requests_per_second']} req/s, {totals['errors']} errors"
+    )
+    print(f"{'endpoint':<20}{'count':>7}{'errors':>8}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}")
+    for endpoint, stats in report["endpoints"].items():
+        print(
+            f"{endpoint:<20}{stats['count']:>7}{stats['errors']:>8}"
+            f"{stats['p50_ms']:>10}{stats['p95_ms']:>10}{stats['p99_ms']:>10}"
+        )
+    print(f"database: {json.dumps(report['database'])}")
+    print(f"llm queue: {json.dumps(report['llm_queue'])}")
+    if comparison:
+        print(f"vs baseline (% change): {json.dumps(comparison)}")
+
+
+async def _main(args: argparse.Namespace) -> int:
+    if args.questions is None:
+        from config.config import settings
+        args.questions = settings.MAX_QUESTIONS_PER_INTERVIEW
+    
+    async with _open_client(args.base_url, args.timeout_seconds) as client:
+        load_test = LoadTest(
+            client,
+            concurrency=args.concurrency,
+            interviews=args.interviews or args.concurrency,
+            questions_per_interview=args.questions,
+            think_seconds=args.think_seconds,
+            ramp_up_seconds=args.ramp_up_seconds,
+            seed=args.seed,
+        )
+        report = await load_test.run()
+    
+    report = {
+        "meta": {
+            "started_at": datetime.now(timezone.utc).isoformat(),
+            "commit": _git_commit(),
+            "target": args.base_url or "in-process",
+            "concurrency": args.concurrency,
+            "interviews": args.interviews or args.concurrency,
+            "questions_per_interview": args.questions,
+            "think_seconds": args.think_seconds,
+        },
+        **report,
+    }
+    
+    comparison = None
+    if args.baseline:
+        comparison = compare_reports(json.loads(Path(args.baseline).read_text()), report)
+        report["comparison"] = comparison
+    
+    if args.output:
+        Path(args.output).write_text(json.dumps(report, indent=2))
+    _print_report(report, comparison)
+    
+    if args.max_p95_regression is not None and comparison:
+        regressions = [
+            endpoint
+            for endpoint, changes in comparison["endpoints"].items()
+            if changes["p95_ms"] is not None and changes["p95_ms"] > args.max_p95_regression
+        ]
+        if regressions:
+            print(f"p95 regression above {args.max_p95_regression}% on: {', '.join(regressions)}", file=sys.stderr)
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Drive concurrent simulated interviews through the API")
+    parser.add_argument("--base-url", help="Running API, e.g. http://127.0.0.1:8000; omit to run the app in-process")
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--interviews", type=int, help="Total interviews to run (defaults to --concurrency)")
+    parser.add_argument("--questions", type=int, help="Questions per interview (defaults to MAX_QUESTIONS_PER_INTERVIEW)")
+    parser.add_argument("--think-seconds", type=float, default=0.0)
+    parser.add_argument("--ramp-up-seconds", type=float, default=0.0)
+    parser.add_argument("--timeout-seconds", type=float, default=120.0)
+    parser.add_argument("--seed", type=int)
+    parser.add_argument("--output", help="Write the JSON report to this path")
+    parser.add_argument("--baseline", help="Earlier JSON report to compare against")
+    parser.add_argument("--max-p95-regression", type=float, help="Exit non-zero when any endpoint p95 grows by more than this percent")
+    sys.exit(asyncio.run(_main(parser.parse_args())))
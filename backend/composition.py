@@ -1,11 +1,24 @@
-from fastapi import Depends
+import logging
+import os
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import httpx
+from fastapi import Depends, Request
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from application.repository_interfaces import InterviewRepository, QuestionRepository, AnswerRepository, InterviewSummaryRepository
 from application.services.llm_orchestrator import LLMOrchestrator
 from application.services.llm_client import LLMClient
+from application.services.llm_data import GenerationProfile
+from application.services.batch_llm_client import BatchLLMClient
 from application.services.prompt_loader import PromptLoader
 from application.services.prompt_builder import PromptBuilder
+from application.services.context_compactor import ContextCompactor
+from application.services.model_cascade import CascadeTier, ModelCascade
+from application.services.question_pool import QuestionPool
+from application.services.question_prefetcher import QuestionPrefetcher
+from application.services.single_flight import SingleFlight
 from application.use_cases import (
     CreateInterviewUseCase,
     GetInterviewUseCase,
@@ -16,12 +29,29 @@ from application.use_cases import (
     GetAnswerUseCase,
     GenerateSummaryUseCase,
     GetSummaryUseCase,
+    BatchSummaryUseCase,
+    GetInterviewProgressUseCase,
 )
 from config.config import Settings, settings
 from infrastructure.database.database import get_db
-from infrastructure.llm import OpenAIClient
+from infrastructure.database.error_stats import DatabaseErrorStats
+from infrastructure.llm import (
+    OpenAIClient,
+    LLMResponseCache,
+    CachingLLMClient,
+    AdaptiveRateLimiter,
+    RateLimitedLLMClient,
+    CircuitBreaker,
+    RetryBudget,
+    ResilientLLMClient,
+    RoutedBackend,
+    RoutingLLMClient,
+    OpenAIBatchClient,
+)
 from infrastructure.repositories import SqlInterviewRepository, SqlQuestionRepository, SqlAnswerRepository, SqlInterviewSummaryRepository
 
+logger = logging.getLogger(__name__)
+
 
 async def get_interview_repository(db: AsyncSession = Depends(get_db)) -> InterviewRepository:
     return SqlInterviewRepository(db)
@@ -43,8 +73,135 @@ def get_settings():
     return settings
 
 
-def get_llm_client(settings: Settings = Depends(get_settings)) -> LLMClient:
-    return OpenAIClient(settings)
+BACKEND_DIR = Path(__file__).parent.resolve()
+
+
+def resolve_llm_providers(settings: Settings) -> List[Dict[str, Any]]:
+    providers = []
+    for index, provider in enumerate(settings.LLM_PROVIDERS):
+        api_key = provider.get("api_key")
+        if api_key is None and provider.get("api_key_env"):
+            api_key = os.environ.get(provider["api_key_env"])
+        model = provider.get("model") or settings.LLM_MODEL
+        providers.append({
+            "name": provider.get("name") or f"provider-{index + 1}",
+            "base_url": provider.get("base_url") or settings.LLM_BASE_URL,
+            "api_key": api_key if api_key is not None else settings.LLM_API_KEY,
+            "model": model,
+            "models": [model, *(provider.get("models") or [])],
+            "weight": float(provider.get("weight", 1.0)),
+        })
+    return providers
+
+
+def build_llm_client(settings: Settings, http_client: httpx.AsyncClient) -> LLMClient:
+    retry_budget = None
+    if settings.LLM_RETRY_BUDGET_ENABLED:
+        retry_budget = RetryBudget(
+            ratio=settings.LLM_RETRY_BUDGET_RATIO,
+            min_retries=settings.LLM_RETRY_BUDGET_MIN_RETRIES,
+            window_seconds=settings.LLM_RETRY_BUDGET_WINDOW_SECONDS,
+        )
+    
+    def build_openai_client(**overrides: Any) -> LLMClient:
+        rate_limiter = None
+        if settings.LLM_RATE_LIMIT_ENABLED:
+            rate_limiter = AdaptiveRateLimiter(
+                requests_per_minute=settings.LLM_RATE_LIMIT_REQUESTS_PER_MINUTE,
+                tokens_per_minute=settings.LLM_RATE_LIMIT_TOKENS_PER_MINUTE,
+                initial_concurrency=settings.LLM_RATE_LIMIT_INITIAL_CONCURRENCY,
+                min_concurrency=settings.LLM_RATE_LIMIT_MIN_CONCURRENCY,
+                max_concurrency=settings.LLM_RATE_LIMIT_MAX_CONCURRENCY,
+            )
+        
+        client: LLMClient = OpenAIClient(
+            settings,
+            http_client,
+            retry_rate_limits=rate_limiter is None,
+            response_observer=rate_limiter.observe_response if rate_limiter else None,
+            retry_budget=retry_budget,
+            **overrides,
+        )
+        if rate_limiter:
+            client = RateLimitedLLMClient(
+                client,
+                rate_limiter,
+                max_completion_tokens=settings.LLM_MAX_TOKENS,
+                max_rate_limit_retries=settings.LLM_RATE_LIMIT_MAX_RETRIES,
+            )
+        return client
+    
+    providers = resolve_llm_providers(settings)
+    if providers:
+        backends = [
+            RoutedBackend(
+                provider["name"],
+                build_openai_client(
+                    base_url=provider["base_url"],
+                    api_key=provider["api_key"],
+                    model=provider["model"],
+                ),
+                provider["weight"],
+                provider["models"],
+            )
+            for provider in providers
+        ]
+        llm_client: LLMClient = RoutingLLMClient(
+            backends,
+            latency_smoothing=settings.LLM_ROUTING_LATENCY_SMOOTHING,
+            error_rate_threshold=settings.LLM_ROUTING_ERROR_RATE_THRESHOLD,
+            unhealthy_cooldown_seconds=settings.LLM_ROUTING_UNHEALTHY_COOLDOWN_SECONDS,
+            exploration_ratio=settings.LLM_ROUTING_EXPLORATION_RATIO,
+            max_attempts=settings.LLM_ROUTING_MAX_ATTEMPTS,
+        )
+    else:
+        llm_client = build_openai_client()
+    
+    circuit_breaker = None
+    if settings.LLM_CIRCUIT_BREAKER_ENABLED:
+        circuit_breaker = CircuitBreaker(
+            failure_threshold=settings.LLM_CIRCUIT_BREAKER_FAILURE_THRESHOLD,
+            open_seconds=settings.LLM_CIRCUIT_BREAKER_OPEN_SECONDS,
+            half_open_max_calls=settings.LLM_CIRCUIT_BREAKER_HALF_OPEN_MAX_CALLS,
+        )
+    
+    if circuit_breaker or retry_budget or settings.LLM_HEDGING_ENABLED:
+        llm_client = ResilientLLMClient(
+            llm_client,
+            circuit_breaker=circuit_breaker,
+            retry_budget=retry_budget,
+            hedging_enabled=settings.LLM_HEDGING_ENABLED,
+            hedge_percentile=settings.LLM_HEDGING_PERCENTILE,
+            hedge_min_delay_seconds=settings.LLM_HEDGING_MIN_DELAY_SECONDS,
+            hedge_initial_delay_seconds=settings.LLM_HEDGING_INITIAL_DELAY_SECONDS,
+            hedge_min_samples=settings.LLM_HEDGING_MIN_SAMPLES,
+        )
+    
+    if settings.LLM_CACHE_ENABLED:
+        cache_path = None
+        if settings.LLM_CACHE_PERSIST:
+            path_obj = Path(settings.LLM_CACHE_PATH)
+            cache_path = path_obj if path_obj.is_absolute() else BACKEND_DIR / path_obj
+        cache = LLMResponseCache(
+            max_entries=settings.LLM_CACHE_MAX_ENTRIES,
+            ttl_seconds=settings.LLM_CACHE_TTL_SECONDS,
+            db_path=cache_path,
+        )
+        llm_client = CachingLLMClient(llm_client, cache, settings, settings.LLM_CACHE_OPERATIONS)
+    
+    return llm_client
+
+
+def get_llm_client(request: Request) -> LLMClient:
+    return request.app.state.llm_client
+
+
+def build_batch_llm_client(settings: Settings, http_client: httpx.AsyncClient) -> BatchLLMClient:
+    return OpenAIBatchClient(OpenAIClient(settings, http_client), settings.LLM_BATCH_COMPLETION_WINDOW)
+
+
+def get_batch_llm_client(request: Request) -> BatchLLMClient:
+    return request.app.state.batch_llm_client
 
 
 def get_prompt_loader(settings: Settings = Depends(get_settings)) -> PromptLoader:
@@ -52,15 +209,122 @@ def get_prompt_loader(settings: Settings = Depends(get_settings)) -> PromptLoade
     return PromptLoader(prompts_path=prompts_path, version=settings.PROMPT_VERSION)
 
 
-def get_prompt_builder(prompt_loader: PromptLoader = Depends(get_prompt_loader)) -> PromptBuilder:
-    return PromptBuilder(prompt_loader)
+def build_context_compactor(settings: Settings) -> ContextCompactor:
+    return ContextCompactor(
+        max_prompt_tokens=settings.QUESTION_CONTEXT_MAX_PROMPT_TOKENS,
+        recent_turns=settings.QUESTION_CONTEXT_RECENT_TURNS,
+        digest_chars=settings.QUESTION_CONTEXT_DIGEST_CHARS,
+        digest_cache_size=settings.QUESTION_CONTEXT_DIGEST_CACHE_SIZE,
+    )
+
+
+def get_context_compactor(request: Request) -> ContextCompactor:
+    return request.app.state.context_compactor
+
+
+def get_prompt_builder(
+    prompt_loader: PromptLoader = Depends(get_prompt_loader),
+    context_compactor: ContextCompactor = Depends(get_context_compactor),
+) -> PromptBuilder:
+    return PromptBuilder(prompt_loader, context_compactor)
+
+
+def _to_generation_profile(profile: Dict[str, Any]) -> GenerationProfile:
+    return GenerationProfile(
+        model=profile.get("model") or None,
+        temperature=profile.get("temperature"),
+        max_tokens=profile.get("max_tokens"),
+        json_mode=profile.get("json_mode"),
+    )
+
+
+def build_generation_profiles(settings: Settings) -> Dict[str, GenerationProfile]:
+    return {
+        operation: _to_generation_profile(profile)
+        for operation, profile in (settings.LLM_PROFILES or {}).items()
+    }
+
+
+def build_model_cascade(settings: Settings) -> Optional[ModelCascade]:
+    if not settings.LLM_CASCADE_ENABLED:
+        return None
+    cascade = ModelCascade({
+        operation: [
+            CascadeTier(name=tier.get("name") or f"tier-{index + 1}", profile=_to_generation_profile(tier))
+            for index, tier in enumerate(tiers)
+        ]
+        for operation, tiers in (settings.LLM_CASCADE_TIERS or {}).items()
+    })
+    _warn_about_unrouted_cascade_models(cascade, resolve_llm_providers(settings))
+    return cascade
+
+
+def _warn_about_unrouted_cascade_models(cascade: ModelCascade, providers: List[Dict[str, Any]]) -> None:
+    if not providers:
+        return
+    for operation, tiers in cascade.tiers.items():
+        for tier in tiers:
+            model = tier.profile.model
+            if model is None:
+                continue
+            missing = [provider["name"] for provider in providers if model not in provider["models"]]
+            if missing:
+                logger.warning(
+                    "Cascade tier %s/%s asks for model %s, which routed providers %s do not offer; "
+                    "they will serve the tier with their own model",
+                    operation,
+                    tier.name,
+                    model,
+                    ", ".join(missing),
+                )
+
+
+def get_model_cascade(request: Request) -> Optional[ModelCascade]:
+    return request.app.state.model_cascade
+
+
+def build_llm_orchestrator(
+    settings: Settings,
+    llm_client: LLMClient,
+    context_compactor: Optional[ContextCompactor] = None,
+    model_cascade: Optional[ModelCascade] = None,
+) -> LLMOrchestrator:
+    return LLMOrchestrator(
+        llm_client,
+        get_prompt_builder(get_prompt_loader(settings), context_compactor),
+        generation_profiles=build_generation_profiles(settings),
+        model_cascade=model_cascade,
+    )
+
+
+def get_question_pool(request: Request) -> Optional[QuestionPool]:
+    return request.app.state.question_pool
+
+
+def get_question_prefetcher(request: Request) -> Optional[QuestionPrefetcher]:
+    return request.app.state.question_prefetcher
+
+
+def get_single_flight(request: Request) -> SingleFlight:
+    return request.app.state.single_flight
+
+
+def get_database_error_stats(request: Request) -> DatabaseErrorStats:
+    return request.app.state.database_error_stats
 
 
 def get_llm_orchestrator(
     llm_client: LLMClient = Depends(get_llm_client),
     prompt_builder: PromptBuilder = Depends(get_prompt_builder),
+    settings: Settings = Depends(get_settings),
+    model_cascade: Optional[ModelCascade] = Depends(get_model_cascade),
 ) -> LLMOrchestrator:
-    return LLMOrchestrator(llm_client, prompt_builder)
+    return LLMOrchestrator(
+        llm_client,
+        prompt_builder,
+        generation_profiles=build_generation_profiles(settings),
+        model_cascade=model_cascade,
+    )
 
 
 def get_create_interview_use_case(
@@ -81,12 +345,22 @@ def get_delete_interview_use_case(
     return DeleteInterviewUseCase(repository)
 
 
+def get_interview_progress_use_case(
+    interview_repository: InterviewRepository = Depends(get_interview_repository),
+    answer_repository: AnswerRepository = Depends(get_answer_repository),
+) -> GetInterviewProgressUseCase:
+    return GetInterviewProgressUseCase(interview_repository, answer_repository)
+
+
 def get_generate_question_use_case(
     question_repository: QuestionRepository = Depends(get_question_repository),
     interview_repository: InterviewRepository = Depends(get_interview_repository),
     answer_repository: AnswerRepository = Depends(get_answer_repository),
     llm_orchestrator: LLMOrchestrator = Depends(get_llm_orchestrator),
     settings: Settings = Depends(get_settings),
+    question_pool: Optional[QuestionPool] = Depends(get_question_pool),
+    question_prefetcher: Optional[QuestionPrefetcher] = Depends(get_question_prefetcher),
+    single_flight: SingleFlight = Depends(get_single_flight),
 ) -> GenerateQuestionUseCase:
     return GenerateQuestionUseCase(
         question_repository,
@@ -94,6 +368,9 @@ def get_generate_question_use_case(
         answer_repository,
         llm_orchestrator,
         settings.MAX_QUESTIONS_PER_INTERVIEW,
+        question_pool,
+        question_prefetcher,
+        single_flight,
     )
 
 
@@ -107,8 +384,16 @@ def get_submit_answer_use_case(
     answer_repository: AnswerRepository = Depends(get_answer_repository),
     interview_repository: InterviewRepository = Depends(get_interview_repository),
     question_repository: QuestionRepository = Depends(get_question_repository),
+    question_prefetcher: Optional[QuestionPrefetcher] = Depends(get_question_prefetcher),
+    settings: Settings = Depends(get_settings),
 ) -> SubmitAnswerUseCase:
-    return SubmitAnswerUseCase(answer_repository, interview_repository, question_repository)
+    return SubmitAnswerUseCase(
+        answer_repository,
+        interview_repository,
+        question_repository,
+        question_prefetcher,
+        settings.MAX_QUESTIONS_PER_INTERVIEW,
+    )
 
 
 def get_answer_use_case(
@@ -123,11 +408,37 @@ def get_generate_summary_use_case(
     summary_repository: InterviewSummaryRepository = Depends(get_summary_repository),
     question_repository: QuestionRepository = Depends(get_question_repository),
     llm_orchestrator: LLMOrchestrator = Depends(get_llm_orchestrator),
+    single_flight: SingleFlight = Depends(get_single_flight),
 ) -> GenerateSummaryUseCase:
-    return GenerateSummaryUseCase(interview_repository, answer_repository, summary_repository, question_repository, llm_orchestrator)
+    return GenerateSummaryUseCase(
+        interview_repository,
+        answer_repository,
+        summary_repository,
+        question_repository,
+        llm_orchestrator,
+        single_flight,
+    )
 
 
 def get_summary_use_case(
     repository: InterviewSummaryRepository = Depends(get_summary_repository)
 ) -> GetSummaryUseCase:
     return GetSummaryUseCase(repository)
+
+
+def get_batch_summary_use_case(
+    interview_repository: InterviewRepository = Depends(get_interview_repository),
+    answer_repository: AnswerRepository = Depends(get_answer_repository),
+    summary_repository: InterviewSummaryRepository = Depends(get_summary_repository),
+    question_repository: QuestionRepository = Depends(get_question_repository),
+    llm_orchestrator: LLMOrchestrator = Depends(get_llm_orchestrator),
+    batch_client: BatchLLMClient = Depends(get_batch_llm_client),
+) -> BatchSummaryUseCase:
+    return BatchSummaryUseCase(
+        interview_repository,
+        answer_repository,
+        summary_repository,
+        question_repository,
+        llm_orchestrator,
+        batch_client,
+    )
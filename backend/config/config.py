@@ -32,10 +32,76 @@ class Settings(BaseSettings):
     LLM_MODEL: str
     LLM_TEMPERATURE: float = _yaml_config["llm"]["temperature"]
     LLM_MAX_TOKENS: int = _yaml_config["llm"]["max_tokens"]
+    LLM_PROFILES: Dict[str, Dict[str, Any]] = _yaml_config["llm"]["profiles"]
+    LLM_CASCADE_ENABLED: bool = _yaml_config["llm"]["cascade"]["enabled"]
+    LLM_CASCADE_TIERS: Dict[str, List[Dict[str, Any]]] = _yaml_config["llm"]["cascade"]["tiers"]
+    
+    LLM_QUESTION_DEADLINE_SECONDS: float = _yaml_config["llm"]["deadlines"]["question_seconds"]
+    LLM_SUMMARY_DEADLINE_SECONDS: float = _yaml_config["llm"]["deadlines"]["summary_seconds"]
+    LLM_MIN_ATTEMPT_SECONDS: float = _yaml_config["llm"]["deadlines"]["min_attempt_seconds"]
+    
+    LLM_HTTP_MAX_CONNECTIONS: int = _yaml_config["llm"]["http"]["max_connections"]
+    LLM_HTTP_MAX_KEEPALIVE_CONNECTIONS: int = _yaml_config["llm"]["http"]["max_keepalive_connections"]
+    LLM_HTTP_KEEPALIVE_EXPIRY: float = _yaml_config["llm"]["http"]["keepalive_expiry"]
+    LLM_HTTP2: bool = _yaml_config["llm"]["http"]["http2"]
+    LLM_HTTP_PREWARM: bool = _yaml_config["llm"]["http"]["prewarm"]
+    
+    LLM_RATE_LIMIT_ENABLED: bool = _yaml_config["llm"]["rate_limit"]["enabled"]
+    LLM_RATE_LIMIT_REQUESTS_PER_MINUTE: float = _yaml_config["llm"]["rate_limit"]["requests_per_minute"]
+    LLM_RATE_LIMIT_TOKENS_PER_MINUTE: float = _yaml_config["llm"]["rate_limit"]["tokens_per_minute"]
+    LLM_RATE_LIMIT_INITIAL_CONCURRENCY: int = _yaml_config["llm"]["rate_limit"]["initial_concurrency"]
+    LLM_RATE_LIMIT_MIN_CONCURRENCY: int = _yaml_config["llm"]["rate_limit"]["min_concurrency"]
+    LLM_RATE_LIMIT_MAX_CONCURRENCY: int = _yaml_config["llm"]["rate_limit"]["max_concurrency"]
+    LLM_RATE_LIMIT_MAX_RETRIES: int = _yaml_config["llm"]["rate_limit"]["max_retries"]
+    
+    LLM_CIRCUIT_BREAKER_ENABLED: bool = _yaml_config["llm"]["circuit_breaker"]["enabled"]
+    LLM_CIRCUIT_BREAKER_FAILURE_THRESHOLD: int = _yaml_config["llm"]["circuit_breaker"]["failure_threshold"]
+    LLM_CIRCUIT_BREAKER_OPEN_SECONDS: float = _yaml_config["llm"]["circuit_breaker"]["open_seconds"]
+    LLM_CIRCUIT_BREAKER_HALF_OPEN_MAX_CALLS: int = _yaml_config["llm"]["circuit_breaker"]["half_open_max_calls"]
+    
+    LLM_RETRY_BUDGET_ENABLED: bool = _yaml_config["llm"]["retry_budget"]["enabled"]
+    LLM_RETRY_BUDGET_RATIO: float = _yaml_config["llm"]["retry_budget"]["ratio"]
+    LLM_RETRY_BUDGET_MIN_RETRIES: int = _yaml_config["llm"]["retry_budget"]["min_retries"]
+    LLM_RETRY_BUDGET_WINDOW_SECONDS: float = _yaml_config["llm"]["retry_budget"]["window_seconds"]
+    
+    LLM_HEDGING_ENABLED: bool = _yaml_config["llm"]["hedging"]["enabled"]
+    LLM_HEDGING_PERCENTILE: float = _yaml_config["llm"]["hedging"]["percentile"]
+    LLM_HEDGING_MIN_DELAY_SECONDS: float = _yaml_config["llm"]["hedging"]["min_delay_seconds"]
+    LLM_HEDGING_INITIAL_DELAY_SECONDS: float = _yaml_config["llm"]["hedging"]["initial_delay_seconds"]
+    LLM_HEDGING_MIN_SAMPLES: int = _yaml_config["llm"]["hedging"]["min_samples"]
+    
+    LLM_PROVIDERS: List[Dict[str, Any]] = _yaml_config["llm"]["routing"]["providers"]
+    LLM_ROUTING_LATENCY_SMOOTHING: float = _yaml_config["llm"]["routing"]["latency_smoothing"]
+    LLM_ROUTING_ERROR_RATE_THRESHOLD: float = _yaml_config["llm"]["routing"]["error_rate_threshold"]
+    LLM_ROUTING_UNHEALTHY_COOLDOWN_SECONDS: float = _yaml_config["llm"]["routing"]["unhealthy_cooldown_seconds"]
+    LLM_ROUTING_EXPLORATION_RATIO: float = _yaml_config["llm"]["routing"]["exploration_ratio"]
+    LLM_ROUTING_MAX_ATTEMPTS: int = _yaml_config["llm"]["routing"]["max_attempts"]
+    
+    LLM_BATCH_COMPLETION_WINDOW: str = _yaml_config["llm"]["batch"]["completion_window"]
+    LLM_BATCH_POLL_INTERVAL_SECONDS: float = _yaml_config["llm"]["batch"]["poll_interval_seconds"]
+    
+    LLM_CACHE_ENABLED: bool = _yaml_config["llm"]["cache"]["enabled"]
+    LLM_CACHE_MAX_ENTRIES: int = _yaml_config["llm"]["cache"]["max_entries"]
+    LLM_CACHE_TTL_SECONDS: float = _yaml_config["llm"]["cache"]["ttl_seconds"]
+    LLM_CACHE_PERSIST: bool = _yaml_config["llm"]["cache"]["persist"]
+    LLM_CACHE_PATH: str = _yaml_config["llm"]["cache"]["path"]
+    LLM_CACHE_OPERATIONS: List[str] = _yaml_config["llm"]["cache"]["operations"]
     
     MAX_QUESTIONS_PER_INTERVIEW: int = _yaml_config["interview"]["max_questions"]
+    SPECULATIVE_QUESTIONS_ENABLED: bool = _yaml_config["interview"]["speculative_questions"]
+    MAX_PENDING_SPECULATIVE_QUESTIONS: int = _yaml_config["interview"]["max_pending_speculative_questions"]
+    
+    QUESTION_POOL_ENABLED: bool = _yaml_config["question_pool"]["enabled"]
+    QUESTION_POOL_SIZE: int = _yaml_config["question_pool"]["size"]
+    QUESTION_POOL_TOPICS: int = _yaml_config["question_pool"]["topics"]
+    QUESTION_POOL_REFILL_INTERVAL_SECONDS: float = _yaml_config["question_pool"]["refill_interval_seconds"]
+    
     PROMPT_VERSION: str = _yaml_config["prompts"]["version"]
     PROMPT_TEMPLATES_PATH: str = _yaml_config["prompts"]["templates_path"]
+    QUESTION_CONTEXT_MAX_PROMPT_TOKENS: int = _yaml_config["prompts"]["question_context"]["max_prompt_tokens"]
+    QUESTION_CONTEXT_RECENT_TURNS: int = _yaml_config["prompts"]["question_context"]["recent_turns"]
+    QUESTION_CONTEXT_DIGEST_CHARS: int = _yaml_config["prompts"]["question_context"]["digest_chars"]
+    QUESTION_CONTEXT_DIGEST_CACHE_SIZE: int = _yaml_config["prompts"]["question_context"]["digest_cache_size"]
 
 
 settings = Settings()
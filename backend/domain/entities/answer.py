@@ -12,12 +12,32 @@ class Answer:
         interview_id: UUID,
         answer_id: Optional[UUID] = None,
         created_at: Optional[datetime] = None,
+        word_count: Optional[int] = None,
+        clarity_score: Optional[float] = None,
+        confidence_score: Optional[float] = None,
+        is_gibberish: Optional[bool] = None,
+        is_manipulation: Optional[bool] = None,
     ):
         self.answer_id = answer_id or uuid4()
         self.text = text
         self.question_id = question_id
         self.interview_id = interview_id
         self.created_at = created_at or datetime.now(timezone.utc)
+        self.word_count = word_count
+        self.clarity_score = clarity_score
+        self.confidence_score = confidence_score
+        self.is_gibberish = is_gibberish
+        self.is_manipulation = is_manipulation
+    
+    @property
+    def is_scored(self) -> bool:
+        return None not in (
+            self.word_count,
+            self.clarity_score,
+            self.confidence_score,
+            self.is_gibberish,
+            self.is_manipulation,
+        )
     
     def __repr__(self) -> str:
         return f"<Answer(id={self.answer_id}, text='{self.text[:50]}...')>"
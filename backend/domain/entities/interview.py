@@ -14,6 +14,12 @@ class Interview:
         created_at: Optional[datetime] = None,
         updated_at: Optional[datetime] = None,
         completed_at: Optional[datetime] = None,
+        answer_count: Optional[int] = 0,
+        word_count_mean: Optional[float] = 0.0,
+        word_count_m2: Optional[float] = 0.0,
+        flagged_answer_count: Optional[int] = 0,
+        clarity_total: Optional[float] = 0.0,
+        confidence_total: Optional[float] = 0.0,
     ):
         self.interview_id = interview_id or uuid4()
         self.topic = topic
@@ -21,6 +27,12 @@ class Interview:
         self.created_at = created_at or datetime.now(timezone.utc)
         self.updated_at = updated_at or datetime.now(timezone.utc)
         self.completed_at = completed_at
+        self.answer_count = answer_count
+        self.word_count_mean = word_count_mean
+        self.word_count_m2 = word_count_m2
+        self.flagged_answer_count = flagged_answer_count
+        self.clarity_total = clarity_total
+        self.confidence_total = confidence_total
     
     def start(self) -> None:
         if self.status == InterviewStatus.NOT_STARTED:
@@ -36,5 +48,49 @@ class Interview:
     def touch(self) -> None:
         self.updated_at = datetime.now(timezone.utc)
     
+    @property
+    def has_answer_statistics(self) -> bool:
+        return None not in (
+            self.answer_count,
+            self.word_count_mean,
+            self.word_count_m2,
+            self.flagged_answer_count,
+            self.clarity_total,
+            self.confidence_total,
+        )
+    
+    @property
+    def word_count_variance(self) -> float:
+        if not self.answer_count:
+            return 0.0
+        return self.word_count_m2 / self.answer_count
+    
+    def reset_answer_statistics(self) -> None:
+        self.answer_count = 0
+        self.word_count_mean = 0.0
+        self.word_count_m2 = 0.0
+        self.flagged_answer_count = 0
+        self.clarity_total = 0.0
+        self.confidence_total = 0.0
+    
+    def record_answer_metrics(
+        self,
+        word_count: int,
+        clarity_score: float,
+        confidence_score: float,
+        is_gibberish: bool,
+        is_manipulation: bool,
+    ) -> None:
+        if not self.has_answer_statistics:
+            self.reset_answer_statistics()
+        
+        self.answer_count += 1
+        delta = word_count - self.word_count_mean
+        self.word_count_mean += delta / self.answer_count
+        self.word_count_m2 += delta * (word_count - self.word_count_mean)
+        self.flagged_answer_count += int(is_gibberish) + int(is_manipulation)
+        self.clarity_total += clarity_score
+        self.confidence_total += confidence_score
+    
     def __repr__(self) -> str:
         return f"<Interview(id={self.interview_id}, topic='{self.topic}', status={self.status.value})>"
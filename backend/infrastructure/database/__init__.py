@@ -1,4 +1,5 @@
 from infrastructure.database.database import Base, get_db, init_db
+from infrastructure.database.error_stats import DatabaseErrorStats
 from infrastructure.database.models import (
     InterviewModel,
     QuestionModel,
@@ -20,6 +21,7 @@ __all__ = [
     "Base",
     "get_db",
     "init_db",
+    "DatabaseErrorStats",
     "InterviewModel",
     "QuestionModel",
     "AnswerModel",
@@ -0,0 +1,28 @@
+from typing import Dict
+
+from sqlalchemy.exc import IntegrityError, OperationalError, SQLAlchemyError
+
+
+class DatabaseErrorStats:
+    
+    LOCK_MARKERS = ("database is locked", "database table is locked")
+    
+    def __init__(self):
+        self.counts: Dict[str, int] = {"locked": 0, "integrity": 0, "operational": 0, "other": 0}
+    
+    def record(self, error: SQLAlchemyError) -> None:
+        self.counts[self._classify(error)] += 1
+    
+    def stats(self) -> Dict[str, int]:
+        return {"total": sum(self.counts.values()), **self.counts}
+    
+    @classmethod
+    def _classify(cls, error: SQLAlchemyError) -> str:
+        if isinstance(error, OperationalError):
+            message = str(error.orig or error).lower()
+            if any(marker in message for marker in cls.LOCK_MARKERS):
+                return "locked"
+            return "operational"
+        if isinstance(error, IntegrityError):
+            return "integrity"
+        return "other"
@@ -17,6 +17,12 @@ def interview_model_to_entity(model: InterviewModel) -> Interview:
         created_at=model.created_at,
         updated_at=model.updated_at,
         completed_at=model.completed_at,
+        answer_count=model.answer_count,
+        word_count_mean=model.word_count_mean,
+        word_count_m2=model.word_count_m2,
+        flagged_answer_count=model.flagged_answer_count,
+        clarity_total=model.clarity_total,
+        confidence_total=model.confidence_total,
     )
 
 
@@ -28,6 +34,12 @@ def interview_entity_to_model(entity: Interview) -> InterviewModel:
         created_at=entity.created_at,
         updated_at=entity.updated_at,
         completed_at=entity.completed_at,
+        answer_count=entity.answer_count,
+        word_count_mean=entity.word_count_mean,
+        word_count_m2=entity.word_count_m2,
+        flagged_answer_count=entity.flagged_answer_count,
+        clarity_total=entity.clarity_total,
+        confidence_total=entity.confidence_total,
     )
 
 
@@ -58,6 +70,11 @@ def answer_model_to_entity(model: AnswerModel) -> Answer:
         interview_id=UUID(model.interview_id),
         answer_id=UUID(model.answer_id),
         created_at=model.created_at,
+        word_count=model.word_count,
+        clarity_score=model.clarity_score,
+        confidence_score=model.confidence_score,
+        is_gibberish=model.is_gibberish,
+        is_manipulation=model.is_manipulation,
     )
 
 
@@ -68,6 +85,11 @@ def answer_entity_to_model(entity: Answer) -> AnswerModel:
         question_id=str(entity.question_id),
         interview_id=str(entity.interview_id),
         created_at=entity.created_at,
+        word_count=entity.word_count,
+        clarity_score=entity.clarity_score,
+        confidence_score=entity.confidence_score,
+        is_gibberish=entity.is_gibberish,
+        is_manipulation=entity.is_manipulation,
     )
 
 
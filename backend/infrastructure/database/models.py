@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Integer, Float, DateTime, ForeignKey, Text, JSON
+from sqlalchemy import Column, String, Integer, Float, Boolean, DateTime, ForeignKey, Text, JSON
 from sqlalchemy.orm import relationship
 from datetime import datetime, timezone
 import uuid
@@ -24,6 +24,12 @@ class InterviewModel(Base):
     created_at = Column(DateTime, default=get_utc_now, nullable=False)
     updated_at = Column(DateTime, default=get_utc_now, onupdate=get_utc_now, nullable=False)
     completed_at = Column(DateTime, nullable=True)
+    answer_count = Column(Integer, nullable=True, default=0)
+    word_count_mean = Column(Float, nullable=True, default=0.0)
+    word_count_m2 = Column(Float, nullable=True, default=0.0)
+    flagged_answer_count = Column(Integer, nullable=True, default=0)
+    clarity_total = Column(Float, nullable=True, default=0.0)
+    confidence_total = Column(Float, nullable=True, default=0.0)
     
     questions = relationship("QuestionModel", back_populates="interview", cascade="all, delete-orphan")
     answers = relationship("AnswerModel", back_populates="interview", cascade="all, delete-orphan")
@@ -53,6 +59,11 @@ class AnswerModel(Base):
     question_id = Column(String, ForeignKey("questions.question_id"), nullable=False)
     interview_id = Column(String, ForeignKey("interviews.interview_id"), nullable=False)
     created_at = Column(DateTime, default=get_utc_now, nullable=False)
+    word_count = Column(Integer, nullable=True)
+    clarity_score = Column(Float, nullable=True)
+    confidence_score = Column(Float, nullable=True)
+    is_gibberish = Column(Boolean, nullable=True)
+    is_manipulation = Column(Boolean, nullable=True)
     
     question = relationship("QuestionModel", back_populates="answers")
     interview = relationship("InterviewModel", back_populates="answers")
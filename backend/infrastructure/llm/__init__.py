@@ -1,5 +1,26 @@
 from .openai_client import OpenAIClient
+from .http_client import create_llm_http_client, prewarm_llm_http_client
+from .response_cache import LLMResponseCache
+from .caching_client import CachingLLMClient
+from .rate_limiter import AdaptiveRateLimiter
+from .rate_limited_client import RateLimitedLLMClient
+from .circuit_breaker import CircuitBreaker, RetryBudget
+from .resilient_client import ResilientLLMClient
+from .routing_client import RoutedBackend, RoutingLLMClient
+from .openai_batch_client import OpenAIBatchClient
 
 __all__ = [
     "OpenAIClient",
+    "create_llm_http_client",
+    "prewarm_llm_http_client",
+    "LLMResponseCache",
+    "CachingLLMClient",
+    "AdaptiveRateLimiter",
+    "RateLimitedLLMClient",
+    "CircuitBreaker",
+    "RetryBudget",
+    "ResilientLLMClient",
+    "RoutedBackend",
+    "RoutingLLMClient",
+    "OpenAIBatchClient",
 ]
\ No newline at end of file
@@ -0,0 +1,99 @@
+import hashlib
+import json
+from typing import Any, AsyncIterator, Dict, Iterable, Optional
+
+from application.services.llm_data import GenerationProfile
+from application.services.llm_client import LLMClient, LLMPrompt, to_chat_messages
+from config.config import Settings
+from infrastructure.llm.response_cache import LLMResponseCache
+
+
+class CachingLLMClient(LLMClient):
+    
+    def __init__(
+        self,
+        inner: LLMClient,
+        cache: LLMResponseCache,
+        settings: Settings,
+        operations: Iterable[str],
+    ):
+        self.inner = inner
+        self.cache = cache
+        self.settings = settings
+        self.operations = set(operations)
+        self.bypassed = 0
+    
+    async def call(
+        self,
+        prompt: LLMPrompt,
+        operation: Optional[str] = None,
+        profile: Optional[GenerationProfile] = None,
+    ) -> str:
+        if operation not in self.operations:
+            return await self.inner.call(prompt, operation, profile)
+        
+        model = self.inner.resolve_model(profile)
+        if model is None:
+            self.bypassed += 1
+            return await self.inner.call(prompt, operation, profile)
+        
+        key = self._cache_key(model, prompt, profile)
+        cached = await self.cache.get(key)
+        if cached is not None:
+            return cached
+        
+        response = await self.inner.call(prompt, operation, profile)
+        await self.cache.set(key, response)
+        return response
+    
+    async def stream(
+        self,
+        prompt: LLMPrompt,
+        operation: Optional[str] = None,
+        profile: Optional[GenerationProfile] = None,
+    ) -> AsyncIterator[str]:
+        if operation not in self.operations:
+            async for chunk in self.inner.stream(prompt, operation, profile):
+                yield chunk
+            return
+        
+        model = self.inner.resolve_model(profile)
+        if model is None:
+            self.bypassed += 1
+            async for chunk in self.inner.stream(prompt, operation, profile):
+                yield chunk
+            return
+        
+        key = self._cache_key(model, prompt, profile)
+        cached = await self.cache.get(key)
+        if cached is not None:
+            yield cached
+            return
+        
+        chunks = []
+        async for chunk in self.inner.stream(prompt, operation, profile):
+            chunks.append(chunk)
+            yield chunk
+        await self.cache.set(key, "".join(chunks))
+    
+    def resolve_model(self, profile: Optional[GenerationProfile] = None) -> Optional[str]:
+        return self.inner.resolve_model(profile)
+    
+    def stats(self) -> Dict[str, Any]:
+        return {"cache": {**self.cache.stats(), "bypassed": self.bypassed}, **self.inner.stats()}
+    
+    async def aclose(self) -> None:
+        self.cache.close()
+        await self.inner.aclose()
+    
+    def _cache_key(self, model: str, prompt: LLMPrompt, profile: Optional[GenerationProfile]) -> str:
+        profile = profile or GenerationProfile()
+        material = json.dumps([
+            model,
+            self.settings.LLM_TEMPERATURE,
+            self.settings.LLM_MAX_TOKENS,
+            self.settings.PROMPT_VERSION,
+            [profile.model, profile.temperature, profile.max_tokens, profile.json_mode],
+            [[message.role, message.content] for message in to_chat_messages(prompt)],
+        ])
+        return hashlib.sha256(material.encode("utf-8")).hexdigest()
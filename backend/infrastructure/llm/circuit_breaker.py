@@ -0,0 +1,111 @@
+import time
+from collections import deque
+from typing import Any, Deque, Dict
+
+from application.exceptions import LlmCircuitOpenError
+
+
+class CircuitBreaker:
+    
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+    
+    def __init__(self, failure_threshold: int, open_seconds: float, half_open_max_calls: int = 1):
+        self.failure_threshold = failure_threshold
+        self.open_seconds = open_seconds
+        self.half_open_max_calls = half_open_max_calls
+        self.state = self.CLOSED
+        self.consecutive_failures = 0
+        self.opened_at = 0.0
+        self.half_open_calls = 0
+        self.times_opened = 0
+        self.rejected = 0
+    
+    def allow(self) -> None:
+        if self.state == self.OPEN:
+            remaining = self.opened_at + self.open_seconds - time.monotonic()
+            if remaining > 0:
+                self.rejected += 1
+                raise LlmCircuitOpenError("LLM circuit breaker is open", retry_after=remaining)
+            self.state = self.HALF_OPEN
+            self.half_open_calls = 0
+        
+        if self.state == self.HALF_OPEN:
+            if self.half_open_calls >= self.half_open_max_calls:
+                self.rejected += 1
+                raise LlmCircuitOpenError("LLM circuit breaker is half-open", retry_after=self.open_seconds)
+            self.half_open_calls += 1
+    
+    def record_success(self) -> None:
+        self.consecutive_failures = 0
+        if self.state == self.HALF_OPEN:
+            self.state = self.CLOSED
+            self.half_open_calls = 0
+    
+    def record_failure(self) -> None:
+        self.consecutive_failures += 1
+        if self.state == self.HALF_OPEN or self.consecutive_failures >= self.failure_threshold:
+            self._open()
+    
+    def record_ignored(self) -> None:
+        if self.state == self.HALF_OPEN and self.half_open_calls > 0:
+            self.half_open_calls -= 1
+    
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "state": self.state,
+            "consecutive_failures": self.consecutive_failures,
+            "times_opened": self.times_opened,
+            "rejected": self.rejected,
+        }
+    
+    def _open(self) -> None:
+        if self.state != self.OPEN:
+            self.times_opened += 1
+        self.state = self.OPEN
+        self.opened_at = time.monotonic()
+        self.half_open_calls = 0
+
+
+class RetryBudget:
+    
+    def __init__(self, ratio: float, min_retries: int, window_seconds: float):
+        self.ratio = ratio
+        self.min_retries = min_retries
+        self.window_seconds = window_seconds
+        self._requests: Deque[float] = deque()
+        self._retries: Deque[float] = deque()
+        self.total_requests = 0
+        self.total_retries = 0
+        self.exhausted = 0
+    
+    def record_request(self) -> None:
+        self._requests.append(time.monotonic())
+        self.total_requests += 1
+    
+    def try_spend(self) -> bool:
+        now = time.monotonic()
+        self._prune(now)
+        if len(self._retries) >= self.min_retries + self.ratio * len(self._requests):
+            self.exhausted += 1
+            return False
+        self._retries.append(now)
+        self.total_retries += 1
+        return True
+    
+    def stats(self) -> Dict[str, Any]:
+        self._prune(time.monotonic())
+        return {
+            "requests_in_window": len(self._requests),
+            "retries_in_window": len(self._retries),
+            "total_requests": self.total_requests,
+            "total_retries": self.total_retries,
+            "exhausted": self.exhausted,
+        }
+    
+    def _prune(self, now: float) -> None:
+        cutoff = now - self.window_seconds
+        for timestamps in (self._requests, self._retries):
+            while timestamps and timestamps[0] < cutoff:
+                timestamps.popleft()
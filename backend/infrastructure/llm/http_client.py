@@ -0,0 +1,39 @@
+from typing import Optional
+
+import httpx
+
+from application.services.service_constants import ServiceConstants
+from config.config import Settings
+
+
+def create_llm_http_client(settings: Settings) -> httpx.AsyncClient:
+    limits = httpx.Limits(
+        max_connections=settings.LLM_HTTP_MAX_CONNECTIONS,
+        max_keepalive_connections=settings.LLM_HTTP_MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry=settings.LLM_HTTP_KEEPALIVE_EXPIRY,
+    )
+    return httpx.AsyncClient(
+        timeout=ServiceConstants.LLMClient.DEFAULT_TIMEOUT_SECONDS,
+        limits=limits,
+        http2=settings.LLM_HTTP2,
+    )
+
+
+async def prewarm_llm_http_client(
+    client: httpx.AsyncClient,
+    settings: Settings,
+    base_url: Optional[str] = None,
+    api_key: Optional[str] = None,
+) -> bool:
+    api_key = api_key if api_key is not None else settings.LLM_API_KEY
+    api_key = api_key.strip() if api_key else ""
+    headers = {"Authorization": f"Bearer {api_key}"} if api_key else {}
+    try:
+        await client.get(
+            f"{base_url or settings.LLM_BASE_URL}/models",
+            headers=headers,
+            timeout=ServiceConstants.LLMClient.PREWARM_TIMEOUT_SECONDS,
+        )
+        return True
+    except httpx.HTTPError:
+        return False
@@ -0,0 +1,120 @@
+import json
+from typing import Any, Dict, Optional, Tuple
+
+import httpx
+
+from application.exceptions import LlmServiceError
+from application.services.batch_llm_client import BatchLLMClient
+from application.services.llm_client import LLMPrompt
+from application.services.llm_data import BatchJobStatus, BatchResult, GenerationProfile
+from application.services.service_constants import ServiceConstants
+from infrastructure.llm.openai_client import OpenAIClient
+
+
+class OpenAIBatchClient(BatchLLMClient):
+    
+    def __init__(self, openai_client: OpenAIClient, completion_window: str):
+        self.openai_client = openai_client
+        self.client = openai_client.client
+        self.base_url = openai_client.base_url
+        self.completion_window = completion_window
+    
+    async def submit(
+        self,
+        prompts: Dict[str, LLMPrompt],
+        operation: Optional[str] = None,
+        profile: Optional[GenerationProfile] = None,
+    ) -> BatchJobStatus:
+        batch_consts = ServiceConstants.LLMBatch
+        lines = [
+            json.dumps({
+                "custom_id": custom_id,
+                "method": "POST",
+                "url": batch_consts.ENDPOINT,
+                "body": self.openai_client.build_payload(prompt, profile),
+            })
+            for custom_id, prompt in prompts.items()
+        ]
+        
+        file_data = await self._request(
+            "POST",
+            "/files",
+            data={"purpose": batch_consts.FILE_PURPOSE},
+            files={"file": (batch_consts.INPUT_FILE_NAME, "\n".join(lines).encode("utf-8"), "application/jsonl")},
+        )
+        batch_data = await self._request(
+            "POST",
+            "/batches",
+            json={
+                "input_file_id": file_data["id"],
+                "endpoint": batch_consts.ENDPOINT,
+                "completion_window": self.completion_window,
+            },
+        )
+        return self._to_status(batch_data)
+    
+    async def get_status(self, batch_id: str) -> BatchJobStatus:
+        return self._to_status(await self._request("GET", f"/batches/{batch_id}"))
+    
+    async def get_results(self, batch_id: str) -> Dict[str, BatchResult]:
+        batch_data = await self._request("GET", f"/batches/{batch_id}")
+        results: Dict[str, BatchResult] = {}
+        for file_id in (batch_data.get("error_file_id"), batch_data.get("output_file_id")):
+            if not file_id:
+                continue
+            content = await self._request("GET", f"/files/{file_id}/content", expect_json=False)
+            for line in content.splitlines():
+                if line.strip():
+                    custom_id, result = self._parse_result_line(line)
+                    if custom_id:
+                        results[custom_id] = result
+        return results
+    
+    async def _request(self, method: str, path: str, expect_json: bool = True, **kwargs: Any) -> Any:
+        headers = {"Authorization": self.openai_client.build_headers()["Authorization"]}
+        try:
+            response = await self.client.request(method, f"{self.base_url}{path}", headers=headers, **kwargs)
+            response.raise_for_status()
+        except httpx.HTTPStatusError as e:
+            raise LlmServiceError(f"Batch API error: {e.response.status_code} on {method} {path}")
+        except httpx.HTTPError as e:
+            raise LlmServiceError(f"Network error: {str(e)}")
+        
+        if not expect_json:
+            return response.text
+        try:
+            return response.json()
+        except ValueError as e:
+            raise LlmServiceError(f"Batch API returned invalid JSON on {method} {path}") from e
+    
+    @staticmethod
+    def _to_status(batch_data: Dict[str, Any]) -> BatchJobStatus:
+        request_counts = batch_data.get("request_counts") or {}
+        return BatchJobStatus(
+            batch_id=batch_data["id"],
+            status=batch_data.get("status", "unknown"),
+            total=request_counts.get("total", 0),
+            completed=request_counts.get("completed", 0),
+            failed=request_counts.get("failed", 0),
+        )
+    
+    @staticmethod
+    def _parse_result_line(line: str) -> Tuple[Optional[str], Optional[BatchResult]]:
+        try:
+            data = json.loads(line)
+        except ValueError:
+            return None, None
+        
+        custom_id = data.get("custom_id")
+        error = data.get("error")
+        if error:
+            message = error.get("message", str(error)) if isinstance(error, dict) else str(error)
+            return custom_id, BatchResult(error=message)
+        
+        response = data.get("response") or {}
+        if response.get("status_code") != 200:
+            return custom_id, BatchResult(error=f"Batch request failed with status {response.get('status_code')}")
+        try:
+            return custom_id, BatchResult(content=response["body"]["choices"][0]["message"]["content"])
+        except (KeyError, IndexError, TypeError):
+            return custom_id, BatchResult(error="Batch response has no message content")
@@ -1,82 +1,245 @@
+import json
+from email.utils import parsedate_to_datetime
+from datetime import datetime, timezone
+from typing import AsyncIterator, Callable, Dict, Any, Optional
+
 import httpx
 from tenacity import (
+    RetryCallState,
     retry,
     stop_after_attempt,
     wait_exponential,
-    retry_if_exception,
 )
 
-from application.services.llm_client import LLMClient
-from application.exceptions import LlmServiceError
+from application.services.llm_data import GenerationProfile
+from application.services.llm_client import LLMClient, LLMPrompt, to_chat_messages
+from application.exceptions import LlmServiceError, LlmRateLimitError
+from application.services.request_deadline import RequestDeadline
 from application.services.service_constants import ServiceConstants
 from config.config import Settings
+from infrastructure.llm.circuit_breaker import RetryBudget
+
+
+_retry_wait = wait_exponential(
+    multiplier=ServiceConstants.LLMClient.RETRY_WAIT_MULTIPLIER,
+    min=ServiceConstants.LLMClient.RETRY_WAIT_MIN_SECONDS,
+    max=ServiceConstants.LLMClient.RETRY_WAIT_MAX_SECONDS
+)
+
+
+def _deadline_too_short(retry_state: RetryCallState) -> bool:
+    client = retry_state.args[0]
+    return not RequestDeadline.allows(_retry_wait(retry_state) + client.settings.LLM_MIN_ATTEMPT_SECONDS)
+
+
+def _should_retry(retry_state: RetryCallState) -> bool:
+    if retry_state.outcome is None or not retry_state.outcome.failed:
+        return False
+    client = retry_state.args[0]
+    return client._is_retryable_error(retry_state.outcome.exception())
 
 
 class OpenAIClient(LLMClient):
     
-    def __init__(self, settings: Settings):
+    def __init__(
+        self,
+        settings: Settings,
+        http_client: httpx.AsyncClient,
+        retry_rate_limits: bool = True,
+        response_observer: Optional[Callable[[httpx.Response], None]] = None,
+        retry_budget: Optional[RetryBudget] = None,
+        base_url: Optional[str] = None,
+        api_key: Optional[str] = None,
+        model: Optional[str] = None,
+    ):
         self.settings = settings
-        self.api_key = settings.LLM_API_KEY.strip() if settings.LLM_API_KEY else ""
-        self.base_url = settings.LLM_BASE_URL
+        api_key = api_key if api_key is not None else settings.LLM_API_KEY
+        self.api_key = api_key.strip() if api_key else ""
+        self.base_url = base_url or settings.LLM_BASE_URL
+        self.model = model or settings.LLM_MODEL
         self.timeout = ServiceConstants.LLMClient.DEFAULT_TIMEOUT_SECONDS
-        self.client = httpx.AsyncClient(timeout=self.timeout)
+        self.client = http_client
+        self.retry_rate_limits = retry_rate_limits
+        self.response_observer = response_observer
+        self.retry_budget = retry_budget
+        self.json_mode_supported = True
     
-    async def call(self, prompt: str) -> str:
+    async def call(
+        self,
+        prompt: LLMPrompt,
+        operation: Optional[str] = None,
+        profile: Optional[GenerationProfile] = None,
+    ) -> str:
         if not self.api_key:
             raise LlmServiceError("LLM API key not configured")
         
+        if self.retry_budget:
+            self.retry_budget.record_request()
+        
         try:
-            response = await self._call_openai_api(prompt)
+            response = await self._call_openai_api(prompt, profile)
             return response
         except httpx.HTTPStatusError as e:
-            status_code = e.response.status_code
-            error_msg = f"OpenAI API error: {status_code}"
-            if e.response.text:
-                try:
-                    error_data = e.response.json()
-                    error_msg += f" - {error_data.get('error', {}).get('message', e.response.text)}"
-                except (ValueError, KeyError):
-                    truncate_length = ServiceConstants.LLMClient.ERROR_TEXT_TRUNCATE_LENGTH
-                    error_msg += f" - {e.response.text[:truncate_length]}"
-            raise LlmServiceError(error_msg)
+            if self._rejects_json_mode(e, profile):
+                self.json_mode_supported = False
+                return await self.call(prompt, operation, profile)
+            raise self._status_error(e)
         except (httpx.TimeoutException, httpx.RequestError, httpx.HTTPError) as e:
             raise LlmServiceError(f"Network error: {str(e)}")
     
+    async def stream(
+        self,
+        prompt: LLMPrompt,
+        operation: Optional[str] = None,
+        profile: Optional[GenerationProfile] = None,
+    ) -> AsyncIterator[str]:
+        if not self.api_key:
+            raise LlmServiceError("LLM API key not configured")
+        
+        payload = self.build_payload(prompt, profile)
+        payload["stream"] = True
+        
+        try:
+            async with self.client.stream(
+                "POST",
+                f"{self.base_url}/chat/completions",
+                headers=self.build_headers(),
+                json=payload,
+            ) as response:
+                self._observe(response)
+                if response.is_error:
+                    await response.aread()
+                response.raise_for_status()
+                
+                async for line in response.aiter_lines():
+                    content = self._parse_stream_line(line)
+                    if content:
+                        yield content
+        except httpx.HTTPStatusError as e:
+            if not self._rejects_json_mode(e, profile):
+                raise self._status_error(e)
+            self.json_mode_supported = False
+        except (httpx.TimeoutException, httpx.RequestError, httpx.HTTPError) as e:
+            raise LlmServiceError(f"Network error: {str(e)}")
+        else:
+            return
+        
+        async for chunk in self.stream(prompt, operation, profile):
+            yield chunk
+    
     @retry(
-        stop=stop_after_attempt(ServiceConstants.LLMClient.MAX_RETRY_ATTEMPTS),
-        wait=wait_exponential(
-            multiplier=ServiceConstants.LLMClient.RETRY_WAIT_MULTIPLIER,
-            min=ServiceConstants.LLMClient.RETRY_WAIT_MIN_SECONDS,
-            max=ServiceConstants.LLMClient.RETRY_WAIT_MAX_SECONDS
-        ),
-        retry=retry_if_exception(lambda e: (
-            isinstance(e, httpx.TimeoutException) or
-            isinstance(e, (httpx.RequestError, httpx.HTTPError)) or
-            (isinstance(e, httpx.HTTPStatusError) and e.response.status_code in [429, 500, 502, 503, 504])
-        )),
+        stop=stop_after_attempt(ServiceConstants.LLMClient.MAX_RETRY_ATTEMPTS) | _deadline_too_short,
+        wait=_retry_wait,
+        retry=_should_retry,
         reraise=True,
     )
-    async def _call_openai_api(self, prompt: str) -> str:
-        headers = {
+    async def _call_openai_api(self, prompt: LLMPrompt, profile: Optional[GenerationProfile]) -> str:
+        response = await self.client.post(
+            f"{self.base_url}/chat/completions",
+            headers=self.build_headers(),
+            json=self.build_payload(prompt, profile),
+        )
+        self._observe(response)
+        response.raise_for_status()
+        data = response.json()
+        return data["choices"][0]["message"]["content"]
+    
+    def _is_retryable_error(self, error: BaseException) -> bool:
+        if isinstance(error, httpx.HTTPStatusError):
+            status_code = error.response.status_code
+            if status_code == ServiceConstants.LLMClient.RATE_LIMIT_STATUS_CODE:
+                retryable = self.retry_rate_limits
+            else:
+                retryable = status_code in ServiceConstants.LLMClient.RETRYABLE_STATUS_CODES
+        else:
+            retryable = isinstance(error, httpx.HTTPError)
+        
+        if retryable and self.retry_budget:
+            return self.retry_budget.try_spend()
+        return retryable
+    
+    def _observe(self, response: httpx.Response) -> None:
+        if self.response_observer:
+            self.response_observer(response)
+    
+    def resolve_model(self, profile: Optional[GenerationProfile] = None) -> Optional[str]:
+        if profile and profile.model:
+            return profile.model
+        return self.model
+    
+    def build_headers(self) -> Dict[str, str]:
+        return {
             "Authorization": f"Bearer {self.api_key}",
             "Content-Type": "application/json",
         }
-        
+    
+    def build_payload(self, prompt: LLMPrompt, profile: Optional[GenerationProfile] = None) -> Dict[str, Any]:
+        profile = profile or GenerationProfile()
         payload = {
-            "model": self.settings.LLM_MODEL,
+            "model": self.resolve_model(profile),
             "messages": [
-                {"role": "user", "content": prompt}
+                {"role": message.role, "content": message.content}
+                for message in to_chat_messages(prompt)
             ],
-            "temperature": self.settings.LLM_TEMPERATURE,
-            "max_tokens": self.settings.LLM_MAX_TOKENS,
+            "temperature": profile.temperature if profile.temperature is not None else self.settings.LLM_TEMPERATURE,
+            "max_tokens": profile.max_tokens if profile.max_tokens is not None else self.settings.LLM_MAX_TOKENS,
         }
-        
-        response = await self.client.post(
-            f"{self.base_url}/chat/completions",
-            headers=headers,
-            json=payload,
+        if profile.json_mode and self.json_mode_supported:
+            payload["response_format"] = {"type": ServiceConstants.LLMClient.JSON_RESPONSE_FORMAT}
+        return payload
+    
+    def _rejects_json_mode(self, e: httpx.HTTPStatusError, profile: Optional[GenerationProfile]) -> bool:
+        return bool(
+            profile
+            and profile.json_mode
+            and self.json_mode_supported
+            and e.response.status_code in ServiceConstants.LLMClient.JSON_MODE_REJECTED_STATUS_CODES
+            and "response_format" in e.response.text
         )
-        response.raise_for_status()
-        data = response.json()
-        return data["choices"][0]["message"]["content"]
-
+    
+    @staticmethod
+    def _parse_stream_line(line: str) -> str:
+        stream_consts = ServiceConstants.LLMClient
+        if not line.startswith(stream_consts.STREAM_DATA_PREFIX):
+            return ""
+        data = line[len(stream_consts.STREAM_DATA_PREFIX):].strip()
+        if not data or data == stream_consts.STREAM_DONE_MARKER:
+            return ""
+        try:
+            chunk = json.loads(data)
+            choices = chunk.get("choices") or [{}]
+            return choices[0].get("delta", {}).get("content") or ""
+        except (ValueError, AttributeError):
+            return ""
+    
+    @classmethod
+    def _status_error(cls, e: httpx.HTTPStatusError) -> LlmServiceError:
+        status_code = e.response.status_code
+        error_msg = f"OpenAI API error: {status_code}"
+        if e.response.text:
+            try:
+                error_data = e.response.json()
+                error_msg += f" - {error_data.get('error', {}).get('message', e.response.text)}"
+            except (ValueError, KeyError, AttributeError):
+                truncate_length = ServiceConstants.LLMClient.ERROR_TEXT_TRUNCATE_LENGTH
+                error_msg += f" - {e.response.text[:truncate_length]}"
+        if status_code == ServiceConstants.LLMClient.RATE_LIMIT_STATUS_CODE:
+            return LlmRateLimitError(error_msg, retry_after=cls._parse_retry_after(e.response.headers))
+        return LlmServiceError(error_msg)
+    
+    @staticmethod
+    def _parse_retry_after(headers: httpx.Headers) -> Optional[float]:
+        retry_after = headers.get("retry-after")
+        if not retry_after:
+            return None
+        try:
+            return max(float(retry_after), 0.0)
+        except ValueError:
+            pass
+        try:
+            retry_at = parsedate_to_datetime(retry_after)
+        except (TypeError, ValueError):
+            return None
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=timezone.utc)
+        return max((retry_at - datetime.now(timezone.utc)).total_seconds(), 0.0)
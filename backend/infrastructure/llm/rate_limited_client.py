@@ -0,0 +1,87 @@
+from typing import Any, AsyncIterator, Dict, Optional
+
+from application.exceptions import LlmRateLimitError
+from application.services.llm_data import GenerationProfile
+from application.services.llm_client import LLMClient, LLMPrompt, prompt_length
+from application.services.request_deadline import RequestDeadline
+from application.services.service_constants import ServiceConstants
+from infrastructure.llm.rate_limiter import AdaptiveRateLimiter
+
+
+class RateLimitedLLMClient(LLMClient):
+    
+    def __init__(
+        self,
+        inner: LLMClient,
+        limiter: AdaptiveRateLimiter,
+        max_completion_tokens: int,
+        max_rate_limit_retries: int,
+    ):
+        self.inner = inner
+        self.limiter = limiter
+        self.max_completion_tokens = max_completion_tokens
+        self.max_rate_limit_retries = max_rate_limit_retries
+    
+    async def call(
+        self,
+        prompt: LLMPrompt,
+        operation: Optional[str] = None,
+        profile: Optional[GenerationProfile] = None,
+    ) -> str:
+        attempt = 0
+        while True:
+            await self.limiter.acquire(self._estimate_tokens(prompt, profile))
+            try:
+                response = await self.inner.call(prompt, operation, profile)
+            except LlmRateLimitError as e:
+                self.limiter.release(success=False, rate_limited=True, retry_after=e.retry_after)
+                attempt += 1
+                if attempt > self.max_rate_limit_retries or not RequestDeadline.allows(e.retry_after or 0.0):
+                    raise
+                continue
+            except BaseException:
+                self.limiter.release(success=False)
+                raise
+            self.limiter.release(success=True)
+            return response
+    
+    async def stream(
+        self,
+        prompt: LLMPrompt,
+        operation: Optional[str] = None,
+        profile: Optional[GenerationProfile] = None,
+    ) -> AsyncIterator[str]:
+        attempt = 0
+        while True:
+            await self.limiter.acquire(self._estimate_tokens(prompt, profile))
+            started = False
+            try:
+                async for chunk in self.inner.stream(prompt, operation, profile):
+                    started = True
+                    yield chunk
+            except LlmRateLimitError as e:
+                self.limiter.release(success=False, rate_limited=True, retry_after=e.retry_after)
+                attempt += 1
+                if started or attempt > self.max_rate_limit_retries or not RequestDeadline.allows(e.retry_after or 0.0):
+                    raise
+                continue
+            except BaseException:
+                self.limiter.release(success=False)
+                raise
+            self.limiter.release(success=True)
+            return
+    
+    def resolve_model(self, profile: Optional[GenerationProfile] = None) -> Optional[str]:
+        return self.inner.resolve_model(profile)
+    
+    def stats(self) -> Dict[str, Any]:
+        return {"rate_limiter": self.limiter.stats(), **self.inner.stats()}
+    
+    async def aclose(self) -> None:
+        await self.inner.aclose()
+    
+    def _estimate_tokens(self, prompt: LLMPrompt, profile: Optional[GenerationProfile]) -> float:
+        max_completion_tokens = self.max_completion_tokens
+        if profile and profile.max_tokens is not None:
+            max_completion_tokens = profile.max_tokens
+        return prompt_length(prompt) / ServiceConstants.LLMClient.CHARS_PER_TOKEN + max_completion_tokens
@@ -0,0 +1,188 @@
+import asyncio
+import re
+import time
+from collections import deque
+from typing import Any, Deque, Dict, Optional, Tuple
+
+import httpx
+
+
+class TokenBucket:
+    
+    def __init__(self, per_minute: float):
+        self.capacity = float(per_minute)
+        self.rate_per_second = per_minute / 60.0
+        self.tokens = float(per_minute)
+        self.updated_at = time.monotonic()
+    
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate_per_second)
+        self.updated_at = now
+    
+    def seconds_until_available(self, amount: float) -> float:
+        self._refill()
+        amount = min(amount, self.capacity)
+        if self.tokens >= amount:
+            return 0.0
+        return (amount - self.tokens) / self.rate_per_second
+    
+    def consume(self, amount: float) -> None:
+        self._refill()
+        self.tokens -= min(amount, self.capacity)
+    
+    def limit_to(self, remaining: float) -> None:
+        self._refill()
+        self.tokens = min(self.tokens, remaining)
+
+
+class AdaptiveRateLimiter:
+    
+    RESET_DURATION_PATTERN = re.compile(r"(\d+(?:\.\d+)?)(ms|s|m|h)")
+    RESET_DURATION_UNITS = {"ms": 0.001, "s": 1.0, "m": 60.0, "h": 3600.0}
+    
+    def __init__(
+        self,
+        requests_per_minute: float,
+        tokens_per_minute: float,
+        initial_concurrency: int,
+        min_concurrency: int,
+        max_concurrency: int,
+        decrease_factor: float = 0.5,
+        default_pause_seconds: float = 1.0,
+    ):
+        self.request_bucket = TokenBucket(requests_per_minute)
+        self.token_bucket = TokenBucket(tokens_per_minute)
+        self.min_concurrency = min_concurrency
+        self.max_concurrency = max_concurrency
+        self.decrease_factor = decrease_factor
+        self.default_pause_seconds = default_pause_seconds
+        self.concurrency_window = float(initial_concurrency)
+        self.in_flight = 0
+        self.paused_until = 0.0
+        self._waiters: Deque[Tuple[asyncio.Future, float, float]] = deque()
+        self._wake_handle: Optional[asyncio.TimerHandle] = None
+        self.acquired = 0
+        self.rate_limited = 0
+        self.total_wait_seconds = 0.0
+        self.max_wait_seconds = 0.0
+    
+    @property
+    def queue_depth(self) -> int:
+        return len(self._waiters)
+    
+    async def acquire(self, estimated_tokens: float) -> None:
+        loop = asyncio.get_running_loop()
+        waiter = loop.create_future()
+        entry = (waiter, estimated_tokens, time.monotonic())
+        self._waiters.append(entry)
+        self._dispatch()
+        
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                self.in_flight -= 1
+            elif entry in self._waiters:
+                self._waiters.remove(entry)
+            self._dispatch()
+            raise
+    
+    def release(self, success: bool, rate_limited: bool = False, retry_after: Optional[float] = None) -> None:
+        self.in_flight -= 1
+        
+        if rate_limited:
+            self.rate_limited += 1
+            self.concurrency_window = max(
+                float(self.min_concurrency), self.concurrency_window * self.decrease_factor
+            )
+            self.pause(retry_after if retry_after else self.default_pause_seconds)
+        elif success:
+            self.concurrency_window = min(
+                float(self.max_concurrency), self.concurrency_window + 1.0 / self.concurrency_window
+            )
+        
+        self._dispatch()
+    
+    def pause(self, seconds: float) -> None:
+        self.paused_until = max(self.paused_until, time.monotonic() + seconds)
+    
+    def observe_response(self, response: httpx.Response) -> None:
+        headers = response.headers
+        remaining_requests = self._parse_number(headers.get("x-ratelimit-remaining-requests"))
+        remaining_tokens = self._parse_number(headers.get("x-ratelimit-remaining-tokens"))
+        
+        if remaining_requests is not None:
+            self.request_bucket.limit_to(remaining_requests)
+            if remaining_requests <= 0:
+                self._pause_until_reset(headers.get("x-ratelimit-reset-requests"))
+        if remaining_tokens is not None:
+            self.token_bucket.limit_to(remaining_tokens)
+            if remaining_tokens <= 0:
+                self._pause_until_reset(headers.get("x-ratelimit-reset-tokens"))
+    
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "queue_depth": self.queue_depth,
+            "in_flight": self.in_flight,
+            "concurrency_window": round(self.concurrency_window, 2),
+            "paused_for_seconds": round(max(self.paused_until - time.monotonic(), 0.0), 3),
+            "acquired": self.acquired,
+            "rate_limited": self.rate_limited,
+            "total_wait_seconds": round(self.total_wait_seconds, 3),
+            "avg_wait_seconds": round(self.total_wait_seconds / self.acquired, 4) if self.acquired else 0.0,
+            "max_wait_seconds": round(self.max_wait_seconds, 3),
+        }
+    
+    def _dispatch(self) -> None:
+        while self._waiters:
+            waiter, estimated_tokens, enqueued_at = self._waiters[0]
+            if waiter.done():
+                self._waiters.popleft()
+                continue
+            if self.in_flight >= int(self.concurrency_window):
+                return
+            
+            now = time.monotonic()
+            delay = max(
+                self.paused_until - now,
+                self.request_bucket.seconds_until_available(1),
+                self.token_bucket.seconds_until_available(estimated_tokens),
+            )
+            if delay > 0:
+                self._schedule_dispatch(delay)
+                return
+            
+            self._waiters.popleft()
+            self.request_bucket.consume(1)
+            self.token_bucket.consume(estimated_tokens)
+            self.in_flight += 1
+            self.acquired += 1
+            waited = now - enqueued_at
+            self.total_wait_seconds += waited
+            self.max_wait_seconds = max(self.max_wait_seconds, waited)
+            waiter.set_result(None)
+    
+    def _schedule_dispatch(self, delay: float) -> None:
+        if self._wake_handle is not None and not self._wake_handle.cancelled():
+            self._wake_handle.cancel()
+        self._wake_handle = asyncio.get_running_loop().call_later(delay, self._dispatch)
+    
+    def _pause_until_reset(self, reset_value: Optional[str]) -> None:
+        if not reset_value:
+            return
+        seconds = sum(
+            float(amount) * self.RESET_DURATION_UNITS[unit]
+            for amount, unit in self.RESET_DURATION_PATTERN.findall(reset_value)
+        )
+        if seconds > 0:
+            self.pause(seconds)
+    
+    @staticmethod
+    def _parse_number(value: Optional[str]) -> Optional[float]:
+        if value is None:
+            return None
+        try:
+            return float(value)
+        except ValueError:
+            return None
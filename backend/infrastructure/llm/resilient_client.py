@@ -0,0 +1,155 @@
+import asyncio
+import time
+from collections import deque
+from typing import Any, AsyncIterator, Deque, Dict, Optional
+
+from application.exceptions import LlmServiceError, LlmRateLimitError
+from application.services.llm_data import GenerationProfile
+from application.services.llm_client import LLMClient, LLMPrompt
+from infrastructure.llm.circuit_breaker import CircuitBreaker, RetryBudget
+
+
+class ResilientLLMClient(LLMClient):
+    
+    def __init__(
+        self,
+        inner: LLMClient,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        retry_budget: Optional[RetryBudget] = None,
+        hedging_enabled: bool = False,
+        hedge_percentile: float = 0.95,
+        hedge_min_delay_seconds: float = 0.5,
+        hedge_initial_delay_seconds: float = 5.0,
+        hedge_min_samples: int = 20,
+        latency_window: int = 200,
+    ):
+        self.inner = inner
+        self.circuit_breaker = circuit_breaker
+        self.retry_budget = retry_budget
+        self.hedging_enabled = hedging_enabled
+        self.hedge_percentile = hedge_percentile
+        self.hedge_min_delay_seconds = hedge_min_delay_seconds
+        self.hedge_initial_delay_seconds = hedge_initial_delay_seconds
+        self.hedge_min_samples = hedge_min_samples
+        self._latencies: Deque[float] = deque(maxlen=latency_window)
+        self.hedged = 0
+        self.hedge_wins = 0
+    
+    async def call(
+        self,
+        prompt: LLMPrompt,
+        operation: Optional[str] = None,
+        profile: Optional[GenerationProfile] = None,
+    ) -> str:
+        if self.circuit_breaker:
+            self.circuit_breaker.allow()
+        
+        try:
+            if self.hedging_enabled:
+                response = await self._hedged_call(prompt, operation, profile)
+            else:
+                response = await self._timed_call(prompt, operation, profile)
+        except BaseException as e:
+            self._record_error(e)
+            raise
+        
+        if self.circuit_breaker:
+            self.circuit_breaker.record_success()
+        return response
+    
+    async def stream(
+        self,
+        prompt: LLMPrompt,
+        operation: Optional[str] = None,
+        profile: Optional[GenerationProfile] = None,
+    ) -> AsyncIterator[str]:
+        if self.circuit_breaker:
+            self.circuit_breaker.allow()
+        
+        try:
+            async for chunk in self.inner.stream(prompt, operation, profile):
+                yield chunk
+        except BaseException as e:
+            self._record_error(e)
+            raise
+        
+        if self.circuit_breaker:
+            self.circuit_breaker.record_success()
+    
+    def resolve_model(self, profile: Optional[GenerationProfile] = None) -> Optional[str]:
+        return self.inner.resolve_model(profile)
+    
+    def stats(self) -> Dict[str, Any]:
+        resilience: Dict[str, Any] = {}
+        if self.circuit_breaker:
+            resilience["circuit_breaker"] = self.circuit_breaker.stats()
+        if self.retry_budget:
+            resilience["retry_budget"] = self.retry_budget.stats()
+        if self.hedging_enabled:
+            resilience["hedging"] = {
+                "hedge_delay_seconds": round(self._hedge_delay(), 3),
+                "hedged": self.hedged,
+                "hedge_wins": self.hedge_wins,
+            }
+        return {"resilience": resilience, **self.inner.stats()}
+    
+    async def aclose(self) -> None:
+        await self.inner.aclose()
+    
+    async def _timed_call(
+        self,
+        prompt: LLMPrompt,
+        operation: Optional[str],
+        profile: Optional[GenerationProfile],
+    ) -> str:
+        started_at = time.monotonic()
+        response = await self.inner.call(prompt, operation, profile)
+        self._latencies.append(time.monotonic() - started_at)
+        return response
+    
+    async def _hedged_call(
+        self,
+        prompt: LLMPrompt,
+        operation: Optional[str],
+        profile: Optional[GenerationProfile],
+    ) -> str:
+        primary = asyncio.create_task(self._timed_call(prompt, operation, profile))
+        hedge = None
+        try:
+            done, _ = await asyncio.wait({primary}, timeout=self._hedge_delay())
+            if done or (self.retry_budget and not self.retry_budget.try_spend()):
+                return await primary
+            
+            self.hedged += 1
+            hedge = asyncio.create_task(self._timed_call(prompt, operation, profile))
+            pending = {primary, hedge}
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if not task.cancelled() and task.exception() is None:
+                        if task is hedge:
+                            self.hedge_wins += 1
+                        return task.result()
+            failed = [task for task in (primary, hedge) if not task.cancelled()]
+            if not failed:
+                raise LlmServiceError("Hedged LLM call was cancelled")
+            raise failed[0].exception()
+        finally:
+            for task in (primary, hedge):
+                if task is not None:
+                    task.cancel()
+    
+    def _hedge_delay(self) -> float:
+        if len(self._latencies) < self.hedge_min_samples:
+            return self.hedge_initial_delay_seconds
+        ordered = sorted(self._latencies)
+        index = min(int(len(ordered) * self.hedge_percentile), len(ordered) - 1)
+        return max(ordered[index], self.hedge_min_delay_seconds)
+    
+    def _record_error(self, error: BaseException) -> None:
+        if not self.circuit_breaker:
+            return
+        if isinstance(error, LlmServiceError) and not isinstance(error, LlmRateLimitError):
+            self.circuit_breaker.record_failure()
+        else:
+            self.circuit_breaker.record_ignored()
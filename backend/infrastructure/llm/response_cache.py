@@ -0,0 +1,108 @@
+import asyncio
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+
+class LLMResponseCache:
+    
+    def __init__(self, max_entries: int, ttl_seconds: float, db_path: Optional[Path] = None):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.db_path = db_path
+        self._entries: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+        self._connection: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        
+        if db_path:
+            db_path.parent.mkdir(parents=True, exist_ok=True)
+            self._connection = sqlite3.connect(str(db_path), check_same_thread=False)
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS llm_cache (key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL NOT NULL)"
+            )
+            self._connection.execute("DELETE FROM llm_cache WHERE expires_at <= ?", (time.time(),))
+            self._connection.commit()
+    
+    async def get(self, key: str) -> Optional[str]:
+        value = self._get_from_memory(key)
+        if value is not None:
+            self.memory_hits += 1
+            return value
+        
+        if self._connection is not None:
+            row = await asyncio.to_thread(self._get_from_disk, key)
+            if row is not None:
+                expires_at, value = row
+                self._put_in_memory(key, value, expires_at)
+                self.disk_hits += 1
+                return value
+        
+        self.misses += 1
+        return None
+    
+    async def set(self, key: str, value: str) -> None:
+        expires_at = time.time() + self.ttl_seconds
+        self._put_in_memory(key, value, expires_at)
+        if self._connection is not None:
+            await asyncio.to_thread(self._put_on_disk, key, value, expires_at)
+    
+    def stats(self) -> Dict[str, Any]:
+        hits = self.memory_hits + self.disk_hits
+        lookups = hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "memory_hits": self.memory_hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "hit_rate": round(hits / lookups, 4) if lookups else 0.0,
+        }
+    
+    def close(self) -> None:
+        if self._connection is not None:
+            with self._lock:
+                self._connection.close()
+                self._connection = None
+    
+    def _get_from_memory(self, key: str) -> Optional[str]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= time.time():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+    
+    def _put_in_memory(self, key: str, value: str, expires_at: float) -> None:
+        self._entries[key] = (expires_at, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+    
+    def _get_from_disk(self, key: str) -> Optional[Tuple[float, str]]:
+        with self._lock:
+            if self._connection is None:
+                return None
+            row = self._connection.execute(
+                "SELECT expires_at, value FROM llm_cache WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None or row[0] <= time.time():
+            return None
+        return row[0], row[1]
+    
+    def _put_on_disk(self, key: str, value: str, expires_at: float) -> None:
+        with self._lock:
+            if self._connection is None:
+                return
+            self._connection.execute(
+                "INSERT OR REPLACE INTO llm_cache (key, value, expires_at) VALUES (?, ?, ?)",
+                (key, value, expires_at),
+            )
+            self._connection.commit()
@@ -0,0 +1,189 @@
+import random
+import time
+from dataclasses import replace
+from typing import Any, AsyncIterator, Dict, Iterable, List, Optional
+
+from application.exceptions import LlmServiceError, LlmRateLimitError
+from application.services.llm_data import GenerationProfile
+from application.services.llm_client import LLMClient, LLMPrompt
+
+
+class RoutedBackend:
+    
+    def __init__(self, name: str, client: LLMClient, weight: float = 1.0, models: Iterable[str] = ()):
+        self.name = name
+        self.client = client
+        self.weight = weight
+        self.models = frozenset(models)
+        self.latencies: Dict[str, float] = {}
+        self.error_rate = 0.0
+        self.unhealthy_until = 0.0
+        self.in_flight = 0
+        self.calls = 0
+        self.failures = 0
+    
+    def profile_for(self, profile: Optional[GenerationProfile]) -> Optional[GenerationProfile]:
+        if profile is None or profile.model is None or profile.model in self.models:
+            return profile
+        return replace(profile, model=None)
+    
+    def is_healthy(self, now: float) -> bool:
+        return now >= self.unhealthy_until
+    
+    def expected_latency(self, latency_key: str) -> float:
+        if latency_key in self.latencies:
+            return self.latencies[latency_key]
+        if self.latencies:
+            return sum(self.latencies.values()) / len(self.latencies)
+        return 0.0
+    
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "weight": self.weight,
+            "models": sorted(self.models),
+            "healthy": self.is_healthy(time.monotonic()),
+            "latency_ms": {key: round(value * 1000, 1) for key, value in self.latencies.items()},
+            "error_rate": round(self.error_rate, 4),
+            "in_flight": self.in_flight,
+            "calls": self.calls,
+            "failures": self.failures,
+            **self.client.stats(),
+        }
+
+
+class RoutingLLMClient(LLMClient):
+    
+    def __init__(
+        self,
+        backends: List[RoutedBackend],
+        latency_smoothing: float = 0.2,
+        error_rate_threshold: float = 0.5,
+        unhealthy_cooldown_seconds: float = 10.0,
+        exploration_ratio: float = 0.05,
+        max_attempts: int = 2,
+    ):
+        if not backends:
+            raise ValueError("RoutingLLMClient requires at least one backend")
+        self.backends = backends
+        self.latency_smoothing = latency_smoothing
+        self.error_rate_threshold = error_rate_threshold
+        self.unhealthy_cooldown_seconds = unhealthy_cooldown_seconds
+        self.exploration_ratio = exploration_ratio
+        self.max_attempts = max_attempts
+        self.failovers = 0
+    
+    async def call(
+        self,
+        prompt: LLMPrompt,
+        operation: Optional[str] = None,
+        profile: Optional[GenerationProfile] = None,
+    ) -> str:
+        latency_key = operation or "default"
+        last_error: Optional[LlmServiceError] = None
+        
+        for attempt, backend in enumerate(self._candidates(latency_key)):
+            if attempt > 0:
+                self.failovers += 1
+            started_at = time.monotonic()
+            backend.in_flight += 1
+            try:
+                response = await backend.client.call(prompt, operation, backend.profile_for(profile))
+            except LlmServiceError as e:
+                self._record_failure(backend, e)
+                last_error = e
+                continue
+            finally:
+                backend.in_flight -= 1
+            self._record_success(backend, latency_key, time.monotonic() - started_at)
+            return response
+        
+        raise last_error
+    
+    async def stream(
+        self,
+        prompt: LLMPrompt,
+        operation: Optional[str] = None,
+        profile: Optional[GenerationProfile] = None,
+    ) -> AsyncIterator[str]:
+        latency_key = f"{operation or 'default'}:first_chunk"
+        last_error: Optional[LlmServiceError] = None
+        
+        for attempt, backend in enumerate(self._candidates(latency_key)):
+            if attempt > 0:
+                self.failovers += 1
+            started_at = time.monotonic()
+            first_chunk_latency = None
+            backend.in_flight += 1
+            try:
+                async for chunk in backend.client.stream(prompt, operation, backend.profile_for(profile)):
+                    if first_chunk_latency is None:
+                        first_chunk_latency = time.monotonic() - started_at
+                    yield chunk
+            except LlmServiceError as e:
+                self._record_failure(backend, e)
+                if first_chunk_latency is not None:
+                    raise
+                last_error = e
+                continue
+            finally:
+                backend.in_flight -= 1
+            self._record_success(backend, latency_key, first_chunk_latency or time.monotonic() - started_at)
+            return
+        
+        raise last_error
+    
+    def resolve_model(self, profile: Optional[GenerationProfile] = None) -> Optional[str]:
+        models = {backend.client.resolve_model(backend.profile_for(profile)) for backend in self.backends}
+        if len(models) == 1:
+            return models.pop()
+        return None
+    
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "router": {
+                "failovers": self.failovers,
+                "backends": [backend.stats() for backend in self.backends],
+            },
+        }
+    
+    async def aclose(self) -> None:
+        for backend in self.backends:
+            await backend.client.aclose()
+    
+    def _candidates(self, latency_key: str) -> List[RoutedBackend]:
+        now = time.monotonic()
+        healthy = [backend for backend in self.backends if backend.is_healthy(now)]
+        if not healthy:
+            healthy = [min(self.backends, key=lambda backend: backend.unhealthy_until)]
+        
+        ranked = sorted(healthy, key=lambda backend: self._score(backend, latency_key))
+        if len(ranked) > 1 and random.random() < self.exploration_ratio:
+            explored = random.choices(ranked, weights=[backend.weight for backend in ranked])[0]
+            ranked.remove(explored)
+            ranked.insert(0, explored)
+        return ranked[:self.max_attempts]
+    
+    @staticmethod
+    def _score(backend: RoutedBackend, latency_key: str) -> float:
+        return backend.expected_latency(latency_key) * (1 + backend.in_flight) / backend.weight
+    
+    def _record_success(self, backend: RoutedBackend, latency_key: str, latency: float) -> None:
+        backend.calls += 1
+        previous = backend.latencies.get(latency_key)
+        if previous is None:
+            backend.latencies[latency_key] = latency
+        else:
+            backend.latencies[latency_key] = previous + self.latency_smoothing * (latency - previous)
+        backend.error_rate *= 1 - self.latency_smoothing
+    
+    def _record_failure(self, backend: RoutedBackend, error: LlmServiceError) -> None:
+        backend.calls += 1
+        backend.failures += 1
+        now = time.monotonic()
+        if isinstance(error, LlmRateLimitError) and error.retry_after:
+            backend.unhealthy_until = max(backend.unhealthy_until, now + error.retry_after)
+            return
+        backend.error_rate += self.latency_smoothing * (1 - backend.error_rate)
+        if backend.error_rate >= self.error_rate_threshold:
+            backend.unhealthy_until = now + self.unhealthy_cooldown_seconds
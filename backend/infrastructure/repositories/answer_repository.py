@@ -2,12 +2,12 @@ from typing import List
 from uuid import UUID
 
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, update
 from sqlalchemy.exc import SQLAlchemyError
 
-from domain.entities import Answer
+from domain.entities import Answer, Interview
 from application.repository_interfaces import AnswerRepository
-from infrastructure.database.models import AnswerModel
+from infrastructure.database.models import AnswerModel, InterviewModel
 from infrastructure.database.mappers import (
     answer_model_to_entity,
     answer_entity_to_model,
@@ -30,6 +30,64 @@ class SqlAnswerRepository(AnswerRepository):
             await self.db.rollback()
             raise
     
+    async def create_for_interview(self, answer: Answer, interview: Interview, reset_statistics: bool = False) -> Answer:
+        try:
+            model = answer_entity_to_model(answer)
+            self.db.add(model)
+            await self.db.flush()
+            
+            interview_filter = InterviewModel.interview_id == str(interview.interview_id)
+            await self.db.execute(
+                update(InterviewModel)
+                .where(interview_filter)
+                .values(
+                    status=interview.status.value,
+                    updated_at=interview.updated_at,
+                    completed_at=interview.completed_at,
+                )
+            )
+            if reset_statistics:
+                await self.db.execute(
+                    update(InterviewModel)
+                    .where(interview_filter)
+                    .values(
+                        answer_count=interview.answer_count,
+                        word_count_mean=interview.word_count_mean,
+                        word_count_m2=interview.word_count_m2,
+                        flagged_answer_count=interview.flagged_answer_count,
+                        clarity_total=interview.clarity_total,
+                        confidence_total=interview.confidence_total,
+                    )
+                )
+            await self.db.execute(
+                update(InterviewModel)
+                .where(interview_filter)
+                .values(**self._recorded_statistics(answer))
+                .execution_options(synchronize_session=False)
+            )
+            
+            await self.db.commit()
+            await self.db.refresh(model)
+            return answer_model_to_entity(model)
+        except SQLAlchemyError:
+            await self.db.rollback()
+            raise
+    
+    @staticmethod
+    def _recorded_statistics(answer: Answer) -> dict:
+        count = InterviewModel.answer_count
+        mean = InterviewModel.word_count_mean
+        delta = answer.word_count - mean
+        updated_mean = mean + delta / (count + 1)
+        return {
+            "answer_count": count + 1,
+            "word_count_mean": updated_mean,
+            "word_count_m2": InterviewModel.word_count_m2 + delta * (answer.word_count - updated_mean),
+            "flagged_answer_count": InterviewModel.flagged_answer_count + int(answer.is_gibberish) + int(answer.is_manipulation),
+            "clarity_total": InterviewModel.clarity_total + answer.clarity_score,
+            "confidence_total": InterviewModel.confidence_total + answer.confidence_score,
+        }
+    
     async def get_by_interview_id(self, interview_id: UUID) -> List[Answer]:
         result = await self.db.execute(
             select(AnswerModel)
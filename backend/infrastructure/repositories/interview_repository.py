@@ -2,12 +2,12 @@ from typing import Optional, List
 from uuid import UUID
 
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, delete
+from sqlalchemy import select, delete, func, update
 from sqlalchemy.exc import SQLAlchemyError
 
 from domain.entities import Interview
 from application.repository_interfaces import InterviewRepository
-from infrastructure.database.models import InterviewModel
+from infrastructure.database.models import AnswerModel, InterviewModel
 from infrastructure.database.mappers import (
     interview_model_to_entity,
     interview_entity_to_model,
@@ -58,6 +58,34 @@ class SqlInterviewRepository(InterviewRepository):
             await self.db.rollback()
             raise
     
+    async def replace_answer_statistics(self, interview: Interview) -> bool:
+        interview_id = str(interview.interview_id)
+        stored_answer_count = (
+            select(func.count(AnswerModel.answer_id))
+            .where(AnswerModel.interview_id == interview_id)
+            .scalar_subquery()
+        )
+        try:
+            result = await self.db.execute(
+                update(InterviewModel)
+                .where(InterviewModel.interview_id == interview_id)
+                .where(stored_answer_count == interview.answer_count)
+                .values(
+                    answer_count=interview.answer_count,
+                    word_count_mean=interview.word_count_mean,
+                    word_count_m2=interview.word_count_m2,
+                    flagged_answer_count=interview.flagged_answer_count,
+                    clarity_total=interview.clarity_total,
+                    confidence_total=interview.confidence_total,
+                )
+                .execution_options(synchronize_session=False)
+            )
+            await self.db.commit()
+            return result.rowcount > 0
+        except SQLAlchemyError:
+            await self.db.rollback()
+            raise
+    
     async def delete(self, interview_id: UUID) -> bool:
         try:
             result = await self.db.execute(
@@ -73,3 +101,12 @@ class SqlInterviewRepository(InterviewRepository):
         result = await self.db.execute(select(InterviewModel))
         models = result.scalars().all()
         return [interview_model_to_entity(model) for model in models]
+    
+    async def get_frequent_topics(self, limit: int) -> List[str]:
+        result = await self.db.execute(
+            select(InterviewModel.topic)
+            .group_by(InterviewModel.topic)
+            .order_by(func.count(InterviewModel.interview_id).desc())
+            .limit(limit)
+        )
+        return list(result.scalars().all())
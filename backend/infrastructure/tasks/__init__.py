@@ -0,0 +1,7 @@
+from infrastructure.tasks.question_pool_refresher import QuestionPoolRefresher
+from infrastructure.tasks.batch_summary_runner import BatchSummaryRunner
+
+__all__ = [
+    "QuestionPoolRefresher",
+    "BatchSummaryRunner",
+]
@@ -0,0 +1,87 @@
+import argparse
+import asyncio
+import logging
+from typing import List, Optional
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from application.dtos import SubmitBatchSummaryDTO, BatchSummaryJobDTO
+from application.services.batch_llm_client import BatchLLMClient
+from application.services.llm_orchestrator import LLMOrchestrator
+from application.services.service_constants import ServiceConstants
+from application.use_cases import BatchSummaryUseCase
+from infrastructure.repositories import (
+    SqlInterviewRepository,
+    SqlAnswerRepository,
+    SqlInterviewSummaryRepository,
+    SqlQuestionRepository,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class BatchSummaryRunner:
+    
+    def __init__(
+        self,
+        batch_client: BatchLLMClient,
+        llm_orchestrator: LLMOrchestrator,
+        session_factory: async_sessionmaker,
+        poll_interval_seconds: float,
+    ):
+        self.batch_client = batch_client
+        self.llm_orchestrator = llm_orchestrator
+        self.session_factory = session_factory
+        self.poll_interval_seconds = poll_interval_seconds
+    
+    async def run(self, interview_ids: Optional[List[UUID]] = None) -> BatchSummaryJobDTO:
+        async with self.session_factory() as session:
+            job = await self._build_use_case(session).submit(SubmitBatchSummaryDTO(interview_ids=interview_ids))
+        logger.info("Submitted batch %s with %d interviews", job.batch_id, len(job.interview_ids))
+        
+        while True:
+            async with self.session_factory() as session:
+                collected = await self._build_use_case(session).collect(job.batch_id)
+            if collected.status in ServiceConstants.LLMBatch.FINISHED_STATUSES:
+                return collected
+            logger.info("Batch %s is %s (%d/%d)", job.batch_id, collected.status, collected.completed, collected.total)
+            await asyncio.sleep(self.poll_interval_seconds)
+    
+    def _build_use_case(self, session) -> BatchSummaryUseCase:
+        return BatchSummaryUseCase(
+            SqlInterviewRepository(session),
+            SqlAnswerRepository(session),
+            SqlInterviewSummaryRepository(session),
+            SqlQuestionRepository(session),
+            self.llm_orchestrator,
+            self.batch_client,
+        )
+
+
+async def _main(interview_ids: List[UUID]) -> None:
+    from composition import build_batch_llm_client, build_context_compactor, build_llm_orchestrator
+    from config.config import settings
+    from infrastructure.database.database import init_db, AsyncSessionLocal
+    from infrastructure.llm import OpenAIClient, create_llm_http_client
+    
+    await init_db()
+    http_client = create_llm_http_client(settings)
+    try:
+        runner = BatchSummaryRunner(
+            build_batch_llm_client(settings, http_client),
+            build_llm_orchestrator(settings, OpenAIClient(settings, http_client), build_context_compactor(settings)),
+            AsyncSessionLocal,
+            settings.LLM_BATCH_POLL_INTERVAL_SECONDS,
+        )
+        job = await runner.run(interview_ids or None)
+        print(job.model_dump_json(indent=2))
+    finally:
+        await http_client.aclose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Summarize pending interviews through the LLM batch API")
+    parser.add_argument("interview_ids", nargs="*", type=UUID)
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(_main(parser.parse_args().interview_ids))
@@ -0,0 +1,62 @@
+import asyncio
+import logging
+from typing import Optional
+
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from application.services.llm_orchestrator import LLMOrchestrator
+from application.services.question_pool import QuestionPool
+from infrastructure.repositories import SqlInterviewRepository
+
+logger = logging.getLogger(__name__)
+
+
+class QuestionPoolRefresher:
+    
+    def __init__(
+        self,
+        question_pool: QuestionPool,
+        llm_orchestrator: LLMOrchestrator,
+        session_factory: async_sessionmaker,
+        topic_limit: int,
+        interval_seconds: float,
+    ):
+        self.question_pool = question_pool
+        self.llm_orchestrator = llm_orchestrator
+        self.session_factory = session_factory
+        self.topic_limit = topic_limit
+        self.interval_seconds = interval_seconds
+        self._task: Optional[asyncio.Task] = None
+    
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+    
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+    
+    async def refresh_once(self) -> int:
+        async with self.session_factory() as session:
+            topics = await SqlInterviewRepository(session).get_frequent_topics(self.topic_limit)
+        
+        added = 0
+        for topic in topics:
+            added += await self.question_pool.refill(topic, self.llm_orchestrator)
+        return added
+    
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.refresh_once()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.warning("Question pool refresh failed", exc_info=True)
+            await asyncio.sleep(self.interval_seconds)
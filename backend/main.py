@@ -1,3 +1,4 @@
+import asyncio
 from contextlib import asynccontextmanager
 import uvicorn
 
@@ -5,8 +6,23 @@ from fastapi import FastAPI
 from fastapi.exceptions import RequestValidationError
 from sqlalchemy.exc import SQLAlchemyError
 
-from application.exceptions import NotFoundException, BusinessRuleException, ValidationException, LlmServiceError
-from infrastructure.database.database import init_db
+from application.exceptions import NotFoundException, BusinessRuleException, ValidationException, LlmServiceError, LlmCircuitOpenError, LlmDeadlineExceededError
+from application.services.question_pool import QuestionPool
+from application.services.question_prefetcher import QuestionPrefetcher
+from application.services.single_flight import SingleFlight
+from composition import (
+    build_llm_client,
+    build_llm_orchestrator,
+    build_batch_llm_client,
+    build_context_compactor,
+    build_model_cascade,
+    resolve_llm_providers,
+)
+from config.config import settings
+from infrastructure.database.database import init_db, AsyncSessionLocal
+from infrastructure.database.error_stats import DatabaseErrorStats
+from infrastructure.llm import create_llm_http_client, prewarm_llm_http_client
+from infrastructure.tasks import QuestionPoolRefresher
 from presentation.routers import register_routers
 from presentation.common import (
     setup_middleware,
@@ -16,13 +32,65 @@ from presentation.common import (
     validation_exception_handler_app,
     database_exception_handler,
     llm_service_exception_handler,
+    llm_circuit_open_exception_handler,
+    llm_deadline_exceeded_exception_handler,
 )
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     await init_db()
-    yield
+    
+    llm_http_client = create_llm_http_client(settings)
+    if settings.LLM_HTTP_PREWARM:
+        providers = resolve_llm_providers(settings)
+        if providers:
+            await asyncio.gather(*[
+                prewarm_llm_http_client(llm_http_client, settings, provider["base_url"], provider["api_key"])
+                for provider in providers
+            ])
+        else:
+            await prewarm_llm_http_client(llm_http_client, settings)
+    app.state.llm_http_client = llm_http_client
+    llm_client = build_llm_client(settings, llm_http_client)
+    app.state.llm_client = llm_client
+    app.state.batch_llm_client = build_batch_llm_client(settings, llm_http_client)
+    app.state.context_compactor = build_context_compactor(settings)
+    app.state.model_cascade = build_model_cascade(settings)
+    llm_orchestrator = build_llm_orchestrator(
+        settings, llm_client, app.state.context_compactor, app.state.model_cascade
+    )
+    app.state.single_flight = SingleFlight()
+    app.state.database_error_stats = DatabaseErrorStats()
+    
+    app.state.question_prefetcher = None
+    if settings.SPECULATIVE_QUESTIONS_ENABLED:
+        app.state.question_prefetcher = QuestionPrefetcher(
+            llm_orchestrator, settings.MAX_PENDING_SPECULATIVE_QUESTIONS
+        )
+    
+    app.state.question_pool = None
+    question_pool_refresher = None
+    if settings.QUESTION_POOL_ENABLED:
+        app.state.question_pool = QuestionPool(settings.QUESTION_POOL_SIZE)
+        question_pool_refresher = QuestionPoolRefresher(
+            app.state.question_pool,
+            llm_orchestrator,
+            AsyncSessionLocal,
+            settings.QUESTION_POOL_TOPICS,
+            settings.QUESTION_POOL_REFILL_INTERVAL_SECONDS,
+        )
+        question_pool_refresher.start()
+    
+    try:
+        yield
+    finally:
+        if question_pool_refresher:
+            await question_pool_refresher.stop()
+        if app.state.question_prefetcher:
+            app.state.question_prefetcher.clear()
+        await llm_client.aclose()
+        await llm_http_client.aclose()
 
 
 app = FastAPI(
@@ -41,6 +109,8 @@ app.add_exception_handler(BusinessRuleException, business_rule_exception_handler
 app.add_exception_handler(ValidationException, validation_exception_handler_app)
 app.add_exception_handler(SQLAlchemyError, database_exception_handler)
 app.add_exception_handler(LlmServiceError, llm_service_exception_handler)
+app.add_exception_handler(LlmCircuitOpenError, llm_circuit_open_exception_handler)
+app.add_exception_handler(LlmDeadlineExceededError, llm_deadline_exceeded_exception_handler)
 
 register_routers(app)
 
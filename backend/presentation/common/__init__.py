@@ -5,10 +5,14 @@ from .error_handler import (
     validation_exception_handler_app,
     database_exception_handler,
     llm_service_exception_handler,
+    llm_circuit_open_exception_handler,
+    llm_deadline_exceeded_exception_handler,
 )
 from .middleware import setup_middleware
 from .error_schemas import ValidationErrorDetail, ValidationErrorResponse
 from .options import configure_cors
+from .sse import SSE_HEADERS, format_sse, stream_events_as_sse
+from .disconnect import run_until_disconnected
 
 __all__ = [
     "validation_exception_handler",
@@ -17,8 +21,14 @@ __all__ = [
     "validation_exception_handler_app",
     "database_exception_handler",
     "llm_service_exception_handler",
+    "llm_circuit_open_exception_handler",
+    "llm_deadline_exceeded_exception_handler",
     "setup_middleware",
     "ValidationErrorDetail",
     "ValidationErrorResponse",
     "configure_cors",
+    "SSE_HEADERS",
+    "format_sse",
+    "stream_events_as_sse",
+    "run_until_disconnected",
 ]
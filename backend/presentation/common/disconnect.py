@@ -0,0 +1,37 @@
+import asyncio
+from contextlib import suppress
+from typing import Awaitable, Optional, TypeVar
+
+from fastapi import HTTPException, Request
+
+from application.services.request_deadline import RequestDeadline
+
+CLIENT_CLOSED_REQUEST_STATUS_CODE = 499
+
+T = TypeVar("T")
+
+
+async def run_until_disconnected(request: Request, work: Awaitable[T], deadline_seconds: Optional[float] = None) -> T:
+    with RequestDeadline.scope(deadline_seconds):
+        work_task = asyncio.ensure_future(work)
+    disconnect_task = asyncio.ensure_future(_wait_for_disconnect(request))
+    
+    try:
+        await asyncio.wait({work_task, disconnect_task}, return_when=asyncio.FIRST_COMPLETED)
+    finally:
+        disconnect_task.cancel()
+        if not work_task.done():
+            work_task.cancel()
+            with suppress(BaseException):
+                await work_task
+    
+    if work_task.cancelled():
+        raise HTTPException(status_code=CLIENT_CLOSED_REQUEST_STATUS_CODE, detail="Client Closed Request")
+    return work_task.result()
+
+
+async def _wait_for_disconnect(request: Request) -> None:
+    while True:
+        message = await request.receive()
+        if message["type"] == "http.disconnect":
+            return
@@ -1,3 +1,5 @@
+import math
+
 from fastapi import Request, status
 from fastapi.responses import JSONResponse
 from fastapi.exceptions import RequestValidationError
@@ -8,6 +10,8 @@ from application.exceptions import (
     BusinessRuleException,
     ValidationException,
     LlmServiceError,
+    LlmCircuitOpenError,
+    LlmDeadlineExceededError,
 )
 from .error_schemas import ValidationErrorDetail, ValidationErrorResponse
 
@@ -63,6 +67,9 @@ async def validation_exception_handler_app(request: Request, exc: ValidationExce
 
 
 async def database_exception_handler(request: Request, exc: SQLAlchemyError) -> JSONResponse:
+    database_error_stats = getattr(request.app.state, "database_error_stats", None)
+    if database_error_stats:
+        database_error_stats.record(exc)
     return JSONResponse(
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
         content={
@@ -80,3 +87,25 @@ async def llm_service_exception_handler(request: Request, exc: LlmServiceError)
             "message": "An error occurred while generating content. Please try again later."
         }
     )
+
+
+async def llm_circuit_open_exception_handler(request: Request, exc: LlmCircuitOpenError) -> JSONResponse:
+    headers = {"Retry-After": str(math.ceil(exc.retry_after))} if exc.retry_after else None
+    return JSONResponse(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        content={
+            "error": "LLM Service Unavailable",
+            "message": "Content generation is temporarily unavailable. Please try again later."
+        },
+        headers=headers,
+    )
+
+
+async def llm_deadline_exceeded_exception_handler(request: Request, exc: LlmDeadlineExceededError) -> JSONResponse:
+    return JSONResponse(
+        status_code=status.HTTP_504_GATEWAY_TIMEOUT,
+        content={
+            "error": "LLM Deadline Exceeded",
+            "message": "Content generation took too long. Please try again."
+        }
+    )
@@ -0,0 +1,37 @@
+import json
+from typing import Any, AsyncIterator, Callable
+
+from sqlalchemy.exc import SQLAlchemyError
+
+from application.dtos import StreamEventDTO
+from application.exceptions import ApplicationException, LlmServiceError
+
+SSE_HEADERS = {
+    "Cache-Control": "no-cache",
+    "X-Accel-Buffering": "no",
+}
+
+
+def format_sse(event: str, data: Any) -> str:
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+
+async def stream_events_as_sse(
+    events: AsyncIterator[StreamEventDTO],
+    serialize: Callable[[StreamEventDTO], Any],
+) -> AsyncIterator[str]:
+    try:
+        async for event in events:
+            yield format_sse(event.event, serialize(event))
+    except LlmServiceError:
+        yield format_sse("error", {
+            "error": "LLM Service Error",
+            "message": "An error occurred while generating content. Please try again later."
+        })
+    except SQLAlchemyError:
+        yield format_sse("error", {
+            "error": "Database Error",
+            "message": "An error occurred while processing your request. Please try again later."
+        })
+    except ApplicationException as e:
+        yield format_sse("error", {"error": type(e).__name__, "message": str(e)})
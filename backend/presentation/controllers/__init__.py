@@ -2,10 +2,12 @@ from presentation.controllers.interview_controller import router as interview_ro
 from presentation.controllers.question_controller import router as question_router
 from presentation.controllers.answer_controller import router as answer_router
 from presentation.controllers.summary_controller import router as summary_router
+from presentation.controllers.metrics_controller import router as metrics_router
 
 __all__ = [
     "interview_router",
     "question_router",
     "answer_router",
     "summary_router",
+    "metrics_router",
 ]
\ No newline at end of file
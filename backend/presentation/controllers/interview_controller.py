@@ -7,15 +7,17 @@ from application.use_cases import (
     CreateInterviewUseCase,
     GetInterviewUseCase,
     DeleteInterviewUseCase,
+    GetInterviewProgressUseCase,
 )
 from application.dtos import CreateInterviewDTO
-from presentation.dtos import InterviewResponseDTO
+from presentation.dtos import InterviewResponseDTO, InterviewProgressResponseDTO
 from composition import (
     get_create_interview_use_case,
     get_interview_use_case,
     get_delete_interview_use_case,
+    get_interview_progress_use_case,
 )
-from presentation.mappers import interview_to_response_dto
+from presentation.mappers import interview_to_response_dto, interview_progress_to_response_dto
 from presentation.common import ValidationErrorResponse
 
 router = APIRouter(prefix="/interviews", tags=["interviews"])
@@ -53,6 +55,22 @@ async def get_interview(
     return interview_to_response_dto(interview)
 
 
+@router.get(
+    "/{interview_id}/progress",
+    response_model=InterviewProgressResponseDTO,
+    status_code=status.HTTP_200_OK,
+    responses={
+        404: {"description": "Interview not found"},
+    }
+)
+async def get_interview_progress(
+    interview_id: UUID,
+    use_case: GetInterviewProgressUseCase = Depends(get_interview_progress_use_case),
+):
+    progress = await use_case.execute(interview_id)
+    return interview_progress_to_response_dto(progress)
+
+
 @router.get(
     "",
     response_model=List[InterviewResponseDTO],
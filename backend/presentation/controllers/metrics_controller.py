@@ -0,0 +1,113 @@
+from typing import Any, Dict, Optional
+
+from fastapi import APIRouter, Depends, status
+
+from application.services.llm_client import LLMClient
+from application.services.question_pool import QuestionPool
+from application.services.question_prefetcher import QuestionPrefetcher
+from application.services.single_flight import SingleFlight
+from application.services.context_compactor import ContextCompactor
+from application.services.model_cascade import ModelCascade
+from infrastructure.database.error_stats import DatabaseErrorStats
+from composition import (
+    get_llm_client,
+    get_question_pool,
+    get_question_prefetcher,
+    get_single_flight,
+    get_context_compactor,
+    get_model_cascade,
+    get_database_error_stats,
+)
+
+router = APIRouter(prefix="/metrics", tags=["metrics"])
+
+
+@router.get(
+    "/llm",
+    status_code=status.HTTP_200_OK,
+    responses={
+        200: {"description": "Runtime statistics of the LLM client stack"},
+    }
+)
+async def get_llm_metrics(
+    llm_client: LLMClient = Depends(get_llm_client),
+) -> Dict[str, Any]:
+    return llm_client.stats()
+
+
+@router.get(
+    "/question-pool",
+    status_code=status.HTTP_200_OK,
+    responses={
+        200: {"description": "Opening-question pool statistics, or null when the pool is disabled"},
+    }
+)
+async def get_question_pool_metrics(
+    question_pool: Optional[QuestionPool] = Depends(get_question_pool),
+) -> Optional[Dict[str, Any]]:
+    return question_pool.stats() if question_pool else None
+
+
+@router.get(
+    "/speculative-questions",
+    status_code=status.HTTP_200_OK,
+    responses={
+        200: {"description": "Speculative next-question statistics, or null when disabled"},
+    }
+)
+async def get_speculative_question_metrics(
+    question_prefetcher: Optional[QuestionPrefetcher] = Depends(get_question_prefetcher),
+) -> Optional[Dict[str, Any]]:
+    return question_prefetcher.stats() if question_prefetcher else None
+
+
+@router.get(
+    "/single-flight",
+    status_code=status.HTTP_200_OK,
+    responses={
+        200: {"description": "Coalescing statistics for duplicate question and summary generation"},
+    }
+)
+async def get_single_flight_metrics(
+    single_flight: SingleFlight = Depends(get_single_flight),
+) -> Dict[str, Any]:
+    return single_flight.stats()
+
+
+@router.get(
+    "/question-context",
+    status_code=status.HTTP_200_OK,
+    responses={
+        200: {"description": "Question-context compaction statistics, including estimated tokens saved"},
+    }
+)
+async def get_question_context_metrics(
+    context_compactor: ContextCompactor = Depends(get_context_compactor),
+) -> Dict[str, Any]:
+    return context_compactor.stats()
+
+
+@router.get(
+    "/model-cascade",
+    status_code=status.HTTP_200_OK,
+    responses={
+        200: {"description": "Per-tier attempts, completions and hit rates, or null when the cascade is disabled"},
+    }
+)
+async def get_model_cascade_metrics(
+    model_cascade: Optional[ModelCascade] = Depends(get_model_cascade),
+) -> Optional[Dict[str, Any]]:
+    return model_cascade.stats() if model_cascade else None
+
+
+@router.get(
+    "/database",
+    status_code=status.HTTP_200_OK,
+    responses={
+        200: {"description": "Database errors seen by the API, split into lock contention and other failures"},
+    }
+)
+async def get_database_metrics(
+    database_error_stats: DatabaseErrorStats = Depends(get_database_error_stats),
+) -> Dict[str, int]:
+    return database_error_stats.stats()
@@ -1,17 +1,25 @@
 from typing import List
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Request, status
+from fastapi.responses import StreamingResponse
 
 from application.use_cases import GenerateQuestionUseCase, GetQuestionUseCase
 from application.dtos import GenerateQuestionDTO
 from presentation.dtos import QuestionResponseDTO
+from config.config import Settings
 from composition import (
+    get_settings,
     get_generate_question_use_case,
     get_question_use_case,
 )
-from presentation.mappers import question_to_response_dto
-from presentation.common import ValidationErrorResponse
+from presentation.mappers import question_to_response_dto, question_stream_event_to_payload
+from presentation.common import (
+    ValidationErrorResponse,
+    SSE_HEADERS,
+    stream_events_as_sse,
+    run_until_disconnected,
+)
 
 router = APIRouter(prefix="/questions", tags=["questions"])
 
@@ -24,16 +32,44 @@ router = APIRouter(prefix="/questions", tags=["questions"])
         404: {"description": "Interview not found"},
         400: {"description": "Business rule violation (interview completed or max questions reached)"},
         422: {"model": ValidationErrorResponse, "description": "Validation Error"},
+        504: {"description": "Question generation exceeded its deadline"},
     }
 )
 async def generate_question(
+    request: Request,
     dto: GenerateQuestionDTO,
     use_case: GenerateQuestionUseCase = Depends(get_generate_question_use_case),
+    settings: Settings = Depends(get_settings),
 ):
-    question = await use_case.execute(dto)
+    question = await run_until_disconnected(
+        request, use_case.execute(dto), settings.LLM_QUESTION_DEADLINE_SECONDS
+    )
     return question_to_response_dto(question)
 
 
+@router.post(
+    "/stream",
+    response_class=StreamingResponse,
+    status_code=status.HTTP_200_OK,
+    responses={
+        200: {"content": {"text/event-stream": {}}, "description": "Question tokens followed by the created question"},
+        404: {"description": "Interview not found"},
+        400: {"description": "Business rule violation (interview completed or max questions reached)"},
+        422: {"model": ValidationErrorResponse, "description": "Validation Error"},
+    }
+)
+async def stream_question(
+    dto: GenerateQuestionDTO,
+    use_case: GenerateQuestionUseCase = Depends(get_generate_question_use_case),
+):
+    events = await use_case.execute_stream(dto)
+    return StreamingResponse(
+        stream_events_as_sse(events, question_stream_event_to_payload),
+        media_type="text/event-stream",
+        headers=SSE_HEADERS,
+    )
+
+
 @router.get(
     "/interview/{interview_id}",
     response_model=List[QuestionResponseDTO],
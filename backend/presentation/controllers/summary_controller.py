@@ -1,14 +1,24 @@
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Request, status
+from fastapi.responses import StreamingResponse
 
-from application.use_cases import GenerateSummaryUseCase, GetSummaryUseCase
-from presentation.dtos import InterviewSummaryResponseDTO
+from application.dtos import SubmitBatchSummaryDTO
+from application.use_cases import GenerateSummaryUseCase, GetSummaryUseCase, BatchSummaryUseCase
+from presentation.dtos import InterviewSummaryResponseDTO, BatchSummaryJobResponseDTO
+from config.config import Settings
 from composition import (
+    get_settings,
     get_generate_summary_use_case,
     get_summary_use_case,
+    get_batch_summary_use_case,
 )
-from presentation.mappers import interview_summary_to_response_dto
+from presentation.mappers import (
+    interview_summary_to_response_dto,
+    batch_summary_job_to_response_dto,
+    summary_stream_event_to_payload,
+)
+from presentation.common import SSE_HEADERS, stream_events_as_sse, run_until_disconnected
 
 router = APIRouter(prefix="/summaries", tags=["summaries"])
 
@@ -20,16 +30,43 @@ router = APIRouter(prefix="/summaries", tags=["summaries"])
     responses={
         404: {"description": "Interview not found"},
         400: {"description": "Business rule violation (no answers available)"},
+        504: {"description": "Summary generation exceeded its deadline"},
     }
 )
 async def generate_summary(
+    request: Request,
     interview_id: UUID,
     use_case: GenerateSummaryUseCase = Depends(get_generate_summary_use_case),
+    settings: Settings = Depends(get_settings),
 ):
-    summary = await use_case.execute(interview_id)
+    summary = await run_until_disconnected(
+        request, use_case.execute(interview_id), settings.LLM_SUMMARY_DEADLINE_SECONDS
+    )
     return interview_summary_to_response_dto(summary)
 
 
+@router.post(
+    "/interview/{interview_id}/stream",
+    response_class=StreamingResponse,
+    status_code=status.HTTP_200_OK,
+    responses={
+        200: {"content": {"text/event-stream": {}}, "description": "Local scores, summary fields as they complete, then the created summary"},
+        404: {"description": "Interview not found"},
+        400: {"description": "Business rule violation (no answers available)"},
+    }
+)
+async def stream_summary(
+    interview_id: UUID,
+    use_case: GenerateSummaryUseCase = Depends(get_generate_summary_use_case),
+):
+    events = await use_case.execute_stream(interview_id)
+    return StreamingResponse(
+        stream_events_as_sse(events, summary_stream_event_to_payload),
+        media_type="text/event-stream",
+        headers=SSE_HEADERS,
+    )
+
+
 @router.get(
     "/interview/{interview_id}",
     response_model=InterviewSummaryResponseDTO,
@@ -44,3 +81,35 @@ async def get_summary(
 ):
     summary = await use_case.execute(interview_id)
     return interview_summary_to_response_dto(summary)
+
+
+@router.post(
+    "/batch",
+    response_model=BatchSummaryJobResponseDTO,
+    status_code=status.HTTP_202_ACCEPTED,
+    responses={
+        400: {"description": "Business rule violation (no interviews waiting for a summary)"},
+    }
+)
+async def submit_batch_summaries(
+    dto: SubmitBatchSummaryDTO,
+    use_case: BatchSummaryUseCase = Depends(get_batch_summary_use_case),
+):
+    job = await use_case.submit(dto)
+    return batch_summary_job_to_response_dto(job)
+
+
+@router.post(
+    "/batch/{batch_id}/collect",
+    response_model=BatchSummaryJobResponseDTO,
+    status_code=status.HTTP_200_OK,
+    responses={
+        200: {"description": "Batch status; once completed, its summaries are ingested and counted"},
+    }
+)
+async def collect_batch_summaries(
+    batch_id: str,
+    use_case: BatchSummaryUseCase = Depends(get_batch_summary_use_case),
+):
+    job = await use_case.collect(batch_id)
+    return batch_summary_job_to_response_dto(job)
@@ -2,10 +2,14 @@ from .interview_response_dto import InterviewResponseDTO
 from .question_response_dto import QuestionResponseDTO
 from .answer_response_dto import AnswerResponseDTO
 from .interview_summary_response_dto import InterviewSummaryResponseDTO
+from .batch_summary_job_response_dto import BatchSummaryJobResponseDTO
+from .interview_progress_response_dto import InterviewProgressResponseDTO
 
 __all__ = [
     "InterviewResponseDTO",
     "QuestionResponseDTO",
     "AnswerResponseDTO",
     "InterviewSummaryResponseDTO",
+    "BatchSummaryJobResponseDTO",
+    "InterviewProgressResponseDTO",
 ]
@@ -1,8 +1,11 @@
 from datetime import datetime, timezone
+from typing import Optional
 from uuid import UUID
 
 from pydantic import BaseModel, field_serializer
 
+from application.analysis.scoring_constants import ScoringConstants
+
 
 class AnswerResponseDTO(BaseModel):
     answer_id: UUID
@@ -10,6 +13,11 @@ class AnswerResponseDTO(BaseModel):
     question_id: UUID
     interview_id: UUID
     created_at: datetime
+    word_count: Optional[int] = None
+    clarity_score: Optional[float] = None
+    confidence_score: Optional[float] = None
+    is_gibberish: Optional[bool] = None
+    is_manipulation: Optional[bool] = None
 
     @field_serializer('created_at')
     def serialize_datetime(self, value: datetime) -> str:
@@ -18,5 +26,11 @@ class AnswerResponseDTO(BaseModel):
         local_time = value.astimezone()
         return local_time.strftime("%Y-%m-%d %H:%M:%S")
 
+    @field_serializer('clarity_score', 'confidence_score')
+    def serialize_score(self, value: Optional[float]) -> Optional[float]:
+        if value is None:
+            return None
+        return round(value, ScoringConstants.SCORE_PRECISION)
+
     class Config:
         from_attributes = True
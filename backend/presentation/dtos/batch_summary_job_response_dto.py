@@ -0,0 +1,19 @@
+from typing import List
+from uuid import UUID
+
+from pydantic import BaseModel
+
+
+class BatchSummaryJobResponseDTO(BaseModel):
+    batch_id: str
+    status: str
+    total: int
+    completed: int
+    failed: int
+    interview_ids: List[UUID]
+    ingested: int
+    skipped: int
+    errors: int
+    
+    class Config:
+        from_attributes = True
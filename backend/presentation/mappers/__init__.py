@@ -3,6 +3,10 @@ from presentation.mappers.mappers import (
     question_to_response_dto,
     answer_to_response_dto,
     interview_summary_to_response_dto,
+    batch_summary_job_to_response_dto,
+    interview_progress_to_response_dto,
+    question_stream_event_to_payload,
+    summary_stream_event_to_payload,
 )
 
 __all__ = [
@@ -10,4 +14,8 @@ __all__ = [
     "question_to_response_dto",
     "answer_to_response_dto",
     "interview_summary_to_response_dto",
+    "batch_summary_job_to_response_dto",
+    "interview_progress_to_response_dto",
+    "question_stream_event_to_payload",
+    "summary_stream_event_to_payload",
 ]
@@ -1,5 +1,15 @@
+from typing import Any
+
 from domain.entities import Interview, Question, Answer, InterviewSummary
-from presentation.dtos import InterviewResponseDTO, QuestionResponseDTO, AnswerResponseDTO, InterviewSummaryResponseDTO
+from application.dtos import StreamEventDTO, BatchSummaryJobDTO, InterviewProgressDTO
+from presentation.dtos import (
+    InterviewResponseDTO,
+    QuestionResponseDTO,
+    AnswerResponseDTO,
+    InterviewSummaryResponseDTO,
+    BatchSummaryJobResponseDTO,
+    InterviewProgressResponseDTO,
+)
 
 
 def interview_to_response_dto(interview: Interview) -> InterviewResponseDTO:
@@ -30,6 +40,11 @@ def answer_to_response_dto(answer: Answer) -> AnswerResponseDTO:
         question_id=answer.question_id,
         interview_id=answer.interview_id,
         created_at=answer.created_at,
+        word_count=answer.word_count,
+        clarity_score=answer.clarity_score,
+        confidence_score=answer.confidence_score,
+        is_gibberish=answer.is_gibberish,
+        is_manipulation=answer.is_manipulation,
     )
 
 
@@ -51,3 +66,42 @@ def interview_summary_to_response_dto(summary: InterviewSummary) -> InterviewSum
         full_summary_text=summary.full_summary_text,
         created_at=summary.created_at,
     )
+
+
+def batch_summary_job_to_response_dto(job: BatchSummaryJobDTO) -> BatchSummaryJobResponseDTO:
+    return BatchSummaryJobResponseDTO(
+        batch_id=job.batch_id,
+        status=job.status,
+        total=job.total,
+        completed=job.completed,
+        failed=job.failed,
+        interview_ids=job.interview_ids,
+        ingested=job.ingested,
+        skipped=job.skipped,
+        errors=job.errors,
+    )
+
+
+def interview_progress_to_response_dto(progress: InterviewProgressDTO) -> InterviewProgressResponseDTO:
+    return InterviewProgressResponseDTO(
+        interview_id=progress.interview_id,
+        status=progress.status,
+        answer_count=progress.answer_count,
+        average_word_count=progress.average_word_count,
+        confidence_score=progress.confidence_score,
+        clarity_score=progress.clarity_score,
+        consistency_score=progress.consistency_score,
+        overall_usefulness=progress.overall_usefulness,
+    )
+
+
+def question_stream_event_to_payload(event: StreamEventDTO) -> Any:
+    if isinstance(event.data, Question):
+        return question_to_response_dto(event.data).model_dump(mode="json")
+    return {"text": event.data}
+
+
+def summary_stream_event_to_payload(event: StreamEventDTO) -> Any:
+    if isinstance(event.data, InterviewSummary):
+        return interview_summary_to_response_dto(event.data).model_dump(mode="json")
+    return event.data
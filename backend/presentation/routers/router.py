@@ -3,6 +3,7 @@ from presentation.controllers.interview_controller import router as interview_ro
 from presentation.controllers.question_controller import router as question_router
 from presentation.controllers.answer_controller import router as answer_router
 from presentation.controllers.summary_controller import router as summary_router
+from presentation.controllers.metrics_controller import router as metrics_router
 
 
 def register_routers(app: FastAPI) -> None:
@@ -10,3 +11,4 @@ def register_routers(app: FastAPI) -> None:
     app.include_router(question_router, prefix="/api/v1")
     app.include_router(answer_router, prefix="/api/v1")
     app.include_router(summary_router, prefix="/api/v1")
+    app.include_router(metrics_router, prefix="/api/v1")
@@ -0,0 +1,120 @@
+import random
+import re
+import string
+from typing import List
+
+import pytest
+
+from application.analysis import AnswerMetrics, GibberishDetector
+from application.analysis.scoring_constants import ScoringConstants
+from benchmarks.analysis_bench import AnalysisCorpus
+
+_GIB = ScoringConstants.GibberishDetection
+_SPACE = ScoringConstants.TextProcessing.SPACE_CHAR
+
+
+def baseline_detect_gibberish(text: str) -> bool:
+    if len(text) < _GIB.MIN_TEXT_LENGTH:
+        return False
+    
+    words = text.split(_SPACE)
+    text_lower = text.lower()
+    total_chars = len(text.replace(_SPACE, ''))
+    
+    gibberish_indicators = 0
+    
+    long_random_sequence = re.search(f'[a-z]{{{_GIB.LONG_RANDOM_SEQUENCE_LENGTH},}}', text_lower)
+    if long_random_sequence:
+        seq = long_random_sequence.group()
+        if len(set(seq)) / len(seq) < _GIB.CHAR_DIVERSITY_THRESHOLD:
+            gibberish_indicators += _GIB.LONG_RANDOM_SEQUENCE_INDICATORS
+    
+    if len(words) >= 1:
+        avg_word_length = sum(len(word) for word in words) / len(words)
+        if avg_word_length > _GIB.AVG_WORD_LENGTH_THRESHOLD and len(words) < _GIB.MAX_WORDS_FOR_AVG_CHECK:
+            gibberish_indicators += _GIB.AVG_WORD_LENGTH_INDICATORS
+        
+        very_long_words = sum(1 for word in words if len(word) > _GIB.VERY_LONG_WORD_LENGTH)
+        if very_long_words >= _GIB.VERY_LONG_WORD_COUNT:
+            gibberish_indicators += _GIB.VERY_LONG_WORD_INDICATORS
+    
+    for seq in re.findall(f'[a-z]{{{_GIB.RANDOM_SEQUENCE_LENGTH},}}', text_lower):
+        if len(set(seq)) < len(seq) * _GIB.RANDOM_SEQUENCE_DIVERSITY_THRESHOLD:
+            gibberish_indicators += 1
+    
+    if re.findall(f'(.)\\1{{{_GIB.REPEATED_CHAR_MIN_LENGTH},}}', text_lower):
+        gibberish_indicators += 1
+    
+    if total_chars > 0:
+        non_alpha_ratio = len(re.findall(ScoringConstants.RegexPatterns.NON_ALPHA_PATTERN, text)) / total_chars
+        if non_alpha_ratio > _GIB.NON_ALPHA_RATIO_THRESHOLD and len(words) < _GIB.MAX_WORDS_FOR_NON_ALPHA_CHECK:
+            gibberish_indicators += 1
+    
+    if len(words) == 1 and len(words[0]) > _GIB.SINGLE_WORD_LENGTH_THRESHOLD:
+        gibberish_indicators += _GIB.SINGLE_WORD_INDICATORS
+    
+    return gibberish_indicators >= _GIB.MIN_INDICATORS_FOR_GIBBERISH
+
+
+def _corpus_texts() -> List[str]:
+    corpus = AnalysisCorpus(60, seed=5).build()
+    return [text for items in corpus.values() for text in items if len(text) <= _GIB.MAX_ANALYZED_LENGTH]
+
+
+def _random_texts() -> List[str]:
+    rng = random.Random(0)
+    alphabets = [
+        string.ascii_lowercase,
+        string.ascii_lowercase + "    ",
+        "ab ",
+        "aaaab  ",
+        "asdfghjkl; ",
+        string.ascii_letters + string.digits + string.punctuation + " \n\t",
+        string.punctuation + string.digits + " ",
+    ]
+    lengths = [0, 1, 9, 10, 11, 19, 20, 21, 29, 30, 31, 64, 200, 1000]
+    texts = [
+        "".join(rng.choices(alphabet, k=length))
+        for alphabet in alphabets
+        for length in lengths
+        for _ in range(8)
+    ]
+    texts.extend("".join(rng.choices(alphabet, k=_GIB.MAX_ANALYZED_LENGTH)) for alphabet in alphabets)
+    return texts
+
+
+EDGE_CASES = [
+    "",
+    "short",
+    "abcdefghij",
+    "x" * 31,
+    "abcdefghijklmnopqrstuvwxyzabcdefghij",
+    "aaaaaa is here",
+    "Antidisestablishmentarianism Pneumonoultramicroscopic",
+    "!!!??? ### $$$",
+    "I used Python and SQL for the data pipeline.",
+    "word " * (_GIB.MAX_ANALYZED_LENGTH // 5),
+    ("a" * 40 + " ") * (_GIB.MAX_ANALYZED_LENGTH // 41),
+]
+
+
+@pytest.mark.parametrize("text", _corpus_texts() + EDGE_CASES)
+def test_detect_matches_baseline_on_corpus_and_edge_cases(text):
+    assert len(text) <= _GIB.MAX_ANALYZED_LENGTH
+    expected = baseline_detect_gibberish(text)
+    assert GibberishDetector.detect(text) == expected
+    assert GibberishDetector.detect(text, text.lower()) == expected
+    assert AnswerMetrics.detect_gibberish(text) == expected
+
+
+def test_detect_matches_baseline_on_random_texts_below_cap():
+    for text in _random_texts():
+        assert len(text) <= _GIB.MAX_ANALYZED_LENGTH
+        assert GibberishDetector.detect(text) == baseline_detect_gibberish(text), text
+
+
+def test_texts_above_cap_are_judged_on_their_sample():
+    text = "a" * (_GIB.MAX_ANALYZED_LENGTH * 4)
+    sample = GibberishDetector.sample(text)
+    assert len(sample) <= _GIB.MAX_ANALYZED_LENGTH
+    assert GibberishDetector.detect(text) == baseline_detect_gibberish(sample)
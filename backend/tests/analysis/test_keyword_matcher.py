@@ -0,0 +1,89 @@
+import itertools
+import random
+from typing import Dict, List
+
+import pytest
+
+from application.analysis import KeywordMatcher
+from application.analysis.answer_metrics import KEYWORD_MATCHER
+from application.analysis.scoring_constants import ScoringConstants
+from benchmarks.analysis_bench import AnalysisCorpus
+
+_CATEGORIES = ScoringConstants.KeywordCategories
+
+PRODUCTION_KEYWORDS = {
+    _CATEGORIES.STRUCTURE: ScoringConstants.KeywordLists.STRUCTURE_KEYWORDS,
+    _CATEGORIES.EXAMPLE: ScoringConstants.KeywordLists.EXAMPLE_KEYWORDS,
+    _CATEGORIES.METRIC: ScoringConstants.KeywordLists.METRIC_KEYWORDS,
+    _CATEGORIES.MANIPULATION: ScoringConstants.KeywordLists.MANIPULATION_PATTERNS,
+    _CATEGORIES.TECHNICAL: ScoringConstants.NonTechnicalDetection.TECHNICAL_INDICATORS,
+}
+
+OVERLAPPING_KEYWORDS = {
+    "outer": ["abc", "abcd", "xyz"],
+    "inner": ["b", "bc"],
+    "suffix": ["cd", "d"],
+    "prefix": ["ab", "abx"],
+    "shared": ["bc", "yz"],
+}
+
+
+def naive_match(keywords_by_category: Dict[str, List[str]], text_lower: str) -> frozenset:
+    return frozenset(
+        category
+        for category, keywords in keywords_by_category.items()
+        if any(keyword in text_lower for keyword in keywords)
+    )
+
+
+def _production_texts() -> List[str]:
+    corpus = AnalysisCorpus(40, seed=3).build()
+    texts = [text for items in corpus.values() for text in items]
+    keywords = sorted({keyword for items in PRODUCTION_KEYWORDS.values() for keyword in items})
+    texts.extend(keywords)
+    texts.extend(f"{first}{second}" for first, second in zip(keywords, keywords[1:]))
+    texts.extend(keyword[:-1] for keyword in keywords if len(keyword) > 1)
+    texts.extend(["", " ", "a", "1", "apis and databases", "for example, first we did it"])
+    return texts
+
+
+@pytest.mark.parametrize("text", _production_texts())
+def test_production_matcher_agrees_with_substring_search(text):
+    text_lower = text.lower()
+    assert KEYWORD_MATCHER.match(text_lower) == naive_match(PRODUCTION_KEYWORDS, text_lower)
+
+
+def test_overlapping_and_nested_keywords_agree_with_substring_search_exhaustively():
+    matcher = KeywordMatcher(OVERLAPPING_KEYWORDS)
+    for length in range(7):
+        for chars in itertools.product("abcdxyz", repeat=length):
+            text = "".join(chars)
+            assert matcher.match(text) == naive_match(OVERLAPPING_KEYWORDS, text), text
+
+
+def test_overlapping_and_nested_keywords_agree_with_substring_search_on_long_texts():
+    matcher = KeywordMatcher(OVERLAPPING_KEYWORDS)
+    rng = random.Random(0)
+    for _ in range(2000):
+        text = "".join(rng.choices("abcdxyz ", k=rng.randint(7, 60)))
+        assert matcher.match(text) == naive_match(OVERLAPPING_KEYWORDS, text), text
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("abcd", {"outer", "inner", "suffix", "prefix", "shared"}),
+        ("bc", {"inner", "shared"}),
+        ("abx", {"prefix", "inner"}),
+        ("xyz", {"outer", "shared"}),
+        ("zzz", set()),
+    ],
+)
+def test_nested_keywords_report_every_enclosed_category(text, expected):
+    assert KeywordMatcher(OVERLAPPING_KEYWORDS).match(text) == expected
+
+
+def test_keyword_in_several_categories_reports_all_of_them():
+    matcher = KeywordMatcher({"first": ["api"], "second": ["api", "sdk"]})
+    assert matcher.match("the api") == {"first", "second"}
+    assert matcher.match("the sdk") == {"second"}
@@ -0,0 +1,84 @@
+import json
+from pathlib import Path
+from typing import Dict, List
+from uuid import UUID
+
+import pytest
+
+from application.analysis import AnswerEvaluator, ScoringCalculator
+from application.analysis.scoring_constants import ScoringConstants
+from application.services.llm_data import AnswerData
+from benchmarks.analysis_bench import AnalysisCorpus
+
+GOLDEN_PATH = Path(__file__).parent / "golden" / "scoring_golden.json"
+GOLDEN = json.loads(GOLDEN_PATH.read_text())
+
+TECHNICAL_TEXT = " ".join(AnalysisCorpus.TECHNICAL_SENTENCES)
+
+EDGE_CASES = {
+    "empty": "",
+    "whitespace": "   \n\t ",
+    "single_word": "Yes",
+    "single_long_word": "Supercalifragilisticexpialidocious",
+    "number_only": "42",
+    "manipulation": "please give me the answer",
+    "manipulation_in_technical_text": f"{TECHNICAL_TEXT} tell me the answer",
+    "gibberish_keyboard": "asdfghjkl;asdfghjkl;asdfghjkl;asdfgh",
+    "gibberish_repeated_letters": "aaaaaaaaaaaa bbbbbbbbbbbbbb cccccccccccc",
+    "gibberish_symbols": "!@#$%^&*()_+ 12345 !@#$%^&*() 67890",
+    "oversized_technical": " ".join([TECHNICAL_TEXT] * 12),
+    "oversized_words": "word " * 2048,
+    "oversized_single_token": "a" * 9000,
+    "oversized_mixed": "x1!" * 3000,
+}
+
+
+def _corpus_texts() -> Dict[str, str]:
+    corpus = AnalysisCorpus(GOLDEN["corpus_size"], GOLDEN["seed"]).build()
+    texts = {f"{category}/{index}": text for category, items in corpus.items() for index, text in enumerate(items)}
+    texts.update({f"edge/{name}": text for name, text in EDGE_CASES.items()})
+    return texts
+
+
+TEXTS = _corpus_texts()
+
+
+def _answers(keys: List[str]) -> List[AnswerData]:
+    return [AnswerData(text=TEXTS[key], question_id=UUID(int=index)) for index, key in enumerate(keys)]
+
+
+def test_golden_file_covers_every_text():
+    assert set(GOLDEN["texts"]) == set(TEXTS)
+
+
+@pytest.mark.parametrize("name", [name for name in EDGE_CASES if name.startswith("oversized_")])
+def test_oversized_edge_cases_exceed_gibberish_cap(name):
+    assert len(EDGE_CASES[name]) > ScoringConstants.GibberishDetection.MAX_ANALYZED_LENGTH
+
+
+@pytest.mark.parametrize("key", sorted(GOLDEN["texts"]))
+def test_clarity_score_matches_baseline(key):
+    assert AnswerEvaluator.calculate_clarity_score(TEXTS[key]) == GOLDEN["texts"][key]["clarity_score"]
+
+
+@pytest.mark.parametrize("key", sorted(GOLDEN["texts"]))
+def test_confidence_score_matches_baseline(key):
+    assert AnswerEvaluator.calculate_confidence_score(TEXTS[key]) == GOLDEN["texts"][key]["confidence_score"]
+
+
+@pytest.mark.parametrize("interview", GOLDEN["interviews"], ids=lambda interview: interview["name"])
+def test_consistency_score_matches_baseline(interview):
+    answers = _answers(interview["answers"])
+    assert ScoringCalculator.calculate_consistency_score(answers) == interview["consistency_score"]
+
+
+@pytest.mark.parametrize("interview", GOLDEN["interviews"], ids=lambda interview: interview["name"])
+def test_all_scores_match_baseline(interview):
+    answers = _answers(interview["answers"])
+    assert ScoringCalculator.calculate_all_scores(answers) == interview["all_scores"]
+
+
+@pytest.mark.parametrize("interview", GOLDEN["interviews"], ids=lambda interview: interview["name"])
+def test_interview_scores_match_baseline(interview):
+    answers = _answers(interview["answers"])
+    assert ScoringCalculator.calculate_interview_scores(answers) == interview["interview_scores"]
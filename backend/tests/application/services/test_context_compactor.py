@@ -0,0 +1,31 @@
+from uuid import uuid4
+
+from application.services.context_compactor import ContextCompactor
+from application.services.llm_data import AnswerData, QuestionData
+
+
+def _compactor(max_prompt_tokens: int) -> ContextCompactor:
+    return ContextCompactor(
+        max_prompt_tokens=max_prompt_tokens,
+        recent_turns=1,
+        digest_chars=40,
+        digest_cache_size=10,
+    )
+
+
+def test_truncation_stops_at_the_last_line_break():
+    questions = [
+        QuestionData(text=f"How would you design component number {index}?", question_order=index, question_id=uuid4())
+        for index in range(5)
+    ]
+    context = _compactor(max_prompt_tokens=30).build("System design", questions, [])
+    
+    assert len(context) <= 120
+    assert context.splitlines()[-1] in {f"- {question.text}" for question in questions}
+
+
+def test_truncation_falls_back_to_whitespace_inside_a_single_line():
+    context = _compactor(max_prompt_tokens=11).build("distributed " * 20, [], [])
+    
+    assert len(context) <= 44
+    assert context == "Interview topic: distributed distributed"
@@ -0,0 +1,85 @@
+import json
+
+import pytest
+
+from application.services.json_repairer import JsonRepairer
+from application.services.response_parser import ResponseParser
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ('{"score": -1.5e3}', {"score": -1500.0}),
+        ('{"score": 2E-2, "count": 3}', {"score": 0.02, "count": 3}),
+        ('{"score": 1e+2', {"score": 100.0}),
+        ('{"score": +3, "ratio": .5}', {"score": 3, "ratio": 0.5}),
+        ('{"score": 0.8', {"score": 0.8}),
+        ('{"score": 1.', {"score": 1.0}),
+        ('{"score": 1.5e', {"score": 1.5}),
+        ('{"scores": [1, 2e-', {"scores": [1, 2]}),
+        ('{"note": "1e5 requests", "score": 0.85}', {"note": "1e5 requests", "score": 0.85}),
+        ("{'valid': True, 'score': 7e0}", {"valid": True, "score": 7.0}),
+    ],
+)
+def test_numbers_with_exponents_are_repaired_as_one_token(text, expected):
+    assert json.loads(JsonRepairer.repair(text)) == expected
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ('```json\n{"themes": ["APIs"]}\n```', {"themes": ["APIs"]}),
+        ('```\n{"themes": ["APIs"],}\n```', {"themes": ["APIs"]}),
+        ('Here is the summary:\n{"score": 0.7}\nLet me know if you need more.', {"score": 0.7}),
+        ('{"score": 0.7} {"ignored": true}', {"score": 0.7}),
+        ("{'label': 'positive', 'points': ['it's fine']}", {"label": "positive", "points": ["it's fine"]}),
+        ("{'label': 'don\\'t'}", {"label": "don't"}),
+        ('{"themes": ["a", "b",], "score": 1,}', {"themes": ["a", "b"], "score": 1}),
+        ('{"themes": ["a",,"b"]}', {"themes": ["a", "b"]}),
+        ('{"text": "the candidate said', {"text": "the candidate said"}),
+        ('{"text": "ends with a backslash \\', {"text": "ends with a backslash "}),
+        ('{"themes": ["APIs", "Caching"', {"themes": ["APIs", "Caching"]}),
+        ('{"themes": ["APIs", "Cach', {"themes": ["APIs", "Cach"]}),
+        ('{"outer": {"inner": [1, 2', {"outer": {"inner": [1, 2]}}),
+        ('{"label": "neutral"', {"label": "neutral"}),
+        ('{"a": 1 "b": 2}', {"a": 1, "b": 2}),
+        ('{"a": "x"\n "b": "y"}', {"a": "x", "b": "y"}),
+        ('{"a": [1 2 3] "b": {"c": true} "d": null}', {"a": [1, 2, 3], "b": {"c": True}, "d": None}),
+        ('{"a": "x", "b"', {"a": "x"}),
+        ('{"a": "x", "b":', {"a": "x"}),
+        ('{"a": "x", "b": ', {"a": "x"}),
+        ('{"a": "x", "bo', {"a": "x"}),
+        ('{"a": "x", "b"}', {"a": "x"}),
+        ('{"a": 1, // the score\n "b": 2}', {"a": 1, "b": 2}),
+        ('{\n  // comment line\n  "a": 1\n}', {"a": 1}),
+        ('{"a": /* inline */ 1, /* trailing', {"a": 1}),
+        ('{"url": "http://example.com/a//b"}', {"url": "http://example.com/a//b"}),
+        ('{"text": "C:\\path\\data"}', {"text": "C:\\path\\data"}),
+        ('{"text": "line\\nbreak \\"quoted\\" \\u00e9"}', {"text": 'line\nbreak "quoted" \u00e9'}),
+        ('{"text": "bad \\u12 escape"}', {"text": "bad \\u12 escape"}),
+        ('{"text": "raw\nnewline\tand tab"}', {"text": "raw\nnewline\tand tab"}),
+        ('{"quote": "he said "hi" there"}', {"quote": 'he said "hi" there'}),
+        ('{label: positive, valid: True, missing: None}', {"label": "positive", "valid": True, "missing": None}),
+    ],
+)
+def test_common_llm_defects_are_repaired(text, expected):
+    assert JsonRepairer.extract_object(text) == expected
+
+
+@pytest.mark.parametrize("text", ["", "no json here", "[1, 2, 3]"])
+def test_text_without_an_object_yields_none(text):
+    assert JsonRepairer.extract_object(text) is None
+
+
+def test_valid_json_is_left_unchanged():
+    text = '{"themes": ["a", "b"], "score": 0.5, "nested": {"ok": true, "none": null}}'
+    assert json.loads(JsonRepairer.repair(text)) == json.loads(text)
+
+
+def test_summary_parser_accepts_a_fenced_truncated_reply():
+    summary = ResponseParser.parse_summary_response(
+        '```json\n{"themes": ["APIs"], "key_points": ["x"], "sentiment_score": 0.6, "sentiment_label": "neutral",'
+        ' "full_summary_text": "Good answers", "strengths": ["clear"'
+    )
+    assert summary["themes"] == ["APIs"]
+    assert summary["strengths"] == ["clear"]
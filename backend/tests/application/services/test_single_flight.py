@@ -0,0 +1,117 @@
+import asyncio
+
+import pytest
+
+from application.dtos import StreamEventDTO
+from application.exceptions import LlmServiceError
+from application.services.single_flight import SingleFlight
+
+
+def _run(coroutine):
+    return asyncio.run(coroutine)
+
+
+def test_follower_gets_result_when_leader_is_cancelled():
+    async def scenario():
+        flight = SingleFlight()
+        release = asyncio.Event()
+        calls = 0
+        
+        async def work():
+            nonlocal calls
+            calls += 1
+            await release.wait()
+            return "question"
+        
+        leader = asyncio.ensure_future(flight.do("key", work))
+        await asyncio.sleep(0)
+        follower = asyncio.ensure_future(flight.do("key", work))
+        await asyncio.sleep(0)
+        leader.cancel()
+        await asyncio.sleep(0)
+        release.set()
+        
+        assert await follower == "question"
+        assert leader.cancelled()
+        assert calls == 1
+        assert flight.stats() == {"in_flight": 0, "leaders": 1, "coalesced": 1}
+    
+    _run(scenario())
+
+
+def test_work_is_cancelled_once_every_waiter_has_left():
+    async def scenario():
+        flight = SingleFlight()
+        cancelled = asyncio.Event()
+        
+        async def work():
+            try:
+                await asyncio.sleep(60)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+        
+        waiters = [asyncio.ensure_future(flight.do("key", work)) for _ in range(3)]
+        await asyncio.sleep(0)
+        for waiter in waiters:
+            waiter.cancel()
+        await asyncio.wait_for(cancelled.wait(), 1)
+        
+        assert flight.stats()["in_flight"] == 0
+    
+    _run(scenario())
+
+
+def test_errors_reach_every_waiter():
+    async def scenario():
+        flight = SingleFlight()
+        
+        async def work():
+            await asyncio.sleep(0)
+            raise LlmServiceError("boom")
+        
+        results = await asyncio.gather(flight.do("key", work), flight.do("key", work), return_exceptions=True)
+        
+        assert [str(result) for result in results] == ["boom", "boom"]
+    
+    _run(scenario())
+
+
+def test_stream_follower_gets_result_after_leader_disconnects():
+    async def scenario():
+        flight = SingleFlight()
+        release = asyncio.Event()
+        
+        async def events():
+            yield StreamEventDTO(event="token", data="Why")
+            await release.wait()
+            yield StreamEventDTO(event="question", data="Why?")
+        
+        leader = flight.stream("key", events, "question")
+        assert (await leader.__anext__()).data == "Why"
+        follower = asyncio.ensure_future(_collect(flight.stream("key", events, "question")))
+        await asyncio.sleep(0)
+        await leader.aclose()
+        release.set()
+        
+        assert [(event.event, event.data) for event in await follower] == [("question", "Why?")]
+        assert flight.stats()["in_flight"] == 0
+    
+    _run(scenario())
+
+
+def test_stream_without_result_fails_for_leader():
+    async def scenario():
+        flight = SingleFlight()
+        
+        async def events():
+            yield StreamEventDTO(event="token", data="Why")
+        
+        with pytest.raises(LlmServiceError):
+            await _collect(flight.stream("key", events, "question"))
+    
+    _run(scenario())
+
+
+async def _collect(stream):
+    return [event async for event in stream]
@@ -0,0 +1,4 @@
+import os
+
+os.environ.setdefault("LLM_API_KEY", "test-key")
+os.environ.setdefault("LLM_MODEL", "test-model")
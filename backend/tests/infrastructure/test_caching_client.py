@@ -0,0 +1,96 @@
+import asyncio
+from typing import Optional
+
+from application.services.llm_client import LLMClient, LLMPrompt
+from application.services.llm_data import GenerationProfile
+from config.config import settings
+from infrastructure.llm.caching_client import CachingLLMClient
+from infrastructure.llm.response_cache import LLMResponseCache
+from infrastructure.llm.routing_client import RoutedBackend, RoutingLLMClient
+
+
+class ModelClient(LLMClient):
+    
+    def __init__(self, model: str):
+        self.model = model
+        self.calls = 0
+    
+    async def call(
+        self,
+        prompt: LLMPrompt,
+        operation: Optional[str] = None,
+        profile: Optional[GenerationProfile] = None,
+    ) -> str:
+        self.calls += 1
+        return f"{self.resolve_model(profile)}:{self.calls}"
+    
+    def resolve_model(self, profile: Optional[GenerationProfile] = None) -> Optional[str]:
+        if profile and profile.model:
+            return profile.model
+        return self.model
+
+
+def _caching(inner: LLMClient) -> CachingLLMClient:
+    cache = LLMResponseCache(max_entries=100, ttl_seconds=60)
+    return CachingLLMClient(inner, cache, settings, ["question"])
+
+
+def test_cache_key_uses_the_resolved_profile_model():
+    inner = ModelClient("llama-3-70b")
+    client = _caching(inner)
+    
+    async def scenario():
+        first = await client.call("prompt", "question", GenerationProfile(model="gpt-4o-mini"))
+        second = await client.call("prompt", "question", GenerationProfile(model="gpt-4o"))
+        repeated = await client.call("prompt", "question", GenerationProfile(model="gpt-4o-mini"))
+        return first, second, repeated
+    
+    first, second, repeated = asyncio.run(scenario())
+    
+    assert first == "gpt-4o-mini:1"
+    assert second == "gpt-4o:2"
+    assert repeated == first
+    assert inner.calls == 2
+
+
+def test_routed_backends_serving_different_models_do_not_share_entries():
+    local = ModelClient("llama-3-70b")
+    hosted = ModelClient("gpt-4o-mini")
+    router = RoutingLLMClient(
+        [RoutedBackend("local", local), RoutedBackend("hosted", hosted)],
+        exploration_ratio=0.0,
+    )
+    client = _caching(router)
+    
+    async def scenario():
+        await client.call("prompt", "question")
+        await client.call("prompt", "question")
+    
+    asyncio.run(scenario())
+    
+    assert local.calls + hosted.calls == 2
+    assert client.stats()["cache"]["bypassed"] == 2
+
+
+def test_routed_backends_resolving_the_same_model_share_entries():
+    local = ModelClient("llama-3-70b")
+    hosted = ModelClient("gpt-4o-mini")
+    router = RoutingLLMClient(
+        [
+            RoutedBackend("local", local, models=["llama-3-70b", "gpt-4o-mini"]),
+            RoutedBackend("hosted", hosted, models=["gpt-4o-mini"]),
+        ],
+        exploration_ratio=0.0,
+    )
+    client = _caching(router)
+    profile = GenerationProfile(model="gpt-4o-mini")
+    
+    async def scenario():
+        first = await client.call("prompt", "question", profile)
+        second = await client.call("prompt", "question", profile)
+        return first, second
+    
+    first, second = asyncio.run(scenario())
+    
+    assert first == second
+    assert local.calls + hosted.calls == 1
@@ -0,0 +1,97 @@
+import asyncio
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from application.analysis import AnswerEvaluator, InterviewStatistics
+from domain.entities import Answer, Interview, Question
+from infrastructure.database.database import Base
+from infrastructure.repositories.answer_repository import SqlAnswerRepository
+from infrastructure.repositories.interview_repository import SqlInterviewRepository
+from infrastructure.repositories.question_repository import SqlQuestionRepository
+
+
+async def _session_factory(tmp_path) -> async_sessionmaker:
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'interviews.db'}")
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.create_all)
+    return async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+
+async def _create_interview(sessions: async_sessionmaker) -> Question:
+    async with sessions() as session:
+        interview = await SqlInterviewRepository(session).create(Interview(topic="Databases"))
+        return await SqlQuestionRepository(session).create(
+            Question(text="How do you index a table?", interview_id=interview.interview_id)
+        )
+
+
+async def _submit_answer(sessions: async_sessionmaker, question: Question, text: str) -> None:
+    async with sessions() as session:
+        interview = await SqlInterviewRepository(session).get_by_id(question.interview_id)
+        answer_repository = SqlAnswerRepository(session)
+        existing_answers = await answer_repository.get_by_interview_id(question.interview_id)
+        interview.start()
+        interview.touch()
+        evaluation = AnswerEvaluator.evaluate_text(text)
+        answer = Answer(
+            text=text,
+            question_id=question.question_id,
+            interview_id=question.interview_id,
+            word_count=evaluation.word_count,
+            clarity_score=evaluation.clarity_score,
+            confidence_score=evaluation.confidence_score,
+            is_gibberish=evaluation.is_gibberish,
+            is_manipulation=evaluation.is_manipulation,
+        )
+        reset_statistics = not interview.has_answer_statistics or interview.answer_count != len(existing_answers)
+        if reset_statistics:
+            InterviewStatistics.rebuild(interview, existing_answers)
+        await answer_repository.create_for_interview(answer, interview, reset_statistics)
+
+
+async def _answer_count(sessions: async_sessionmaker, interview_id: UUID) -> int:
+    async with sessions() as session:
+        return (await SqlInterviewRepository(session).get_by_id(interview_id)).answer_count
+
+
+def test_summary_save_does_not_roll_back_answers_counted_meanwhile(tmp_path):
+    async def scenario():
+        sessions = await _session_factory(tmp_path)
+        question = await _create_interview(sessions)
+        await _submit_answer(sessions, question, "I added a composite index for the report query.")
+        
+        async with sessions() as summary_session:
+            interview_repository = SqlInterviewRepository(summary_session)
+            stale_interview = await interview_repository.get_by_id(question.interview_id)
+            assert stale_interview.answer_count == 1
+            
+            await _submit_answer(sessions, question, "For example, the query went from 2s to 40ms.")
+            assert await _answer_count(sessions, question.interview_id) == 2
+            
+            stale_interview.complete()
+            await interview_repository.update(stale_interview)
+        
+        assert await _answer_count(sessions, question.interview_id) == 2
+    
+    asyncio.run(scenario())
+
+
+def test_rebuilt_statistics_are_not_written_over_newer_answers(tmp_path):
+    async def scenario():
+        sessions = await _session_factory(tmp_path)
+        question = await _create_interview(sessions)
+        await _submit_answer(sessions, question, "I added a composite index for the report query.")
+        
+        async with sessions() as progress_session:
+            stale_interview = await SqlInterviewRepository(progress_session).get_by_id(question.interview_id)
+            answers = await SqlAnswerRepository(progress_session).get_by_interview_id(question.interview_id)
+            InterviewStatistics.rebuild(stale_interview, answers)
+            
+            await _submit_answer(sessions, question, "For example, the query went from 2s to 40ms.")
+            
+            assert not await SqlInterviewRepository(progress_session).replace_answer_statistics(stale_interview)
+        
+        assert await _answer_count(sessions, question.interview_id) == 2
+    
+    asyncio.run(scenario())
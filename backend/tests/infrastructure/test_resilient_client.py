@@ -0,0 +1,62 @@
+import asyncio
+from typing import List, Optional, Union
+
+import pytest
+
+from application.exceptions import LlmServiceError
+from application.services.llm_client import LLMClient, LLMPrompt
+from application.services.llm_data import GenerationProfile
+from infrastructure.llm.resilient_client import ResilientLLMClient
+
+
+class ScriptedClient(LLMClient):
+    
+    def __init__(self, outcomes: List[Union[BaseException, str]]):
+        self.outcomes = outcomes
+        self.calls = 0
+    
+    async def call(
+        self,
+        prompt: LLMPrompt,
+        operation: Optional[str] = None,
+        profile: Optional[GenerationProfile] = None,
+    ) -> str:
+        outcome = self.outcomes[self.calls]
+        self.calls += 1
+        await asyncio.sleep(0.05)
+        if isinstance(outcome, BaseException):
+            raise outcome
+        return outcome
+
+
+def _hedging(inner: LLMClient) -> ResilientLLMClient:
+    return ResilientLLMClient(
+        inner,
+        hedging_enabled=True,
+        hedge_initial_delay_seconds=0.01,
+        hedge_min_delay_seconds=0.01,
+    )
+
+
+def test_hedge_result_is_returned_when_primary_was_cancelled():
+    inner = ScriptedClient([asyncio.CancelledError(), "hedged"])
+    client = _hedging(inner)
+    
+    assert asyncio.run(client.call("prompt", "question")) == "hedged"
+    assert client.hedge_wins == 1
+
+
+def test_hedge_error_is_raised_when_primary_was_cancelled():
+    inner = ScriptedClient([asyncio.CancelledError(), LlmServiceError("hedge failed")])
+    client = _hedging(inner)
+    
+    with pytest.raises(LlmServiceError, match="hedge failed"):
+        asyncio.run(client.call("prompt", "question"))
+
+
+def test_primary_error_is_raised_when_both_attempts_fail():
+    inner = ScriptedClient([LlmServiceError("primary failed"), LlmServiceError("hedge failed")])
+    client = _hedging(inner)
+    
+    with pytest.raises(LlmServiceError, match="primary failed"):
+        asyncio.run(client.call("prompt", "question"))
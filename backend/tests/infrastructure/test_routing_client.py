@@ -0,0 +1,100 @@
+import asyncio
+import logging
+from typing import List, Optional
+
+import httpx
+
+from application.services.llm_client import LLMClient, LLMPrompt
+from application.services.llm_data import GenerationProfile
+from composition import build_llm_client, build_model_cascade
+from config.config import settings
+from infrastructure.llm import RateLimitedLLMClient
+from infrastructure.llm.routing_client import RoutedBackend, RoutingLLMClient
+
+
+class RecordingClient(LLMClient):
+    
+    def __init__(self):
+        self.profiles: List[Optional[GenerationProfile]] = []
+    
+    async def call(
+        self,
+        prompt: LLMPrompt,
+        operation: Optional[str] = None,
+        profile: Optional[GenerationProfile] = None,
+    ) -> str:
+        self.profiles.append(profile)
+        return "ok"
+
+
+def _route(backend: RoutedBackend, profile: GenerationProfile) -> Optional[GenerationProfile]:
+    router = RoutingLLMClient([backend], exploration_ratio=0.0)
+    asyncio.run(router.call("prompt", "question", profile))
+    return backend.client.profiles[-1]
+
+
+def test_backend_keeps_its_own_model_when_profile_names_another_provider_model():
+    backend = RoutedBackend("local", RecordingClient(), models=["llama-3-70b"])
+    profile = GenerationProfile(model="gpt-4o-mini", temperature=0.2, max_tokens=100, json_mode=True)
+    
+    assert _route(backend, profile) == GenerationProfile(temperature=0.2, max_tokens=100, json_mode=True)
+
+
+def test_backend_uses_profile_model_it_offers():
+    backend = RoutedBackend("openai", RecordingClient(), models=["gpt-4o", "gpt-4o-mini"])
+    profile = GenerationProfile(model="gpt-4o-mini", max_tokens=100)
+    
+    assert _route(backend, profile) is profile
+
+
+def test_profile_without_model_is_passed_through():
+    backend = RoutedBackend("openai", RecordingClient(), models=["gpt-4o"])
+    profile = GenerationProfile(temperature=0.0)
+    
+    assert _route(backend, profile) is profile
+
+
+def test_each_provider_gets_its_own_rate_limiter_below_the_router():
+    routed_settings = settings.model_copy(update={
+        "LLM_PROVIDERS": [{"name": "a", "base_url": "http://a"}, {"name": "b", "base_url": "http://b"}],
+        "LLM_RATE_LIMIT_ENABLED": True,
+        "LLM_CACHE_ENABLED": False,
+    })
+    
+    async def build() -> LLMClient:
+        async with httpx.AsyncClient() as http_client:
+            return build_llm_client(routed_settings, http_client)
+    
+    llm_client = asyncio.run(build())
+    
+    while not isinstance(llm_client, RoutingLLMClient):
+        assert not isinstance(llm_client, RateLimitedLLMClient)
+        llm_client = llm_client.inner
+    limiters = [backend.client.limiter for backend in llm_client.backends]
+    assert all(isinstance(backend.client, RateLimitedLLMClient) for backend in llm_client.backends)
+    assert limiters[0] is not limiters[1]
+
+
+def test_cascade_tier_models_missing_from_routed_providers_are_reported(caplog):
+    cascade_settings = settings.model_copy(update={
+        "LLM_CASCADE_ENABLED": True,
+        "LLM_CASCADE_TIERS": {"question": [{"name": "fast", "model": "small"}, {"name": "strong", "model": None}]},
+        "LLM_PROVIDERS": [{"name": "a", "model": "large"}, {"name": "b", "model": "large", "models": ["small"]}],
+    })
+    
+    with caplog.at_level(logging.WARNING, logger="composition"):
+        build_model_cascade(cascade_settings)
+    
+    assert [record.getMessage() for record in caplog.records] == [
+        "Cascade tier question/fast asks for model small, which routed providers a do not offer; "
+        "they will serve the tier with their own model"
+    ]
+
+
+def test_cascade_without_routing_is_not_reported(caplog):
+    cascade_settings = settings.model_copy(update={"LLM_CASCADE_ENABLED": True, "LLM_PROVIDERS": []})
+    
+    with caplog.at_level(logging.WARNING, logger="composition"):
+        assert build_model_cascade(cascade_settings) is not None
+    
+    assert not caplog.records